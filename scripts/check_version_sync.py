@@ -5,6 +5,9 @@ import re
 import sys
 from pathlib import Path
 
+PYPROJECT_VERSION_RE = re.compile(r'^\s*version\s*=\s*"([^"]+)"', re.MULTILINE)
+INIT_VERSION_RE = re.compile(r'__version__\s*=\s*"([^"]+)"')
+
 
 def get_version_from_pyproject():
     """Extract version from pyproject.toml."""
@@ -16,8 +19,8 @@ def get_version_from_pyproject():
     with open(pyproject_path) as f:
         content = f.read()
 
-    # Look for version = "x.y.z" pattern
-    match = re.search(r'version\s*=\s*"([^"]+)"', content)
+    # Look for a version = "x.y.z" line
+    match = PYPROJECT_VERSION_RE.search(content)
     if match:
         return match.group(1)
 
@@ -36,7 +39,7 @@ def get_version_from_init():
         content = f.read()
 
     # Look for __version__ = "x.y.z" pattern
-    match = re.search(r'__version__\s*=\s*"([^"]+)"', content)
+    match = INIT_VERSION_RE.search(content)
     if match:
         return match.group(1)
 
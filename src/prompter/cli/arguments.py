@@ -67,6 +67,12 @@ Examples:
         help="Path to the state file (default: .prompter_state.json)",
     )
 
+    parser.add_argument(
+        "--durable-state",
+        action="store_true",
+        help="Fsync the state file on every save so it survives a power loss (slower)",
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -5,8 +5,6 @@ import json
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from claude_code_sdk import ClaudeCodeOptions, query
-
 
 @dataclass
 class AnalysisResult:
@@ -51,6 +49,9 @@ class ProjectAnalyzer:
         """Perform comprehensive project analysis."""
         import logging
 
+        # The SDK is slow to import, so only load it once analysis starts
+        from claude_code_sdk import ClaudeCodeOptions, query
+
         logger = logging.getLogger(__name__)
 
         logger.debug(f"Starting analysis for project at: {self.project_path}")
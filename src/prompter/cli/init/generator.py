@@ -1,6 +1,7 @@
 """Main configuration generator orchestration."""
 
 import anyio
+import functools
 import importlib.util
 import os
 import sys
@@ -16,6 +17,15 @@ from .analyzer import AnalysisResult, ProjectAnalyzer
 from .interactive import InteractiveConfigurator
 
 
+@functools.cache
+def _claude_sdk_available() -> bool:
+    """Check once per process whether the Claude SDK can be imported."""
+    try:
+        return importlib.util.find_spec("claude_code_sdk") is not None
+    except (ImportError, ValueError):
+        return False
+
+
 class ConfigGenerator:
     """Orchestrates the entire configuration generation process."""
 
@@ -29,7 +39,7 @@ class ConfigGenerator:
         self.console.print_header("🚀 Prompter Configuration Generator")
 
         # Check if file exists
-        if Path(self.filename).exists() and not self._confirm_overwrite():
+        if self._file_exists() and not self._confirm_overwrite():
             self.console.print_info("Configuration generation cancelled.")
             return
 
@@ -72,10 +82,11 @@ class ConfigGenerator:
 
     def _check_claude_sdk_available(self) -> bool:
         """Check if Claude SDK is available."""
-        try:
-            return importlib.util.find_spec("claude_code_sdk") is not None
-        except (ImportError, ValueError):
-            return False
+        return _claude_sdk_available()
+
+    def _file_exists(self) -> bool:
+        """Check whether the output file already exists."""
+        return Path(self.filename).exists()
 
     def _confirm_overwrite(self) -> bool:
         """Confirm overwriting existing file."""
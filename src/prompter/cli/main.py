@@ -4,23 +4,23 @@ import os
 import sys
 import tomllib
 from pathlib import Path
-from typing import Any
-
-import anyio
+from typing import TYPE_CHECKING, Any
 
 from prompter.config import PrompterConfig
 from prompter.constants import MAX_TASK_ITERATIONS
-from prompter.logging import get_logger, setup_logging
-from prompter.parallel_coordinator import ParallelTaskCoordinator
-from prompter.progress_display import ProgressDisplay, ProgressDisplayMode
-from prompter.runner import TaskRunner
-from prompter.state import StateManager
+from prompter.logging import get_logger, setup_logging, setup_minimal_logging
 
 from .arguments import create_parser
 from .status import print_status
 
+if TYPE_CHECKING:
+    # Heavy modules (anyio, rich, the Claude SDK) are imported where they are
+    # used so that --help, --status, --clear-state and --init start quickly.
+    from prompter.runner import TaskRunner
+    from prompter.state import StateManager
+
 
-def handle_status_command(state_manager: StateManager, verbose: bool) -> int:
+def handle_status_command(state_manager: "StateManager", verbose: bool) -> int:
     """Handle the status command."""
     logger = get_logger("cli")
     logger.debug("Handling status command")
@@ -28,7 +28,7 @@ def handle_status_command(state_manager: StateManager, verbose: bool) -> int:
     return 0
 
 
-def handle_clear_state_command(state_manager: StateManager) -> int:
+def handle_clear_state_command(state_manager: "StateManager") -> int:
     """Handle the clear-state command."""
     logger = get_logger("cli")
     logger.debug("Handling clear-state command")
@@ -40,7 +40,7 @@ def handle_clear_state_command(state_manager: StateManager) -> int:
 def handle_init_command(init_path: str) -> int:
     """Handle the init command."""
     logger = get_logger("cli")
-    logger.debug(f"Handling init command: generating AI-powered config at {init_path}")
+    logger.debug("Handling init command: generating AI-powered config at %s", init_path)
     from .init.generator import ConfigGenerator
 
     generator = ConfigGenerator(init_path)
@@ -55,10 +55,10 @@ def load_and_validate_config(config_path: Path) -> PrompterConfig | None:
         PrompterConfig if successful, None if there are errors.
     """
     logger = get_logger("cli")
-    logger.debug(f"Loading configuration from {config_path}")
+    logger.debug("Loading configuration from %s", config_path)
 
     if not config_path.exists():
-        logger.error(f"Configuration file not found: {config_path}")
+        logger.error("Configuration file not found: %s", config_path)
         print(f"Error: Configuration file not found: {config_path}", file=sys.stderr)
         return None
 
@@ -66,7 +66,7 @@ def load_and_validate_config(config_path: Path) -> PrompterConfig | None:
     config = PrompterConfig(config_path)
     errors = config.validate()
     if errors:
-        logger.error(f"Configuration validation failed with {len(errors)} errors")
+        logger.error("Configuration validation failed with %s errors", len(errors))
         print("Configuration errors:", file=sys.stderr)
         for error in errors:
             print(f"  - {error}", file=sys.stderr)
@@ -86,16 +86,16 @@ def determine_tasks_to_run(
     logger = get_logger("cli")
 
     if task_name:
-        logger.debug(f"Running specific task: {task_name}")
+        logger.debug("Running specific task: %s", task_name)
         task = config.get_task_by_name(task_name)
         if not task:
-            logger.error(f"Task '{task_name}' not found in configuration")
+            logger.error("Task '%s' not found in configuration", task_name)
             print(
                 f"Error: Task '{task_name}' not found in configuration", file=sys.stderr
             )
             return None
         return [task]
-    logger.debug(f"Running all {len(config.tasks)} tasks")
+    logger.debug("Running all %s tasks", len(config.tasks))
     return config.tasks
 
 
@@ -104,20 +104,28 @@ def main() -> int:
     parser = create_parser()
     args = parser.parse_args()
 
-    # Set up logging
-    setup_logging(
-        level="DEBUG" if args.verbose or args.debug else "INFO",
-        log_file=args.log_file,
-        verbose=args.verbose,
-        debug=args.debug,
-    )
+    # Set up logging. --status and --clear-state do not log unless asked to,
+    # so skip building handlers and formatters for them.
+    if (args.status or args.clear_state) and not (
+        args.verbose or args.debug or args.log_file
+    ):
+        setup_minimal_logging()
+    else:
+        setup_logging(
+            level="DEBUG" if args.verbose or args.debug else "INFO",
+            log_file=args.log_file,
+            verbose=args.verbose,
+            debug=args.debug,
+        )
 
     logger = get_logger("cli")
-    logger.debug(f"Starting prompter with arguments: {vars(args)}")
+    logger.debug("Starting prompter with arguments: %s", args)
 
     # Initialize state manager
-    logger.debug(f"Initializing state manager with file: {args.state_file}")
-    state_manager = StateManager(args.state_file)
+    from prompter.state import StateManager
+
+    logger.debug("Initializing state manager with file: %s", args.state_file)
+    state_manager = StateManager(args.state_file, durable=args.durable_state)
 
     # Handle special commands
     if args.status:
@@ -144,7 +152,9 @@ def main() -> int:
             return 1
 
         # Initialize task runner
-        logger.debug(f"Initializing task runner (dry_run={args.dry_run})")
+        from prompter.runner import TaskRunner
+
+        logger.debug("Initializing task runner (dry_run=%s)", args.dry_run)
         runner = TaskRunner(config, dry_run=args.dry_run)
 
         # Determine which tasks to run
@@ -171,9 +181,9 @@ def main() -> int:
 
 def execute_tasks(
     config: PrompterConfig,
-    runner: TaskRunner,
+    runner: "TaskRunner",
     tasks_to_run: list,
-    state_manager: StateManager,
+    state_manager: "StateManager",
     args: Any,
 ) -> int:
     """Execute tasks with support for task jumping and parallel execution.
@@ -203,13 +213,18 @@ def execute_tasks(
     logger.info("Using sequential execution")
     if config.has_dependencies():
         print("\nNote: Dependencies defined but parallel execution is disabled")
-    return execute_tasks_sequential(config, runner, tasks_to_run, state_manager, args)
+    # Coalesce state writes that change no task's status; transitions are
+    # still written straight away
+    with state_manager:
+        return execute_tasks_sequential(
+            config, runner, tasks_to_run, state_manager, args
+        )
 
 
 def execute_tasks_parallel(
     config: PrompterConfig,
-    runner: TaskRunner,
-    state_manager: StateManager,
+    runner: "TaskRunner",
+    state_manager: "StateManager",
     args: Any,
 ) -> int:
     """Execute tasks in parallel respecting dependencies.
@@ -217,6 +232,11 @@ def execute_tasks_parallel(
     Returns:
         0 if all tasks succeeded, 1 if any failed.
     """
+    import anyio
+
+    from prompter.parallel_coordinator import ParallelTaskCoordinator
+    from prompter.progress_display import ProgressDisplay, ProgressDisplayMode
+
     logger = get_logger("cli")
 
     # Determine progress display mode
@@ -263,7 +283,7 @@ def execute_tasks_parallel(
 
         if failed_count > 0:
             logger.info(
-                f"Parallel execution completed with {failed_count} failed tasks"
+                "Parallel execution completed with %s failed tasks", failed_count
             )
             return 1
         logger.info("All tasks completed successfully")
@@ -277,9 +297,9 @@ def execute_tasks_parallel(
 
 def execute_tasks_sequential(
     config: PrompterConfig,
-    runner: TaskRunner,
+    runner: "TaskRunner",
     tasks_to_run: list,
-    state_manager: StateManager,
+    state_manager: "StateManager",
     args: Any,
 ) -> int:
     """Execute tasks sequentially with support for task jumping (original implementation).
@@ -302,6 +322,11 @@ def execute_tasks_sequential(
     current_task_idx = 0
     tasks_list = tasks_to_run
 
+    # Position of each task in tasks_list, kept in sync when jumping appends tasks
+    task_indices: dict[str, int] = {}
+    for idx, queued_task in enumerate(tasks_list):
+        task_indices.setdefault(queued_task.name, idx)
+
     # Get max iterations from environment variable or use default
     max_iterations = int(
         os.environ.get("PROMPTER_MAX_ITERATIONS", str(MAX_TASK_ITERATIONS))
@@ -312,7 +337,8 @@ def execute_tasks_sequential(
         iteration_count += 1
         if iteration_count > max_iterations:
             logger.error(
-                f"Maximum iteration limit ({max_iterations}) reached. Stopping to prevent runaway loop."
+                "Maximum iteration limit (%s) reached. Stopping to prevent runaway loop.",
+                max_iterations,
             )
             print(
                 f"\nError: Maximum iteration limit ({max_iterations}) reached. Stopping execution."
@@ -324,12 +350,12 @@ def execute_tasks_sequential(
         # Check for infinite loop (unless explicitly allowed)
         if task.name in executed_tasks and not config.allow_infinite_loops:
             logger.warning(
-                f"Task '{task.name}' has already been executed, skipping to avoid loop"
+                "Task '%s' has already been executed, skipping to avoid loop", task.name
             )
             current_task_idx += 1
             continue
 
-        logger.debug(f"Processing task: {task.name}")
+        logger.debug("Processing task: %s", task.name)
         print(f"\nExecuting task: {task.name}")
         if args.verbose:
             print(f"  Prompt: {task.prompt}")
@@ -350,7 +376,7 @@ def execute_tasks_sequential(
             if resumed_id:
                 print(f"  Claude session (resumed): {resumed_id}")
         else:
-            logger.debug(f"No session ID found in result for task {task.name}")
+            logger.debug("No session ID found in result for task %s", task.name)
 
         # Handle the task result and determine next action
         current_task_idx = handle_task_result(
@@ -361,6 +387,7 @@ def execute_tasks_sequential(
             current_task_idx,
             executed_tasks,
             args.verbose,
+            task_indices=task_indices,
         )
 
         if current_task_idx == -1:  # Signal to stop execution
@@ -372,12 +399,12 @@ def execute_tasks_sequential(
 
     # Return appropriate exit code
     failed_tasks = state_manager.get_failed_tasks()
-    logger.debug(f"Execution complete: {len(failed_tasks)} failed tasks")
+    logger.debug("Execution complete: %s failed tasks", len(failed_tasks))
     return 1 if failed_tasks else 0
 
 
 def execute_single_task(
-    runner: TaskRunner, task: Any, state_manager: StateManager
+    runner: "TaskRunner", task: Any, state_manager: "StateManager"
 ) -> Any:
     """Execute a single task and update state.
 
@@ -387,15 +414,15 @@ def execute_single_task(
     logger = get_logger("cli")
 
     # Mark task as running
-    logger.debug(f"Marking task {task.name} as running")
+    logger.debug("Marking task %s as running", task.name)
     state_manager.mark_task_running(task.name)
 
     # Execute the task
-    logger.debug(f"Executing task {task.name}")
+    logger.debug("Executing task %s", task.name)
     result = runner.run_task(task, state_manager)
 
     # Update state
-    logger.debug(f"Updating state for task {task.name}: success={result.success}")
+    logger.debug("Updating state for task %s: success=%s", task.name, result.success)
     state_manager.update_task_state(result)
 
     return result
@@ -409,6 +436,8 @@ def handle_task_result(
     current_task_idx: int,
     executed_tasks: set,
     verbose: bool,
+    *,
+    task_indices: dict[str, int] | None = None,
 ) -> int:
     """Handle the result of a task execution and determine next action.
 
@@ -430,6 +459,7 @@ def handle_task_result(
             current_task_idx,
             executed_tasks,
             True,
+            task_indices=task_indices,
         )
     print(f"  ✗ Task failed (attempts: {result.attempts})")
     print(f"  Error: {result.error}")
@@ -444,6 +474,7 @@ def handle_task_result(
         current_task_idx,
         executed_tasks,
         False,
+        task_indices=task_indices,
     )
 
 
@@ -455,9 +486,14 @@ def handle_next_action(
     current_task_idx: int,
     executed_tasks: set,
     success: bool,
+    *,
+    task_indices: dict[str, int] | None = None,
 ) -> int:
     """Handle the next action after task completion.
 
+    ``task_indices`` maps task names to their position in ``tasks_list``; pass
+    the same dict on every call to avoid rescanning the list on each jump.
+
     Returns:
         Next task index, or -1 to signal stopping execution.
     """
@@ -465,7 +501,10 @@ def handle_next_action(
 
     if next_action == "stop":
         logger.debug(
-            f"Task {task_name} {'succeeded' if success else 'failed'} with on_{'success' if success else 'failure'}=stop"
+            "Task %s %s with on_%s=stop",
+            task_name,
+            "succeeded" if success else "failed",
+            "success" if success else "failure",
         )
         print(
             f"Stopping execution {'after successful task' if success else 'due to task failure'}."
@@ -473,32 +512,41 @@ def handle_next_action(
         return -1
 
     if next_action == "repeat" and success:
-        logger.debug(f"Task {task_name} succeeded with on_success=repeat")
+        logger.debug("Task %s succeeded with on_success=repeat", task_name)
         print("Repeating task...")
-        executed_tasks.remove(task_name)  # Allow re-execution
+        executed_tasks.discard(task_name)  # Allow re-execution
         return current_task_idx
 
     if next_action == "next" or (next_action == "retry" and not success):
         logger.debug(
-            f"Task {task_name} {'succeeded' if success else 'failed'}, continuing to next task"
+            "Task %s %s, continuing to next task",
+            task_name,
+            "succeeded" if success else "failed",
         )
         return current_task_idx + 1
 
     if next_action in task_map:
         # Jump to specific task
         logger.debug(
-            f"Task {task_name} {'succeeded' if success else 'failed'}, jumping to task '{next_action}'"
+            "Task %s %s, jumping to task '%s'",
+            task_name,
+            "succeeded" if success else "failed",
+            next_action,
         )
         print(f"Jumping to task: {next_action}")
 
+        if task_indices is None:
+            task_indices = {}
+            for idx, queued_task in enumerate(tasks_list):
+                task_indices.setdefault(queued_task.name, idx)
+
         # Find the task in the original list or add it
-        if next_action not in [t.name for t in tasks_list]:
+        if next_action not in task_indices:
+            task_indices[next_action] = len(tasks_list)
             tasks_list.append(task_map[next_action])
 
         # Set index to jump to the task
-        for idx, t in enumerate(tasks_list):
-            if t.name == next_action:
-                return idx
+        return task_indices[next_action]
 
     # Default: move to next task
     return current_task_idx + 1
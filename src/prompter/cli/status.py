@@ -1,9 +1,12 @@
 """Status display functionality for the prompter tool."""
 
-from prompter.state import StateManager
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from prompter.state import StateManager
 
-def print_status(state_manager: StateManager, verbose: bool = False) -> None:
+
+def print_status(state_manager: "StateManager", verbose: bool = False) -> None:
     """Print current task status."""
     summary = state_manager.get_summary()
 
@@ -1,26 +1,103 @@
 """Configuration parser for prompter TOML files."""
 
+import contextlib
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import re
+import shlex
 import tomllib
 from pathlib import Path
 from typing import Any
 
-from .constants import DEFAULT_CHECK_INTERVAL
+from .constants import CONFIG_CACHE_VERSION, DEFAULT_CHECK_INTERVAL
 from .logging import get_logger
 from .task_graph import CycleDetectedError, TaskGraph
 
 # Reserved action words that cannot be used as task names
-RESERVED_ACTIONS = {"next", "stop", "retry", "repeat"}
-ON_SUCCESS_ACTIONS = {"next", "stop", "repeat"}
-ON_FAILURE_ACTIONS = {"retry", "stop", "next"}
+RESERVED_ACTIONS = frozenset({"next", "stop", "retry", "repeat"})
+ON_SUCCESS_ACTIONS = frozenset({"next", "stop", "repeat"})
+ON_FAILURE_ACTIONS = frozenset({"retry", "stop", "next"})
+
+# Pre-rendered action lists for validation error messages
+_RESERVED_ACTIONS_STR = ", ".join(sorted(RESERVED_ACTIONS))
+_ON_SUCCESS_ACTIONS_STR = ", ".join(sorted(ON_SUCCESS_ACTIONS))
+_ON_FAILURE_ACTIONS_STR = ", ".join(sorted(ON_FAILURE_ACTIONS))
+
+# Substrings that mean a verify_command string needs /bin/sh to interpret it
+SHELL_INDICATORS = ("|", ">", "<", "&&", ";", "$", "`", "*", "?", "[", "]")
+
+# Extracts the position from tomllib error messages ("... (at line 3, column 7)")
+_TOML_ERROR_POSITION_RE = re.compile(r"at line (\d+), column (\d+)")
+
+
+def get_cache_dir() -> Path:
+    """Return the directory used to cache parsed configuration files.
+
+    Honours ``PROMPTER_CACHE_DIR`` first, then ``XDG_CACHE_HOME``, and falls
+    back to ``~/.cache/prompter``.
+    """
+    cache_dir = os.environ.get("PROMPTER_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / "prompter"
+    return Path.home() / ".cache" / "prompter"
+
+
+def split_verify_command(command: str | list[str], shell: bool) -> list[str] | None:
+    """Tokenize a verify command for direct execution without a shell.
+
+    Returns ``None`` when the command has to run through the shell, either
+    because ``shell`` was requested or because the string uses shell syntax
+    (pipes, redirects, globs, variables) or cannot be tokenized.
+    """
+    if shell:
+        return None
+    if isinstance(command, list):
+        return command
+    if any(indicator in command for indicator in SHELL_INDICATORS):
+        return None
+    try:
+        return shlex.split(command)
+    except ValueError as e:
+        get_logger("config").debug(
+            "Failed to parse verify command with shlex (%s), using shell mode", e
+        )
+        return None
 
 
 class TaskConfig:
     """Configuration for a single task."""
 
+    __slots__ = (
+        "cpu_required",
+        "depends_on",
+        "exclusive",
+        "max_attempts",
+        "memory_required",
+        "name",
+        "on_failure",
+        "on_success",
+        "priority",
+        "prompt",
+        "resume_previous_session",
+        "system_prompt",
+        "timeout",
+        "verify_argv",
+        "verify_command",
+        "verify_shell",
+        "verify_success_code",
+    )
+
     def __init__(self, config: dict[str, Any]) -> None:
         self.name: str = config.get("name", "")
         self.prompt: str = config.get("prompt", "")
-        self.verify_command: str = config.get("verify_command", "")
+        self.verify_command: str | list[str] = config.get("verify_command", "")
+        self.verify_shell: bool = config.get("verify_shell", False)
         self.verify_success_code: int = config.get("verify_success_code", 0)
         self.on_success: str = config.get("on_success", "next")
         self.on_failure: str = config.get("on_failure", "retry")
@@ -40,6 +117,14 @@ class TaskConfig:
         self.priority: int = config.get("priority", 0)
         self.exclusive: bool = config.get("exclusive", False)
 
+        # Tokenized once so each verification can skip the /bin/sh fork.
+        # Other types are reported by PrompterConfig.validate().
+        self.verify_argv: list[str] | None = (
+            split_verify_command(self.verify_command, self.verify_shell)
+            if isinstance(self.verify_command, str | list)
+            else None
+        )
+
     def __repr__(self) -> str:
         return f"TaskConfig(name='{self.name}')"
 
@@ -47,17 +132,24 @@ class TaskConfig:
 class PrompterConfig:
     """Main configuration for the prompter tool."""
 
-    def __init__(self, config_path: str | Path) -> None:
+    def __init__(
+        self, config_path: str | Path, *, data: dict[str, Any] | None = None
+    ) -> None:
         self.config_path = Path(config_path)
         self.logger = get_logger("config")
-        self.logger.debug(f"Loading configuration from {self.config_path}")
-        self._config = self._load_config()
+        if data is None:
+            self.logger.debug("Loading configuration from %s", self.config_path)
+            self._config = self._load_config()
+        else:
+            # Already parsed by the caller; config_path is only for display
+            self._config = data
 
         # Parse settings
         settings = self._config.get("settings", {})
         self.check_interval: int = settings.get(
             "check_interval", DEFAULT_CHECK_INTERVAL
         )
+        self.poll_verification: bool = settings.get("poll_verification", False)
         self.max_retries: int = settings.get("max_retries", 3)
         self.working_directory: str | None = settings.get("working_directory")
         self.allow_infinite_loops: bool = settings.get("allow_infinite_loops", False)
@@ -67,35 +159,82 @@ class PrompterConfig:
         self.enable_parallel: bool = settings.get("enable_parallel", True)
 
         self.logger.debug(
-            f"Configuration settings: check_interval={self.check_interval}s, "
-            f"max_retries={self.max_retries}, working_directory={self.working_directory}, "
-            f"allow_infinite_loops={self.allow_infinite_loops}, "
-            f"max_parallel_tasks={self.max_parallel_tasks}, enable_parallel={self.enable_parallel}"
+            "Configuration settings: check_interval=%ss, poll_verification=%s, "
+            "max_retries=%s, "
+            "working_directory=%s, allow_infinite_loops=%s, "
+            "max_parallel_tasks=%s, enable_parallel=%s",
+            self.check_interval,
+            self.poll_verification,
+            self.max_retries,
+            self.working_directory,
+            self.allow_infinite_loops,
+            self.max_parallel_tasks,
+            self.enable_parallel,
         )
 
         # Parse tasks
-        self.tasks: list[TaskConfig] = []
-        for i, task_config in enumerate(self._config.get("tasks", [])):
+        self.tasks: list[TaskConfig] = [
+            TaskConfig(task_config) for task_config in self._config.get("tasks", [])
+        ]
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                f"Parsing task {i + 1}: {task_config.get('name', 'unnamed')}"
+                "Loaded %s tasks from configuration: %s",
+                len(self.tasks),
+                ", ".join(task.name or "unnamed" for task in self.tasks),
             )
-            self.tasks.append(TaskConfig(task_config))
 
-        self.logger.debug(f"Loaded {len(self.tasks)} tasks from configuration")
+        # Index tasks by name for constant-time lookups (first definition wins)
+        self._task_by_name: dict[str, TaskConfig] = {}
+        for task in self.tasks:
+            if task.name:
+                self._task_by_name.setdefault(task.name, task)
+
+        # Tasks do not change after loading, so this only needs computing once
+        self._has_dependencies = any(task.depends_on for task in self.tasks)
+
+        # Filled in lazily by validate() and build_task_graph()
+        self._validation_errors: list[str] | None = None
+        self._task_graph: TaskGraph | None = None
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], config_path: str | Path = "<memory>"
+    ) -> "PrompterConfig":
+        """Build a configuration from already-parsed TOML data."""
+        return cls(config_path, data=data)
 
     def _load_config(self) -> dict[str, Any]:
         """Load and parse the TOML configuration file."""
         if not self.config_path.exists():
-            self.logger.error(f"Configuration file not found: {self.config_path}")
+            self.logger.error("Configuration file not found: %s", self.config_path)
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
+        # Read the file once; the bytes are reused for error context below
+        with open(self.config_path, "rb") as f:
+            content = f.read()
+
+        # The cache is optional; if it cannot even be located, just parse
+        cache_file: Path | None
         try:
-            with open(self.config_path, "rb") as f:
-                config = tomllib.load(f)
-                self.logger.debug(
-                    f"Successfully parsed TOML file with {len(config)} top-level sections"
-                )
-                return config
+            cache_file = self._get_cache_file(content)
+        except (OSError, RuntimeError) as e:
+            self.logger.debug("Config cache unavailable: %s", e)
+            cache_file = None
+
+        try:
+            if cache_file is not None:
+                cached = self._read_cached_config(cache_file)
+                if cached is not None:
+                    self.logger.debug("Using cached configuration from %s", cache_file)
+                    return cached
+
+            config = tomllib.loads(content.decode())
+            self.logger.debug(
+                "Successfully parsed TOML file with %s top-level sections", len(config)
+            )
+            if cache_file is not None:
+                self._write_cached_config(cache_file, config)
+            return config
         except tomllib.TOMLDecodeError as e:
             # Extract line and column information from the error message
             error_msg = str(e)
@@ -103,37 +242,32 @@ class PrompterConfig:
             col_num = None
 
             # Parse error message for line and column
-            import re
-
-            match = re.search(r"at line (\d+), column (\d+)", error_msg)
+            match = _TOML_ERROR_POSITION_RE.search(error_msg)
             if match:
                 line_num = int(match.group(1))
                 col_num = int(match.group(2))
 
-            # Read the problematic line if possible
+            # Show the problematic line from the bytes we already read.
+            # Split on "\n" only, which is how tomllib counts lines.
             context_lines = []
-            try:
-                with open(self.config_path) as f:
-                    lines = f.readlines()
-                    if line_num and 0 < line_num <= len(lines):
-                        # Show 2 lines before and after for context
-                        start = max(0, line_num - 3)
-                        end = min(len(lines), line_num + 2)
-
-                        for i in range(start, end):
-                            line = lines[i].rstrip()
-                            if i + 1 == line_num:
-                                # Highlight the problematic line
-                                context_lines.append(f">>> {i + 1:4d} | {line}")
-                                if col_num:
-                                    # Add pointer to specific column
-                                    pointer = " " * (col_num + 6) + "^"
-                                    context_lines.append(pointer)
-                            else:
-                                context_lines.append(f"    {i + 1:4d} | {line}")
-            except Exception:
-                # It's okay to fail here - we're just trying to provide better context
-                pass
+            text = content.decode("utf-8", errors="replace")
+            lines = text.removesuffix("\n").split("\n")
+            if line_num and 0 < line_num <= len(lines):
+                # Show 2 lines before and after for context
+                start = max(0, line_num - 3)
+                end = min(len(lines), line_num + 2)
+
+                for i in range(start, end):
+                    line = lines[i].rstrip()
+                    if i + 1 == line_num:
+                        # Highlight the problematic line
+                        context_lines.append(f">>> {i + 1:4d} | {line}")
+                        if col_num:
+                            # Add pointer to specific column
+                            pointer = " " * (col_num + 6) + "^"
+                            context_lines.append(pointer)
+                    else:
+                        context_lines.append(f"    {i + 1:4d} | {line}")
 
             # Create enhanced error message
             enhanced_msg = f"TOML parsing error in {self.config_path}:\n{error_msg}"
@@ -150,18 +284,104 @@ class PrompterConfig:
             # Don't log here - the exception will be displayed by the CLI
             raise tomllib.TOMLDecodeError(enhanced_msg) from e
 
+    def _get_cache_file(self, content: bytes) -> Path:
+        """Return the cache file for the given config content.
+
+        The name is ``<path key>-<content key>.pkl``: the first part identifies
+        the resolved config path, the second covers the cache version, mtime,
+        size and a digest of the content, so any edit to the file produces a
+        different cache entry for the same path.
+        """
+        stat = self.config_path.stat()
+        path_key = hashlib.sha256(str(self.config_path.resolve()).encode())
+        content_digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        content_key = "\0".join(
+            [
+                str(CONFIG_CACHE_VERSION),
+                str(stat.st_mtime_ns),
+                str(stat.st_size),
+                content_digest,
+            ]
+        )
+        return get_cache_dir() / (
+            f"{path_key.hexdigest()[:32]}-"
+            f"{hashlib.sha256(content_key.encode()).hexdigest()[:32]}.pkl"
+        )
+
+    def _read_cached_config(self, cache_file: Path) -> dict[str, Any] | None:
+        """Load a previously parsed configuration, or None on a cache miss.
+
+        Entries not owned by the current user, or writable by anyone else, are
+        ignored rather than unpickled.
+        """
+        try:
+            with open(cache_file, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if (
+                    hasattr(os, "getuid") and stat.st_uid != os.getuid()
+                ) or stat.st_mode & 0o022:
+                    self.logger.debug("Ignoring untrusted config cache %s", cache_file)
+                    return None
+                # Only entries we wrote and nobody else can modify get here
+                config = pickle.load(f)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # A corrupt or incompatible cache entry just means we parse again
+            self.logger.debug("Ignoring unreadable config cache %s: %s", cache_file, e)
+            return None
+        return config if isinstance(config, dict) else None
+
+    def _write_cached_config(self, cache_file: Path, config: dict[str, Any]) -> None:
+        """Store a parsed configuration in the cache (best effort).
+
+        Older entries for the same config path are deleted, so each config
+        file keeps at most one cache entry.
+        """
+        temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            # Private to the user, since entries are unpickled when read back
+            cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(config, f, protocol=5)
+            temp_file.replace(cache_file)
+        except OSError as e:
+            self.logger.debug("Could not write config cache %s: %s", cache_file, e)
+            with contextlib.suppress(OSError):
+                temp_file.unlink()
+            return
+
+        path_key = cache_file.name.partition("-")[0]
+        for stale_file in cache_file.parent.glob(f"{path_key}-*.pkl"):
+            if stale_file != cache_file:
+                with contextlib.suppress(OSError):
+                    stale_file.unlink()
+
+    @functools.cached_property
+    def task_names(self) -> frozenset[str]:
+        """Names of all named tasks in the configuration."""
+        return frozenset(self._task_by_name)
+
     def get_task_by_name(self, name: str) -> TaskConfig | None:
         """Get a task configuration by name."""
-        self.logger.debug(f"Looking for task named '{name}'")
-        for task in self.tasks:
-            if task.name == name:
-                self.logger.debug(f"Found task '{name}'")
-                return task
-        self.logger.debug(f"Task '{name}' not found")
-        return None
+        self.logger.debug("Looking for task named '%s'", name)
+        task = self._task_by_name.get(name)
+        if task is None:
+            self.logger.debug("Task '%s' not found", name)
+        else:
+            self.logger.debug("Found task '%s'", name)
+        return task
 
     def validate(self) -> list[str]:
-        """Validate the configuration and return any errors."""
+        """Validate the configuration and return any errors.
+
+        The configuration does not change after loading, so the result of the
+        first call is cached and returned (as a fresh list) on later calls.
+        """
+        if self._validation_errors is not None:
+            return list(self._validation_errors)
+
         self.logger.debug("Validating configuration")
         errors = []
 
@@ -169,8 +389,11 @@ class PrompterConfig:
             errors.append("No tasks defined in configuration")
             self.logger.debug("Validation error: No tasks defined")
 
-        # Get all task names for validation
-        task_names = {task.name for task in self.tasks if task.name}
+        task_names = self.task_names
+
+        # on_success/on_failure may name either a reserved action or a task
+        valid_on_success = ON_SUCCESS_ACTIONS | task_names
+        valid_on_failure = ON_FAILURE_ACTIONS | task_names
 
         for i, task in enumerate(self.tasks):
             task_errors = []
@@ -179,34 +402,40 @@ class PrompterConfig:
             elif task.name in RESERVED_ACTIONS:
                 task_errors.append(
                     f"Task {i}: name '{task.name}' is a reserved word and cannot be used as a task name. "
-                    f"Reserved words are: {', '.join(sorted(RESERVED_ACTIONS))}"
+                    f"Reserved words are: {_RESERVED_ACTIONS_STR}"
                 )
 
             if not task.prompt:
                 task_errors.append(f"Task {i} ({task.name}): prompt is required")
-            if not task.verify_command:
+            # Typed loosely here: the TOML value is not checked until now
+            verify_command: object = task.verify_command
+            if not verify_command:
                 task_errors.append(
                     f"Task {i} ({task.name}): verify_command is required"
                 )
+            elif not isinstance(verify_command, str | list):
+                task_errors.append(
+                    f"Task {i} ({task.name}): verify_command must be a string or list"
+                )
+            elif isinstance(verify_command, list) and not all(
+                isinstance(arg, str) for arg in verify_command
+            ):
+                task_errors.append(
+                    f"Task {i} ({task.name}): verify_command list must contain only strings"
+                )
 
             # Validate on_success - can be either a reserved action or a task name
-            if (
-                task.on_success not in ON_SUCCESS_ACTIONS
-                and task.on_success not in task_names
-            ):
+            if task.on_success not in valid_on_success:
                 task_errors.append(
                     f"Task {i} ({task.name}): on_success '{task.on_success}' must be one of "
-                    f"{', '.join(sorted(ON_SUCCESS_ACTIONS))} or a valid task name"
+                    f"{_ON_SUCCESS_ACTIONS_STR} or a valid task name"
                 )
 
             # Validate on_failure - can be either a reserved action or a task name
-            if (
-                task.on_failure not in ON_FAILURE_ACTIONS
-                and task.on_failure not in task_names
-            ):
+            if task.on_failure not in valid_on_failure:
                 task_errors.append(
                     f"Task {i} ({task.name}): on_failure '{task.on_failure}' must be one of "
-                    f"{', '.join(sorted(ON_FAILURE_ACTIONS))} or a valid task name"
+                    f"{_ON_FAILURE_ACTIONS_STR} or a valid task name"
                 )
 
             if task.max_attempts < 1:
@@ -214,54 +443,74 @@ class PrompterConfig:
 
             if task_errors:
                 self.logger.debug(
-                    f"Validation errors for task {i} ({task.name}): {len(task_errors)} errors"
+                    "Validation errors for task %s (%s): %s errors",
+                    i,
+                    task.name,
+                    len(task_errors),
                 )
                 errors.extend(task_errors)
             else:
-                self.logger.debug(f"Task {i} ({task.name}) validation passed")
+                self.logger.debug("Task %s (%s) validation passed", i, task.name)
 
         # Validate dependencies if any are defined
         if self.has_dependencies():
             self.logger.debug("Validating task dependencies")
 
             # Check that all dependency references are valid
+            unknown_dependencies = False
             for task in self.tasks:
                 for dep in task.depends_on:
                     if dep not in task_names:
+                        unknown_dependencies = True
                         errors.append(
                             f"Task '{task.name}' depends on unknown task '{dep}'"
                         )
 
-            # Check for circular dependencies by building the graph
-            try:
-                self.build_task_graph()
-                self.logger.debug("Dependency graph validation passed")
-            except CycleDetectedError as e:
-                errors.append(f"Circular dependency detected: {e}")
-                self.logger.debug(f"Circular dependency detected: {e}")
-            except ValueError as e:
-                errors.append(f"Invalid dependency configuration: {e}")
-                self.logger.debug(f"Invalid dependency configuration: {e}")
-            except Exception as e:
-                errors.append(f"Error validating dependencies: {e}")
-                self.logger.debug(f"Error validating dependencies: {e}")
+            # Check for circular dependencies by building the graph. With
+            # unknown dependencies the graph would only repeat those errors.
+            if unknown_dependencies:
+                self.logger.debug("Skipping dependency graph build: unknown tasks")
+            else:
+                try:
+                    self.build_task_graph()
+                    self.logger.debug("Dependency graph validation passed")
+                except CycleDetectedError as e:
+                    errors.append(f"Circular dependency detected: {e}")
+                    self.logger.debug("Circular dependency detected: %s", e)
+                except ValueError as e:
+                    errors.append(f"Invalid dependency configuration: {e}")
+                    self.logger.debug("Invalid dependency configuration: %s", e)
+                except Exception as e:
+                    errors.append(f"Error validating dependencies: {e}")
+                    self.logger.debug("Error validating dependencies: %s", e)
 
         self.logger.debug(
-            f"Configuration validation complete: {len(errors)} errors found"
+            "Configuration validation complete: %s errors found", len(errors)
         )
-        return errors
+        self._validation_errors = errors
+        return list(errors)
 
     def build_task_graph(self) -> TaskGraph:
-        """Build a dependency graph from the configured tasks."""
+        """Build a dependency graph from the configured tasks.
+
+        The graph is built and validated once; later calls (for example from
+        the parallel coordinator after validate()) reuse the same instance.
+        """
+        if self._task_graph is not None:
+            return self._task_graph
+
         self.logger.debug("Building task dependency graph")
         graph = TaskGraph()
 
         # Add all tasks to the graph
         for task in self.tasks:
+            graph.add_task(name=task.name, task=task, dependencies=task.depends_on)
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                f"Adding task '{task.name}' with dependencies: {task.depends_on}"
+                "Added %s tasks to the graph: %s",
+                len(self.tasks),
+                "; ".join(f"{task.name} <- {task.depends_on}" for task in self.tasks),
             )
-            graph.add_task(name=task.name, task=task, dependencies=task.depends_on)
 
         # Validate the graph structure
         try:
@@ -271,8 +520,9 @@ class PrompterConfig:
             self.logger.exception("Task graph validation failed")
             raise
 
+        self._task_graph = graph
         return graph
 
     def has_dependencies(self) -> bool:
         """Check if any task has dependencies defined."""
-        return any(task.depends_on for task in self.tasks)
+        return self._has_dependencies
@@ -5,6 +5,24 @@ DEFAULT_TASK_TIMEOUT = 300  # 5 minutes - default timeout for task execution
 DEFAULT_VERIFICATION_TIMEOUT = 300  # 5 minutes - timeout for verification commands
 DEFAULT_INIT_TIMEOUT = 120  # 2 minutes - default timeout for AI project analysis
 DEFAULT_CHECK_INTERVAL = 5  # 5 seconds - delay between task completion and verification
+VERIFICATION_POLL_INTERVAL = 1  # 1 second - re-check cadence for poll_verification
+
+# Output limits
+VERIFICATION_OUTPUT_LIMIT = 10_000  # Trailing characters kept per verification stream
+
+# Display settings
+ERROR_SUMMARY_LENGTH = 50  # Characters of an error shown in progress displays
 
 # Safety limits
 MAX_TASK_ITERATIONS = 1000  # Maximum iterations to prevent runaway loops
+
+# State persistence
+STATE_FLUSH_INTERVAL = 1.0  # Seconds between state file writes inside a batch
+STATE_MAX_PENDING_SAVES = 16  # Deferred saves that force a write inside a batch
+RESULTS_HISTORY_LIMIT = 1000  # Results kept in the state file; older ones go to the log
+HISTORY_TEXT_LIMIT = 500  # Characters of output/error kept per history entry
+STATE_STREAM_THRESHOLD = 500  # History size above which state is encoded incrementally
+STATE_WRITE_BUFFER_SIZE = 1 << 20  # Buffer size for streamed state writes
+
+# Cache settings
+CONFIG_CACHE_VERSION = 1  # Bump to invalidate cached parsed configuration files
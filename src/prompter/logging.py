@@ -71,6 +71,24 @@ def setup_logging(
     return logger
 
 
+def setup_minimal_logging() -> logging.Logger:
+    """Set up logging for short-lived commands that do not log on success.
+
+    Only warnings and errors are reported. No handlers or formatters are
+    created; such records fall through to the logging module's last-resort
+    stderr handler.
+    """
+    logger = logging.getLogger("prompter")
+    logger.setLevel(logging.WARNING)
+
+    # Clear any existing handlers
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+    return logger
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance."""
     return logging.getLogger(f"prompter.{name}")
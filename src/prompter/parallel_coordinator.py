@@ -4,7 +4,9 @@ This module implements concurrent task execution using anyio for structured conc
 respecting task dependencies and resource constraints.
 """
 
+import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -12,15 +14,32 @@ from typing import Any
 import anyio
 from anyio import create_task_group
 from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
 from .config import PrompterConfig, TaskConfig
+from .constants import ERROR_SUMMARY_LENGTH
 from .logging import get_logger
 from .runner import TaskResult, TaskRunner
 from .state import StateManager
 
 
+# Pending state manager write: ("running", task name) or
+# ("result", (TaskResult, event set once the result is recorded))
+StateUpdate = tuple[str, Any]
+
+# Queued state updates before running tasks wait for the flusher to catch up
+STATE_UPDATE_BUFFER_SIZE = 64
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for progress display updates when no display is attached."""
+
+
 class TaskStatus(Enum):
-    """Status of a task in the parallel execution system."""
+    """Status of a task in the parallel execution system.
+
+    Members are singletons, so hot paths compare them with ``is``.
+    """
 
     PENDING = "pending"
     READY = "ready"
@@ -30,13 +49,14 @@ class TaskStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskExecutionState:
     """Tracks the execution state of a task."""
 
     name: str
     status: TaskStatus = TaskStatus.PENDING
     result: TaskResult | None = None
+    # time.monotonic() readings; only meaningful relative to each other
     start_time: float | None = None
     end_time: float | None = None
     dependencies_met: bool = False
@@ -44,17 +64,17 @@ class TaskExecutionState:
     @property
     def duration(self) -> float | None:
         """Get task execution duration in seconds."""
-        if self.start_time and self.end_time:
+        if self.start_time is not None and self.end_time is not None:
             return self.end_time - self.start_time
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePool:
     """Manages available system resources for task scheduling."""
 
     max_parallel_tasks: int
-    running_tasks: set[str] = field(default_factory=set)
+    running_count: int = 0
     completed_tasks: set[str] = field(default_factory=set)
     failed_tasks: set[str] = field(default_factory=set)
     exclusive_task_running: str | None = None
@@ -66,7 +86,7 @@ class ResourcePool:
     def can_schedule(self, task: TaskConfig) -> bool:
         """Check if a task can be scheduled given resource constraints."""
         # Check parallel task limit
-        if len(self.running_tasks) >= self.max_parallel_tasks:
+        if self.running_count >= self.max_parallel_tasks:
             return False
 
         # If an exclusive task is running, nothing else can be scheduled
@@ -74,18 +94,25 @@ class ResourcePool:
             return False
 
         # If this is an exclusive task, it can only run if nothing else is running
-        return not (task.exclusive and len(self.running_tasks) > 0)
+        return not (task.exclusive and self.running_count > 0)
+
+    def is_saturated(self) -> bool:
+        """Check if no task at all can be scheduled until one finishes."""
+        return (
+            self.exclusive_task_running is not None
+            or self.running_count >= self.max_parallel_tasks
+        )
 
     def allocate(self, task: TaskConfig) -> None:
         """Allocate resources for a task."""
-        self.running_tasks.add(task.name)
+        self.running_count += 1
         if task.exclusive:
             self.exclusive_task_running = task.name
         # Future: Deduct CPU and memory
 
     def release(self, task: TaskConfig, success: bool) -> None:
         """Release resources after task completion."""
-        self.running_tasks.discard(task.name)
+        self.running_count -= 1
         if task.name == self.exclusive_task_running:
             self.exclusive_task_running = None
         if success:
@@ -111,6 +138,13 @@ class ParallelTaskCoordinator:
         self.state_manager = state_manager
         self.dry_run = dry_run
         self.progress_display = progress_display
+        # Progress update hook, bound once so the hot path needs no None check
+        self._notify = _noop
+        if progress_display is not None:
+            self._display_update = progress_display.update_task
+            self._notify = self._notify_if_changed
+        # Last update sent to the progress display for each task
+        self._last_progress: dict[str, tuple[Any, ...]] = {}
         self.logger = get_logger("parallel_coordinator")
 
         # Build task graph
@@ -118,16 +152,45 @@ class ParallelTaskCoordinator:
 
         # Initialize execution state
         self.task_states: dict[str, TaskExecutionState] = {}
+        self._task_by_name: dict[str, TaskConfig] = {}
         for task in config.tasks:
             self.task_states[task.name] = TaskExecutionState(name=task.name)
+            self._task_by_name[task.name] = task
+
+        # Dependency bookkeeping: counts down each task's unfinished
+        # dependencies and queues the tasks that become ready
+        self._scheduler = self.graph.scheduler()
+
+        # Tasks whose dependencies are all satisfied, in the order they became
+        # ready; seeded with the root tasks when the scheduler starts
+        self._ready_queue: deque[str] = deque()
 
         # Resource management
         self.resource_pool = ResourcePool(max_parallel_tasks=config.max_parallel_tasks)
 
-        # Synchronization primitives
-        self._task_completed_event = anyio.Event()
+        # Worker threads for the synchronous runner, sized to match how many
+        # tasks the scheduler lets run at once
+        self._thread_limiter = anyio.CapacityLimiter(max(1, config.max_parallel_tasks))
+
         self._shutdown_requested = False
 
+        # Number of tasks not yet completed, failed or skipped; the event fires
+        # once it reaches zero
+        self._unfinished_count = len(self.task_states)
+        # Results of finished tasks, filled in as each one completes
+        self.results: dict[str, TaskResult] = {}
+
+        # State manager updates queued for the background flusher; each running
+        # task holds its own clone of the send side
+        self._state_updates, self._state_updates_receiver = (
+            anyio.create_memory_object_stream[StateUpdate](
+                max_buffer_size=STATE_UPDATE_BUFFER_SIZE
+            )
+        )
+        self._all_done = anyio.Event()
+        if self._unfinished_count == 0:
+            self._all_done.set()
+
     async def execute_all(self) -> dict[str, TaskResult]:
         """Execute all tasks respecting dependencies and parallelism constraints."""
         self.logger.info(
@@ -135,118 +198,128 @@ class ParallelTaskCoordinator:
             f"(max parallel: {self.config.max_parallel_tasks})"
         )
 
-        # Print dependency graph visualization
-        self.logger.info(f"\\n{self.graph.visualize_ascii()}")
+        # Print dependency graph visualization, rendering it only when shown
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"\\n{self.graph.visualize_ascii()}")
 
         # Initialize progress display for all tasks
         if self.progress_display:
             for task in self.config.tasks:
-                self.progress_display.update_task(
+                self._notify(
                     task.name, TaskStatus.PENDING, dependencies=task.depends_on
                 )
 
-        start_time = time.time()
-        results: dict[str, TaskResult] = {}
+        start_time = time.monotonic()
 
         try:
             async with create_task_group() as tg:
-                # Start the scheduler in the background
-                tg.start_soon(self._scheduler_loop, tg)
+                # Persist state updates off the event loop; the flusher exits
+                # once every task has closed its copy of the send stream
+                tg.start_soon(self._state_flusher, self._state_updates_receiver)
+
+                # Start tasks without dependencies; each finishing task starts
+                # whatever it unblocks
+                for name in self._scheduler.pop_ready():
+                    self._mark_ready(name)
+                self._start_ready_tasks(tg)
 
                 # Wait for all tasks to complete or shutdown
                 await self._wait_for_completion()
+                self._state_updates.close()
 
         except Exception:
             self.logger.exception("Error during parallel execution")
             raise
 
-        # Collect results
-        for name, state in self.task_states.items():
-            if state.result:
-                results[name] = state.result
-
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         self.logger.info(
             f"Parallel execution completed in {duration:.2f}s. "
             f"Tasks: {len(self.resource_pool.completed_tasks)} succeeded, "
             f"{len(self.resource_pool.failed_tasks)} failed"
         )
 
-        return results
-
-    async def _scheduler_loop(self, tg: TaskGroup) -> None:
-        """Main scheduler loop that assigns ready tasks to workers."""
-        self.logger.debug("Scheduler loop started")
-
-        while not self._shutdown_requested:
-            # Find tasks that are ready to execute
-            ready_tasks = self._get_ready_tasks()
-
-            if not ready_tasks and len(self.resource_pool.running_tasks) == 0:
-                # No more tasks to run and nothing running
-                self.logger.debug("All tasks completed, scheduler shutting down")
+        return self.results
+
+    def _start_ready_tasks(self, tg: TaskGroup) -> None:
+        """Start queued ready tasks that fit within resource constraints.
+
+        Called once with the root tasks and again whenever a task finishes, so
+        newly unblocked tasks start without going through a scheduler loop.
+        """
+        if self._shutdown_requested or self.resource_pool.is_saturated():
+            return
+
+        # Tasks that cannot run yet stay queued, in order, until the next call
+        ready_tasks = list(self._ready_queue)
+        self._ready_queue.clear()
+        scheduled_count = 0
+        for position, task_name in enumerate(ready_tasks):
+            if self.resource_pool.is_saturated():
+                # Nothing else can start until a running task finishes
+                self._ready_queue.extend(ready_tasks[position:])
                 break
 
-            # Schedule ready tasks that fit within resource constraints
-            scheduled_count = 0
-            for task_name in ready_tasks:
-                task = self.config.get_task_by_name(task_name)
-                if task and self.resource_pool.can_schedule(task):
-                    self.logger.debug(f"Scheduling task: {task_name}")
-                    self.resource_pool.allocate(task)
-                    self.task_states[task_name].status = TaskStatus.RUNNING
-                    self.task_states[task_name].start_time = time.time()
-
-                    # Update progress display
-                    if self.progress_display:
-                        self.progress_display.update_task(
-                            task_name,
-                            TaskStatus.RUNNING,
-                            progress=0.0,
-                            message="Starting...",
-                        )
-
-                    # Start task execution in background
-                    tg.start_soon(self._execute_task, task)
-                    scheduled_count += 1
-
-            if scheduled_count > 0:
-                self.logger.info(
-                    f"Scheduled {scheduled_count} tasks. "
-                    f"Running: {len(self.resource_pool.running_tasks)}, "
-                    f"Completed: {len(self.resource_pool.completed_tasks)}"
+            task = self._task_by_name[task_name]
+            if self.resource_pool.can_schedule(task):
+                self.logger.debug(f"Scheduling task: {task_name}")
+                self.resource_pool.allocate(task)
+                self.task_states[task_name].status = TaskStatus.RUNNING
+                self.task_states[task_name].start_time = time.monotonic()
+
+                # Update progress display
+                self._notify(
+                    task_name,
+                    TaskStatus.RUNNING,
+                    progress=0.0,
+                    message="Starting...",
                 )
 
-            # Wait a bit before checking for new ready tasks
-            await anyio.sleep(0.1)
+                # Start task execution in background
+                tg.start_soon(self._execute_task, task, tg, self._state_updates.clone())
+                scheduled_count += 1
+            else:
+                self._ready_queue.append(task_name)
 
-        self.logger.debug("Scheduler loop ended")
+        if scheduled_count > 0:
+            self.logger.info(
+                f"Scheduled {scheduled_count} tasks. "
+                f"Running: {self.resource_pool.running_count}, "
+                f"Completed: {len(self.resource_pool.completed_tasks)}"
+            )
 
-    async def _execute_task(self, task: TaskConfig) -> None:
+    async def _execute_task(
+        self,
+        task: TaskConfig,
+        tg: TaskGroup,
+        state_updates: MemoryObjectSendStream[StateUpdate],
+    ) -> None:
         """Execute a single task and update its state."""
         self.logger.info(f"Starting execution of task: {task.name}")
 
         try:
             # Mark task as running in state manager
-            self.state_manager.mark_task_running(task.name)
+            await state_updates.send(("running", task.name))
 
             # Update progress: task is running
-            if self.progress_display:
-                self.progress_display.update_task(
-                    task.name,
-                    TaskStatus.RUNNING,
-                    progress=0.1,
-                    message="Executing Claude prompt...",
-                )
+            self._notify(
+                task.name,
+                TaskStatus.RUNNING,
+                progress=0.1,
+                message="Executing Claude prompt...",
+            )
 
             # Execute the task (this is synchronous, so run in thread)
             result = await anyio.to_thread.run_sync(
-                self.runner.run_task, task, self.state_manager
+                self.runner.run_task,
+                task,
+                self.state_manager,
+                limiter=self._thread_limiter,
             )
 
             # Update execution state
             self.task_states[task.name].result = result
-            self.task_states[task.name].end_time = time.time()
+            self.results[task.name] = result
+            self.task_states[task.name].end_time = time.monotonic()
 
             if result.success:
                 self.task_states[task.name].status = TaskStatus.COMPLETED
@@ -259,13 +332,12 @@ class ParallelTaskCoordinator:
                 )
 
                 # Update progress: task completed
-                if self.progress_display:
-                    self.progress_display.update_task(
-                        task.name,
-                        TaskStatus.COMPLETED,
-                        progress=1.0,
-                        message="Complete",
-                    )
+                self._notify(
+                    task.name,
+                    TaskStatus.COMPLETED,
+                    progress=1.0,
+                    message="Complete",
+                )
             else:
                 self.task_states[task.name].status = TaskStatus.FAILED
                 session_info = (
@@ -276,120 +348,180 @@ class ParallelTaskCoordinator:
                 )
 
                 # Update progress: task failed
-                if self.progress_display:
-                    self.progress_display.update_task(
-                        task.name,
-                        TaskStatus.FAILED,
-                        progress=1.0,
-                        message="Failed",
-                        error=result.error[:50] if result.error else "Unknown error",
-                    )
+                self._notify(
+                    task.name,
+                    TaskStatus.FAILED,
+                    progress=1.0,
+                    message="Failed",
+                    error=result.error_short or "Unknown error",
+                )
 
             # Update state manager
-            self.state_manager.update_task_state(result)
+            await self._record_result(state_updates, result)
 
         except Exception as e:
             self.logger.exception(f"Unexpected error executing task {task.name}")
             self.task_states[task.name].status = TaskStatus.FAILED
-            self.task_states[task.name].end_time = time.time()
+            self.task_states[task.name].end_time = time.monotonic()
 
             # Create a failure result
+            error_text = str(e)
             result = TaskResult(
                 task_name=task.name,
                 success=False,
-                error=f"Unexpected error: {e!s}",
+                error=f"Unexpected error: {error_text}",
                 attempts=1,
             )
             self.task_states[task.name].result = result
-            self.state_manager.update_task_state(result)
+            self.results[task.name] = result
+            await self._record_result(state_updates, result)
 
             # Update progress: unexpected failure
-            if self.progress_display:
-                self.progress_display.update_task(
-                    task.name,
-                    TaskStatus.FAILED,
-                    progress=1.0,
-                    message="Error",
-                    error=str(e)[:50],
-                )
+            self._notify(
+                task.name,
+                TaskStatus.FAILED,
+                progress=1.0,
+                message="Error",
+                error=error_text[:ERROR_SUMMARY_LENGTH],
+            )
 
         finally:
-            # Release resources and signal completion
-            self.resource_pool.release(
-                task, self.task_states[task.name].status == TaskStatus.COMPLETED
-            )
-            self._task_completed_event.set()
+            state_updates.close()
+
+            # Release resources, then start whatever this task unblocked
+            succeeded = self.task_states[task.name].status is TaskStatus.COMPLETED
+            self.resource_pool.release(task, succeeded)
+            if succeeded:
+                self._release_dependents(task.name)
+            else:
+                self._skip_dependents(task.name)
+            self._task_finished()
+            self._start_ready_tasks(tg)
+
+    def _notify_if_changed(
+        self,
+        task_name: str,
+        status: TaskStatus,
+        progress: float = 0.0,
+        message: str = "",
+        **kwargs: Any,
+    ) -> None:
+        """Forward a progress update to the display unless it repeats the last one."""
+        update = (status, progress, message, kwargs)
+        if self._last_progress.get(task_name) == update:
+            return
+        self._last_progress[task_name] = update
+        self._display_update(
+            task_name, status, progress=progress, message=message, **kwargs
+        )
+
+    async def _record_result(
+        self,
+        state_updates: MemoryObjectSendStream[StateUpdate],
+        result: TaskResult,
+    ) -> None:
+        """Queue a task result and wait until the state manager has it.
 
-    def _get_ready_tasks(self) -> list[str]:
-        """Get tasks that are ready to execute (dependencies satisfied)."""
-        ready = []
+        Dependents are only released after this returns, because they may
+        read the result when they start (e.g. to resume its Claude session).
+        """
+        recorded = anyio.Event()
+        try:
+            await state_updates.send(("result", (result, recorded)))
+        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+            # The flusher is gone; the result is still kept in self.results
+            self.logger.warning(
+                f"Could not record result of task {result.task_name} in state"
+            )
+            return
+        await recorded.wait()
 
-        for name, state in self.task_states.items():
-            # If already marked as ready, include it
-            if state.status == TaskStatus.READY:
-                ready.append(name)
+    async def _state_flusher(
+        self, receive_updates: MemoryObjectReceiveStream[StateUpdate]
+    ) -> None:
+        """Apply queued state updates in a worker thread, one save per batch."""
+        async with receive_updates:
+            async for update in receive_updates:
+                # Fold in whatever else is already queued so it shares a write
+                batch = [update]
+                while True:
+                    try:
+                        batch.append(receive_updates.receive_nowait())
+                    except (anyio.WouldBlock, anyio.EndOfStream):
+                        break
+                try:
+                    await anyio.to_thread.run_sync(self._apply_state_updates, batch)
+                except Exception:
+                    # One failed save must not stop later updates or the run
+                    self.logger.exception("Failed to save task state")
+                finally:
+                    # Wake the tasks waiting for their results to be recorded
+                    for kind, payload in batch:
+                        if kind == "result":
+                            payload[1].set()
+
+    def _apply_state_updates(self, batch: list[StateUpdate]) -> None:
+        """Record a batch of state updates and save the state file once."""
+        for kind, payload in batch:
+            if kind == "running":
+                self.state_manager.mark_task_running(payload, save=False)
+            else:
+                self.state_manager.update_task_state(payload[0], save=False)
+        self.state_manager.save_state()
+
+    def _task_finished(self) -> None:
+        """Record that a task reached a terminal status."""
+        self._unfinished_count -= 1
+        if self._unfinished_count == 0:
+            self._all_done.set()
+
+    def _mark_ready(self, name: str) -> None:
+        """Mark a task whose dependencies are all satisfied as ready to run."""
+        state = self.task_states[name]
+        state.status = TaskStatus.READY
+        state.dependencies_met = True
+        self._ready_queue.append(name)
+
+        # Update progress display
+        self._notify(name, TaskStatus.READY, message="Ready to run")
+
+    def _release_dependents(self, name: str) -> None:
+        """Count a completed task against its dependents and queue any now ready."""
+        self._scheduler.mark_completed(name)
+        for dependent in self._scheduler.pop_ready():
+            if self.task_states[dependent].status is TaskStatus.PENDING:
+                self._mark_ready(dependent)
+
+    def _skip_dependents(self, name: str) -> None:
+        """Skip every task that directly or transitively depends on a failed task."""
+        stack = list(self._scheduler.dependents(name))
+        skipped_at = time.monotonic()
+        while stack:
+            dependent = stack.pop()
+            state = self.task_states[dependent]
+            if state.status is not TaskStatus.PENDING:
                 continue
 
-            # Check pending tasks for readiness
-            if state.status == TaskStatus.PENDING:
-                # Check if all dependencies are completed
-                task = self.config.get_task_by_name(name)
-                if task:
-                    # Check dependency status
-                    dep_states = [
-                        self.task_states.get(dep, TaskExecutionState(dep)).status
-                        for dep in task.depends_on
-                    ]
-
-                    # If any dependency failed, skip this task
-                    if any(status == TaskStatus.FAILED for status in dep_states):
-                        state.status = TaskStatus.SKIPPED
-                        state.end_time = time.time()
-                        self.logger.info(
-                            f"Skipping task {name} due to failed dependencies"
-                        )
-
-                        # Update progress display
-                        if self.progress_display:
-                            self.progress_display.update_task(
-                                name,
-                                TaskStatus.SKIPPED,
-                                message="Skipped (dependency failed)",
-                            )
-                        continue
-
-                    # If all dependencies completed successfully, mark as ready
-                    if all(status == TaskStatus.COMPLETED for status in dep_states):
-                        ready.append(name)
-                        state.status = TaskStatus.READY
-                        state.dependencies_met = True
-
-                        # Update progress display
-                        if self.progress_display:
-                            self.progress_display.update_task(
-                                name, TaskStatus.READY, message="Ready to run"
-                            )
-
-        return ready
+            state.status = TaskStatus.SKIPPED
+            state.end_time = skipped_at
+            self._task_finished()
+            self.logger.info(f"Skipping task {dependent} due to failed dependencies")
 
-    async def _wait_for_completion(self) -> None:
-        """Wait for all tasks to complete."""
-        while True:
-            # Check if all tasks are done
-            all_done = all(
-                state.status
-                in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED)
-                for state in self.task_states.values()
+            # Update progress display
+            self._notify(
+                dependent,
+                TaskStatus.SKIPPED,
+                message="Skipped (dependency failed)",
             )
 
-            if all_done or self._shutdown_requested:
-                break
+            stack.extend(self._scheduler.dependents(dependent))
 
-            # Wait a bit before checking again
-            await anyio.sleep(0.1)
+    async def _wait_for_completion(self) -> None:
+        """Wait for all tasks to complete."""
+        await self._all_done.wait()
 
     def shutdown(self) -> None:
         """Request graceful shutdown of the coordinator."""
         self.logger.info("Shutdown requested")
         self._shutdown_requested = True
-        self._task_completed_event.set()
+        self._all_done.set()
@@ -1,17 +1,24 @@
 """Progress visualization for parallel task execution using rich."""
 
+import atexit
+import functools
 import os
 import sys
 import threading
 import time
+from collections import deque
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, UTC
+from datetime import timedelta
 from enum import Enum
+from types import MappingProxyType
 
 from rich.console import Console
+from rich.control import Control
 from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
+from rich.segment import Segment
 from rich.table import Table
 from rich.text import Text
 
@@ -19,7 +26,122 @@ from .logging import get_logger
 from .parallel_coordinator import TaskStatus
 
 
-@dataclass
+# Statuses shown in the recently finished section of the rich display
+DONE_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED})
+
+# Statuses listed in the waiting section of the rich display
+WAITING_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.READY})
+
+# How many recently finished tasks the rich display lists
+RECENT_DONE_SHOWN = 5
+
+# Bounds on how often the rich display redraws, in frames per second
+MIN_REFRESH_PER_SECOND = 1.0
+MAX_REFRESH_PER_SECOND = 30.0
+
+
+def _glyph_bars(width: int, full: str, empty: str) -> tuple[str, ...]:
+    """Precompute a fixed-width progress bar at every fill level."""
+    return tuple(f"[{full * i}{empty * (width - i)}]" for i in range(width + 1))
+
+
+def _bar_for(bars: tuple[str, ...], fraction: float) -> str:
+    """Pick the precomputed bar for a completion fraction."""
+    width = len(bars) - 1
+    return bars[min(max(int(fraction * width), 0), width)]
+
+
+# Progress bars are drawn every frame for every task, so build them once
+_RICH_TASK_BARS = _glyph_bars(20, "█", "░")
+_RICH_SUMMARY_BARS = _glyph_bars(40, "█", "░")
+_SIMPLE_TASK_BARS = _glyph_bars(20, "#", "-")
+
+# Renderables that never change between frames
+_STATUS_RUNNING = Text("Running", style="blue")
+_STATUS_COMPLETE = Text("✓ Complete", style="green")
+_STATUS_FAILED = Text("✗ Failed", style="red")
+_BAR_COMPLETE = Text(f"{_RICH_TASK_BARS[-1]} 100%", style="green")
+
+
+# Environment variables that mark a CI run (comprehensive list)
+_CI_ENV_VARS = (
+    "CI",
+    "GITHUB_ACTIONS",
+    "GITLAB_CI",
+    "CIRCLECI",
+    "TRAVIS",
+    "JENKINS_URL",
+    "TEAMCITY_VERSION",
+    "BUILDKITE",
+    "DRONE",
+    "CODEBUILD_BUILD_ID",
+    "APPVEYOR",
+    "TF_BUILD",
+    "BITBUCKET_PIPELINES_UUID",
+    "BUDDY_WORKSPACE_ID",
+)
+_UNSUPPORTED_TERMS = frozenset({"dumb", "unknown", ""})
+
+
+@functools.cache
+def _init_colorama() -> bool:
+    """Initialise colorama once per process; False when it isn't installed."""
+    if sys.platform == "win32":
+        try:
+            import colorama
+        except ImportError:
+            return False
+        colorama.init()
+        return True
+    return False
+
+
+def _write_stdout(text: str) -> None:
+    """Write text to stdout, bypassing the text layer when it is a terminal."""
+    stream = sys.stdout
+    try:
+        fd = stream.fileno() if stream.isatty() else None
+    except (AttributeError, ValueError, OSError):
+        fd = None
+    if fd is None:
+        stream.write(text)
+        stream.flush()
+        return
+
+    # Anything already buffered in the text layer has to go out first
+    stream.flush()
+    data = memoryview(text.encode(stream.encoding or "utf-8", "replace"))
+    while data:
+        data = data[os.write(fd, data) :]
+
+
+def _ignore_update(
+    task_name: str, status: TaskStatus, progress: float, message: str
+) -> None:
+    """Per-update hook for display modes that do not print each update."""
+
+
+@functools.lru_cache(maxsize=1)
+def _utc_clock(second: int) -> str:
+    """Format an epoch second as UTC ``HH:MM:SS``, reused within that second."""
+    return time.strftime("%H:%M:%S", time.gmtime(second))
+
+
+@functools.lru_cache(maxsize=256)
+def _duration_text(whole_seconds: int) -> str:
+    """Format a whole number of seconds as ``MM:SS``."""
+    minutes, seconds = divmod(whole_seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def _format_duration(start_time: float | None, end_time: float | None) -> str:
+    """Format the time between start and end (or now) as ``MM:SS``."""
+    if not start_time:
+        return "--:--"
+    return _duration_text(int((end_time or time.time()) - start_time))
+
+
+@dataclass(slots=True)
 class TaskProgress:
     """Track progress information for a single task."""
 
@@ -31,6 +153,27 @@ class TaskProgress:
     end_time: float | None = None
     error: str | None = None
     dependencies: list[str] = field(default_factory=list)
+    # Rendered progress bar, cleared whenever progress or message changes
+    _cached_bar: str | None = field(default=None, repr=False, compare=False)
+
+    def set_progress(self, progress: float, message: str) -> None:
+        """Record progress and message, dropping the stale progress bar."""
+        if progress != self.progress or message != self.message:
+            self.progress = progress
+            self.message = message
+            self._cached_bar = None
+
+    @property
+    def progress_bar(self) -> str:
+        """Get the progress bar shown for this task while it runs."""
+        if self._cached_bar is None:
+            if self.progress > 0:
+                bar = _bar_for(_RICH_TASK_BARS, self.progress)
+                self._cached_bar = f"{bar} {self.progress:.0%}"
+            else:
+                bar = _RICH_TASK_BARS[0]
+                self._cached_bar = f"{bar} {self.message or 'Starting...'}"
+        return self._cached_bar
 
     @property
     def duration(self) -> float | None:
@@ -43,12 +186,83 @@ class TaskProgress:
     @property
     def duration_str(self) -> str:
         """Get formatted duration string."""
-        duration = self.duration
-        if duration is None:
-            return "--:--"
+        return _format_duration(self.start_time, self.end_time)
+
+    def row(self) -> "TaskRow":
+        """Copy the fields a frame renders (caller holds the display lock)."""
+        return TaskRow(
+            name=self.name,
+            status=self.status,
+            progress_bar=self.progress_bar,
+            error=self.error,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            dependencies=tuple(self.dependencies),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TaskRow:
+    """Plain copy of one task's display fields, safe to read without the lock."""
+
+    name: str
+    status: TaskStatus
+    progress_bar: str
+    error: str | None
+    start_time: float | None
+    end_time: float | None
+    dependencies: tuple[str, ...]
+
+    @property
+    def duration_str(self) -> str:
+        """Get formatted duration string, measured up to now while running."""
+        return _format_duration(self.start_time, self.end_time)
 
-        minutes, seconds = divmod(int(duration), 60)
-        return f"{minutes:02d}:{seconds:02d}"
+
+@dataclass(frozen=True, slots=True)
+class ProgressSnapshot:
+    """Immutable view of display state used to render one frame.
+
+    Tasks are copied into :class:`TaskRow` values under the display lock, so
+    rendering never reads a ``TaskProgress`` that another thread is updating.
+    """
+
+    counts: Mapping[TaskStatus, int]
+    running: tuple[TaskRow, ...]
+    recent_done: tuple[TaskRow, ...]  # newest first
+    waiting: tuple[TaskRow, ...]
+    waiting_version: int  # changes only when the waiting set does
+
+
+class _EscapeSequence(Control):
+    """Raw terminal escape sequence that rich has no ControlType for."""
+
+    def __init__(self, sequence: str) -> None:
+        self.segment = Segment(sequence, None, [])
+
+
+# DEC private mode 2026: terminals that support it paint everything between
+# these markers in one go; others ignore them
+_BEGIN_SYNCHRONIZED_UPDATE = _EscapeSequence("\x1b[?2026h")
+_END_SYNCHRONIZED_UPDATE = _EscapeSequence("\x1b[?2026l")
+
+
+class SynchronizedLive(Live):
+    """Live display that asks the terminal to paint each frame atomically."""
+
+    def refresh(self) -> None:
+        """Redraw the display inside a synchronized update."""
+        console = self.console
+        if not console.is_terminal or console.is_dumb_terminal:
+            super().refresh()
+            return
+
+        # Nested console contexts share one buffer, so the markers and the
+        # frame reach the terminal in a single write
+        with console:
+            console.control(_BEGIN_SYNCHRONIZED_UPDATE)
+            super().refresh()
+            console.control(_END_SYNCHRONIZED_UPDATE)
 
 
 class ProgressDisplayMode(Enum):
@@ -68,25 +282,80 @@ class ProgressDisplay:
         max_parallel: int,
         workflow_name: str = "Workflow",
         mode: ProgressDisplayMode = ProgressDisplayMode.RICH,
+        refresh_per_second: float = 4.0,
     ) -> None:
         self.total_tasks = total_tasks
         self.max_parallel = max_parallel
         self.workflow_name = workflow_name
         self.mode = mode
         self.logger = get_logger("progress")
+        # Rich mode redraws on this schedule rather than on every update
+        self.refresh_per_second = self._resolve_refresh_rate(refresh_per_second)
 
         # Task tracking
         self.task_progress: dict[str, TaskProgress] = {}
         self._lock = threading.Lock()
+
+        # Render bookkeeping kept up to date by update_task, so drawing a frame
+        # does not rescan every task
+        self._status_counts: dict[TaskStatus, int] = dict.fromkeys(TaskStatus, 0)
+        self._running_tasks: dict[str, TaskProgress] = {}
+        self._recent_done: deque[TaskProgress] = deque(maxlen=RECENT_DONE_SHOWN)
+        self._waiting_tasks: dict[str, TaskProgress] = {}
+        self._waiting_version = 0
+        self._failed_tasks: dict[str, TaskProgress] = {}
+        # Waiting panel with the waiting_version it was built from
+        self._waiting_panel: tuple[int, Panel] | None = None
+
+        # Simple-mode output waiting to be written, flushed at most once per
+        # refresh interval so bursts of updates share one write. A single
+        # flusher thread, started on first use, does the periodic writes.
+        self._pending_output: list[str] = []
+        self._write_lock = threading.Lock()
+        self._output_queued = threading.Condition(self._write_lock)
+        self._flusher: threading.Thread | None = None
+        self._flusher_stop = threading.Event()
+
+        # Frozen view handed to the renderer; writers only invalidate it, and
+        # rendering never holds the lock while building tables
+        self._current_snapshot: ProgressSnapshot | None = None
         self.start_time = time.time()
 
         # Rich components
         self.console = Console()
-        self.live: Live | None = None
+        # Layout tree built once; each frame only swaps the section contents
+        self._layout = Layout()
+        self._layout.split_column(
+            Layout(name="header", size=4),
+            Layout(name="active", size=10),
+            Layout(name="waiting", size=6),
+            Layout(name="summary", size=3),
+        )
+        self.live: SynchronizedLive | None = None
 
         # Check and adjust display mode based on terminal capabilities
         self._adjust_display_mode()
 
+        # Only simple mode prints per update; rich mode picks changes up on its
+        # next refresh. Choose the hook once instead of branching every update.
+        self._on_update: Callable[[str, TaskStatus, float, str], None] = (
+            self._print_simple_update
+            if self.mode == ProgressDisplayMode.SIMPLE
+            else _ignore_update
+        )
+
+    def _resolve_refresh_rate(self, requested: float) -> float:
+        """Get the rich refresh rate, honouring PROMPTER_PROGRESS_REFRESH_HZ."""
+        override = os.environ.get("PROMPTER_PROGRESS_REFRESH_HZ", "")
+        if override:
+            try:
+                requested = float(override)
+            except ValueError:
+                self.logger.warning(
+                    f"Ignoring invalid PROMPTER_PROGRESS_REFRESH_HZ={override!r}"
+                )
+        return min(max(requested, MIN_REFRESH_PER_SECOND), MAX_REFRESH_PER_SECOND)
+
     def _adjust_display_mode(self) -> None:
         """Adjust display mode based on environment and terminal capabilities."""
         # Check for forced mode via environment variable
@@ -111,24 +380,8 @@ class ProgressDisplay:
 
     def _supports_rich_display(self) -> bool:
         """Check if the terminal supports rich display."""
-        # Disable in CI environments (comprehensive list)
-        ci_env_vars = [
-            "CI",
-            "GITHUB_ACTIONS",
-            "GITLAB_CI",
-            "CIRCLECI",
-            "TRAVIS",
-            "JENKINS_URL",
-            "TEAMCITY_VERSION",
-            "BUILDKITE",
-            "DRONE",
-            "CODEBUILD_BUILD_ID",
-            "APPVEYOR",
-            "TF_BUILD",
-            "BITBUCKET_PIPELINES_UUID",
-            "BUDDY_WORKSPACE_ID",
-        ]
-        if any(os.environ.get(var) for var in ci_env_vars):
+        # Disable in CI environments
+        if any(os.environ.get(var) for var in _CI_ENV_VARS):
             self.logger.debug("CI environment detected, disabling rich display")
             return False
 
@@ -139,7 +392,7 @@ class ProgressDisplay:
 
         # Check terminal type
         term = os.environ.get("TERM", "").lower()
-        if term in ["dumb", "unknown", ""]:
+        if term in _UNSUPPORTED_TERMS:
             self.logger.debug(f"Unsupported terminal type: {term}")
             return False
 
@@ -150,15 +403,11 @@ class ProgressDisplay:
                 self.logger.debug("Modern Windows terminal detected")
                 return True
             # Legacy Windows console might not support rich
-            try:
-                import colorama
-
-                colorama.init()
+            if _init_colorama():
                 self.logger.debug("Windows console with colorama support")
                 return True
-            except ImportError:
-                self.logger.debug("Legacy Windows console without colorama")
-                return False
+            self.logger.debug("Legacy Windows console without colorama")
+            return False
 
         # Check for specific terminal emulators that might have issues
         term_program = os.environ.get("TERM_PROGRAM", "").lower()
@@ -173,24 +422,40 @@ class ProgressDisplay:
     def start(self) -> None:
         """Start the progress display."""
         if self.mode == ProgressDisplayMode.RICH:
-            self.live = Live(
-                self._create_layout(),
+            # Live pulls a fresh layout on each refresh, so task updates only
+            # need to record state. Frames are drawn on the alternate screen
+            # with the cursor hidden, so redraws never scroll the terminal.
+            self.live = SynchronizedLive(
                 console=self.console,
-                refresh_per_second=4,
+                refresh_per_second=self.refresh_per_second,
                 transient=False,
+                screen=True,
+                get_renderable=self._create_layout,
             )
             self.live.start()
         elif self.mode == ProgressDisplayMode.SIMPLE:
-            print(f"\nStarting {self.workflow_name} with {self.total_tasks} tasks...\n")
+            self._write_simple(
+                f"\nStarting {self.workflow_name} with {self.total_tasks} tasks...\n"
+            )
 
     def stop(self) -> None:
         """Stop the progress display."""
         if self.live:
             self.live.stop()
             self.live = None
+            # Leaving the alternate screen discards the last frame; print it
+            # once more so the final state stays in scrollback
+            self.console.print(
+                self._create_layout(),
+                height=sum(section.size or 0 for section in self._layout.children),
+            )
         elif self.mode == ProgressDisplayMode.SIMPLE:
             # Print final summary for simple mode
-            self._print_simple_summary()
+            try:
+                self._print_simple_summary()
+            finally:
+                self._stop_flusher()
+                self.flush()
 
     def update_task(
         self,
@@ -203,21 +468,24 @@ class ProgressDisplay:
     ) -> None:
         """Update task progress information."""
         with self._lock:
-            if task_name not in self.task_progress:
-                self.task_progress[task_name] = TaskProgress(
+            task = self.task_progress.get(task_name)
+            if task is None:
+                task = TaskProgress(
                     name=task_name, status=status, dependencies=dependencies or []
                 )
+                self.task_progress[task_name] = task
+                old_status = None
+            else:
+                old_status = task.status
 
-            task = self.task_progress[task_name]
             task.status = status
-            task.progress = progress
-            task.message = message
+            task.set_progress(progress, message)
 
             if error:
                 task.error = error
 
             # Track timing
-            if status == TaskStatus.RUNNING and task.start_time is None:
+            if status is TaskStatus.RUNNING and task.start_time is None:
                 task.start_time = time.time()
             elif (
                 status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
@@ -225,44 +493,79 @@ class ProgressDisplay:
             ):
                 task.end_time = time.time()
 
-        # Update display
-        if self.mode == ProgressDisplayMode.RICH and self.live:
-            self.live.update(self._create_layout())
-        elif self.mode == ProgressDisplayMode.SIMPLE:
-            self._print_simple_update(task_name, status, progress, message)
+            if status is not old_status:
+                self._record_transition(task, old_status)
+            self._current_snapshot = None
+
+        self._on_update(task_name, status, progress, message)
+
+    def _record_transition(
+        self, task: TaskProgress, old_status: TaskStatus | None
+    ) -> None:
+        """Update render bookkeeping for a status change (caller holds the lock)."""
+        if old_status is not None:
+            self._status_counts[old_status] -= 1
+        self._status_counts[task.status] += 1
+
+        if task.status is TaskStatus.RUNNING:
+            self._running_tasks[task.name] = task
+        else:
+            self._running_tasks.pop(task.name, None)
+
+        if task.status in WAITING_STATUSES:
+            if old_status not in WAITING_STATUSES:
+                self._waiting_tasks[task.name] = task
+                self._waiting_version += 1
+        elif self._waiting_tasks.pop(task.name, None) is not None:
+            self._waiting_version += 1
+
+        if task.status is TaskStatus.FAILED:
+            self._failed_tasks[task.name] = task
+        else:
+            self._failed_tasks.pop(task.name, None)
+
+        if task.status in DONE_STATUSES and old_status not in DONE_STATUSES:
+            self._recent_done.append(task)
+
+    def _snapshot(self) -> ProgressSnapshot:
+        """Get the current render snapshot, rebuilding it if tasks changed."""
+        with self._lock:
+            if self._current_snapshot is None:
+                self._current_snapshot = ProgressSnapshot(
+                    counts=MappingProxyType(dict(self._status_counts)),
+                    running=tuple(task.row() for task in self._running_tasks.values()),
+                    recent_done=tuple(
+                        task.row()
+                        for task in reversed(self._recent_done)
+                        if task.status in DONE_STATUSES
+                    ),
+                    waiting=tuple(task.row() for task in self._waiting_tasks.values()),
+                    waiting_version=self._waiting_version,
+                )
+            return self._current_snapshot
 
     def _create_layout(self) -> Layout:
         """Create the main layout for rich display."""
-        layout = Layout()
-
-        # Create main sections
-        layout.split_column(
-            Layout(self._create_header(), size=4),
-            Layout(self._create_active_tasks(), size=10),
-            Layout(self._create_waiting_tasks(), size=6),
-            Layout(self._create_summary(), size=3),
-        )
+        # One snapshot per frame keeps the panels consistent with each other
+        snapshot = self._snapshot()
+        layout = self._layout
+
+        layout["header"].update(self._create_header(snapshot))
+        layout["active"].update(self._create_active_tasks(snapshot))
+        layout["waiting"].update(self._create_waiting_tasks(snapshot))
+        layout["summary"].update(self._create_summary(snapshot))
 
         return layout
 
-    def _create_header(self) -> Panel:
+    def _create_header(self, snapshot: ProgressSnapshot) -> Panel:
         """Create header panel with workflow info."""
         elapsed = time.time() - self.start_time
         elapsed_str = str(timedelta(seconds=int(elapsed)))
 
         # Count tasks by status
-        with self._lock:
-            running = sum(
-                1 for t in self.task_progress.values() if t.status == TaskStatus.RUNNING
-            )
-            completed = sum(
-                1
-                for t in self.task_progress.values()
-                if t.status == TaskStatus.COMPLETED
-            )
-            failed = sum(
-                1 for t in self.task_progress.values() if t.status == TaskStatus.FAILED
-            )
+        running = snapshot.counts[TaskStatus.RUNNING]
+        completed = snapshot.counts[TaskStatus.COMPLETED]
+        failed = snapshot.counts[TaskStatus.FAILED]
 
         header_text = Text()
         header_text.append("Workflow: ", style="bold")
@@ -278,7 +581,7 @@ class ProgressDisplay:
             header_text, title="🚀 Parallel Task Execution", border_style="blue"
         )
 
-    def _create_active_tasks(self) -> Panel:
+    def _create_active_tasks(self, snapshot: ProgressSnapshot) -> Panel:
         """Create panel showing active tasks."""
         table = Table(title="Active Tasks", show_header=True, header_style="bold")
         table.add_column("Task", style="cyan", width=30)
@@ -286,121 +589,84 @@ class ProgressDisplay:
         table.add_column("Progress", width=30)
         table.add_column("Duration", width=10)
 
-        with self._lock:
-            # Show running tasks first
-            running_tasks = [
-                (name, task)
-                for name, task in self.task_progress.items()
-                if task.status == TaskStatus.RUNNING
-            ]
-
-            for name, task in running_tasks:
-                status_style = "blue"
-                status_text = "Running"
-
-                # Create progress bar
-                if task.progress > 0:
-                    filled = int(task.progress * 20)
-                    empty = 20 - filled
-                    progress_bar = f"[{'█' * filled}{'░' * empty}] {task.progress:.0%}"
-                else:
-                    progress_bar = (
-                        f"[░░░░░░░░░░░░░░░░░░░░] {task.message or 'Starting...'}"
-                    )
-
-                table.add_row(
-                    name,
-                    Text(status_text, style=status_style),
-                    progress_bar,
-                    task.duration_str,
-                )
+        # Show running tasks first
+        for task in snapshot.running:
+            table.add_row(
+                task.name,
+                _STATUS_RUNNING,
+                task.progress_bar,
+                task.duration_str,
+            )
 
-            # Show recently completed/failed tasks
-            recent_tasks = [
-                (name, task)
-                for name, task in self.task_progress.items()
-                if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED)
-            ]
-            recent_tasks.sort(key=lambda x: x[1].end_time or 0, reverse=True)
-
-            for name, task in recent_tasks[:5]:  # Show last 5
-                if task.status == TaskStatus.COMPLETED:
-                    status_style = "green"
-                    status_text = "✓ Complete"
-                    progress_bar = "[████████████████████] 100%"
-                else:
-                    status_style = "red"
-                    status_text = "✗ Failed"
-                    progress_bar = f"[████████████████████] {task.error or 'Error'}"
-
-                table.add_row(
-                    name,
-                    Text(status_text, style=status_style),
-                    Text(progress_bar, style=status_style),
-                    task.duration_str,
+        # Show recently completed/failed tasks, newest first
+        for task in snapshot.recent_done:
+            if task.status is TaskStatus.COMPLETED:
+                status_text = _STATUS_COMPLETE
+                progress_bar = _BAR_COMPLETE
+            else:
+                status_text = _STATUS_FAILED
+                progress_bar = Text(
+                    f"{_RICH_TASK_BARS[-1]} {task.error or 'Error'}", style="red"
                 )
 
+            table.add_row(
+                task.name,
+                status_text,
+                progress_bar,
+                task.duration_str,
+            )
+
         return Panel(table, border_style="green")
 
-    def _create_waiting_tasks(self) -> Panel:
+    def _create_waiting_tasks(self, snapshot: ProgressSnapshot) -> Panel:
         """Create panel showing waiting tasks."""
+        # The waiting set is usually static for long stretches, so reuse the
+        # panel until it changes
+        cached = self._waiting_panel
+        if cached is not None and cached[0] == snapshot.waiting_version:
+            return cached[1]
+
         content = Text()
+        waiting_tasks = snapshot.waiting
+
+        if waiting_tasks:
+            for task in waiting_tasks[:10]:  # Show up to 10
+                content.append(f"• {task.name}", style="yellow")
+                if task.dependencies:
+                    deps_str = ", ".join(task.dependencies)
+                    content.append(f" → waiting for: {deps_str}", style="dim")
+                content.append("\n")
+
+            if len(waiting_tasks) > 10:
+                content.append(f"... and {len(waiting_tasks) - 10} more", style="dim")
+        else:
+            content.append("No tasks waiting", style="dim")
+
+        panel = Panel(content, title="⏳ Waiting Tasks", border_style="yellow")
+        self._waiting_panel = (snapshot.waiting_version, panel)
+        return panel
+
+    def _create_summary(self, snapshot: ProgressSnapshot) -> Panel:
+        """Create summary panel with overall progress."""
+        completed = snapshot.counts[TaskStatus.COMPLETED]
+        failed = snapshot.counts[TaskStatus.FAILED]
 
-        with self._lock:
-            waiting_tasks = [
-                (name, task)
-                for name, task in self.task_progress.items()
-                if task.status in (TaskStatus.PENDING, TaskStatus.READY)
-            ]
-
-            if waiting_tasks:
-                for name, task in waiting_tasks[:10]:  # Show up to 10
-                    content.append(f"• {name}", style="yellow")
-                    if task.dependencies:
-                        deps_str = ", ".join(task.dependencies)
-                        content.append(f" → waiting for: {deps_str}", style="dim")
-                    content.append("\n")
-
-                if len(waiting_tasks) > 10:
-                    content.append(
-                        f"... and {len(waiting_tasks) - 10} more", style="dim"
-                    )
-            else:
-                content.append("No tasks waiting", style="dim")
+        # Overall progress
+        done_tasks = completed + failed
+        progress = done_tasks / self.total_tasks if self.total_tasks > 0 else 0
 
-        return Panel(content, title="⏳ Waiting Tasks", border_style="yellow")
+        # Create progress bar
+        progress_bar = f"{_bar_for(_RICH_SUMMARY_BARS, progress)} {progress:.0%}"
 
-    def _create_summary(self) -> Panel:
-        """Create summary panel with overall progress."""
-        with self._lock:
-            completed = sum(
-                1
-                for t in self.task_progress.values()
-                if t.status == TaskStatus.COMPLETED
-            )
-            failed = sum(
-                1 for t in self.task_progress.values() if t.status == TaskStatus.FAILED
-            )
-
-            # Overall progress
-            done_tasks = completed + failed
-            progress = done_tasks / self.total_tasks if self.total_tasks > 0 else 0
-
-            # Create progress bar
-            bar_width = 40
-            filled = int(progress * bar_width)
-            empty = bar_width - filled
-            progress_bar = f"[{'█' * filled}{'░' * empty}] {progress:.0%}"
-
-            # ETA calculation (simple estimate)
-            if done_tasks > 0 and progress < 1.0:
-                elapsed = time.time() - self.start_time
-                rate = done_tasks / elapsed
-                remaining = self.total_tasks - done_tasks
-                eta_seconds = remaining / rate if rate > 0 else 0
-                eta_str = str(timedelta(seconds=int(eta_seconds)))
-            else:
-                eta_str = "--:--"
+        # ETA calculation (simple estimate)
+        if done_tasks > 0 and progress < 1.0:
+            elapsed = time.time() - self.start_time
+            rate = done_tasks / elapsed
+            remaining = self.total_tasks - done_tasks
+            eta_seconds = remaining / rate if rate > 0 else 0
+            eta_str = str(timedelta(seconds=int(eta_seconds)))
+        else:
+            eta_str = "--:--"
 
         summary = Text()
         summary.append("Overall Progress: ", style="bold")
@@ -410,6 +676,51 @@ class ProgressDisplay:
 
         return Panel(summary, border_style="magenta")
 
+    def _write_simple(self, line: str) -> None:
+        """Queue a line of simple-mode output; queued lines are written together."""
+        with self._output_queued:
+            self._pending_output.append(line)
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="progress-flush", daemon=True
+                )
+                self._flusher.start()
+                # The daemon thread dies with the interpreter; write what is left
+                atexit.register(self.flush)
+            self._output_queued.notify()
+
+    def _flush_loop(self) -> None:
+        """Write queued output once per refresh interval until stopped."""
+        interval = 1 / self.refresh_per_second
+        while True:
+            with self._output_queued:
+                while not self._pending_output and not self._flusher_stop.is_set():
+                    self._output_queued.wait()
+            if self._flusher_stop.is_set():
+                return
+            # Let the rest of a burst queue up behind the first line
+            self._flusher_stop.wait(interval)
+            self.flush()
+
+    def _stop_flusher(self) -> None:
+        """Stop the flusher thread; queued output is left for flush()."""
+        with self._output_queued:
+            self._flusher_stop.set()
+            self._output_queued.notify_all()
+            flusher = self._flusher
+        if flusher is not None:
+            flusher.join()
+            atexit.unregister(self.flush)
+
+    def flush(self) -> None:
+        """Write any queued simple-mode output with a single write."""
+        with self._write_lock:
+            if not self._pending_output:
+                return
+            output = "\n".join(self._pending_output) + "\n"
+            self._pending_output.clear()
+            _write_stdout(output)
+
     def _print_simple_update(
         self, task_name: str, status: TaskStatus, progress: float, message: str
     ) -> None:
@@ -425,79 +736,77 @@ class ProgressDisplay:
         }
 
         symbol = status_symbols.get(status, "[?]")
-        timestamp = datetime.now(UTC).strftime("%H:%M:%S")
+        timestamp = _utc_clock(int(time.time()))
 
-        if status == TaskStatus.RUNNING:
+        if status is TaskStatus.RUNNING:
             if progress > 0:
                 # Show a simple progress bar
-                bar_width = 20
-                filled = int(progress * bar_width)
-                empty = bar_width - filled
-                progress_bar = f"[{'#' * filled}{'-' * empty}]"
-                print(
+                progress_bar = _bar_for(_SIMPLE_TASK_BARS, progress)
+                self._write_simple(
                     f"{timestamp} {symbol} {task_name}: {progress_bar} {progress:.0%} - {message}"
                 )
             else:
-                print(f"{timestamp} {symbol} {task_name}: {message or 'Starting...'}")
-        elif status == TaskStatus.COMPLETED:
+                self._write_simple(
+                    f"{timestamp} {symbol} {task_name}: {message or 'Starting...'}"
+                )
+        elif status is TaskStatus.COMPLETED:
             task = self.task_progress.get(task_name)
             duration = f" ({task.duration_str})" if task and task.duration else ""
-            print(f"{timestamp} {symbol} {task_name}: Completed{duration}")
-        elif status == TaskStatus.FAILED:
+            self._write_simple(f"{timestamp} {symbol} {task_name}: Completed{duration}")
+            # Finished tasks are written straight away, in order with log output
+            self.flush()
+        elif status is TaskStatus.FAILED:
             task = self.task_progress.get(task_name)
             error_msg = f" - {task.error[:50]}..." if task and task.error else ""
-            print(f"{timestamp} {symbol} {task_name}: Failed{error_msg}")
-        elif status == TaskStatus.READY:
-            print(f"{timestamp} {symbol} {task_name}: Ready (dependencies satisfied)")
-        elif status == TaskStatus.PENDING:
+            self._write_simple(f"{timestamp} {symbol} {task_name}: Failed{error_msg}")
+            self.flush()
+        elif status is TaskStatus.READY:
+            self._write_simple(
+                f"{timestamp} {symbol} {task_name}: Ready (dependencies satisfied)"
+            )
+        elif status is TaskStatus.PENDING:
             task = self.task_progress.get(task_name)
             if task and task.dependencies:
                 deps = ", ".join(task.dependencies[:3])
                 if len(task.dependencies) > 3:
                     deps += f" +{len(task.dependencies) - 3} more"
-                print(f"{timestamp} {symbol} {task_name}: Waiting for {deps}")
+                self._write_simple(
+                    f"{timestamp} {symbol} {task_name}: Waiting for {deps}"
+                )
 
     def _print_simple_summary(self) -> None:
         """Print final summary for simple mode."""
-        with self._lock:
-            completed = sum(
-                1
-                for t in self.task_progress.values()
-                if t.status == TaskStatus.COMPLETED
-            )
-            failed = sum(
-                1 for t in self.task_progress.values() if t.status == TaskStatus.FAILED
-            )
-            skipped = sum(
-                1 for t in self.task_progress.values() if t.status == TaskStatus.SKIPPED
-            )
+        snapshot = self._snapshot()
+        completed = snapshot.counts[TaskStatus.COMPLETED]
+        failed = snapshot.counts[TaskStatus.FAILED]
+        skipped = snapshot.counts[TaskStatus.SKIPPED]
 
+        with self._lock:
             elapsed = time.time() - self.start_time
             elapsed_str = str(timedelta(seconds=int(elapsed)))
 
-            print(f"\n{'=' * 60}")
-            print(f"Workflow Summary: {self.workflow_name}")
-            print(f"{'=' * 60}")
-            print(f"Total tasks:     {self.total_tasks}")
-            print(
+            self._write_simple(f"\n{'=' * 60}")
+            self._write_simple(f"Workflow Summary: {self.workflow_name}")
+            self._write_simple(f"{'=' * 60}")
+            self._write_simple(f"Total tasks:     {self.total_tasks}")
+            self._write_simple(
                 f"Completed:       {completed} ({completed / self.total_tasks * 100:.1f}%)"
             )
             if failed > 0:
-                print(
+                self._write_simple(
                     f"Failed:          {failed} ({failed / self.total_tasks * 100:.1f}%)"
                 )
             if skipped > 0:
-                print(f"Skipped:         {skipped}")
-            print(f"Execution time:  {elapsed_str}")
-            print(f"{'=' * 60}")
+                self._write_simple(f"Skipped:         {skipped}")
+            self._write_simple(f"Execution time:  {elapsed_str}")
+            self._write_simple(f"{'=' * 60}")
 
             # List failed tasks if any
             if failed > 0:
-                print("\nFailed tasks:")
-                for name, task in self.task_progress.items():
-                    if task.status == TaskStatus.FAILED:
-                        error = task.error[:60] if task.error else "Unknown error"
-                        print(f"  - {name}: {error}")
+                self._write_simple("\nFailed tasks:")
+                for name, task in self._failed_tasks.items():
+                    error = task.error[:60] if task.error else "Unknown error"
+                    self._write_simple(f"  - {name}: {error}")
 
     def __enter__(self) -> "ProgressDisplay":
         """Context manager entry."""
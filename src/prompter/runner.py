@@ -4,16 +4,29 @@ import anyio
 import shlex
 import subprocess
 import time
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 from claude_code_sdk import ClaudeCodeOptions, ResultMessage, query
 
 from .config import PrompterConfig, TaskConfig
-from .constants import DEFAULT_VERIFICATION_TIMEOUT
+from .constants import (
+    DEFAULT_VERIFICATION_TIMEOUT,
+    ERROR_SUMMARY_LENGTH,
+    VERIFICATION_OUTPUT_LIMIT,
+    VERIFICATION_POLL_INTERVAL,
+)
 from .logging import get_logger
 
 
+def _output_tail(text: str, limit: int = VERIFICATION_OUTPUT_LIMIT) -> str:
+    """Keep only the last ``limit`` characters of command output."""
+    if len(text) <= limit:
+        return text
+    return f"[{len(text) - limit} earlier characters truncated]\n{text[-limit:]}"
+
+
 class TaskResult:
     """Result of a task execution."""
 
@@ -36,6 +49,11 @@ class TaskResult:
         self.session_id = session_id
         self.timestamp = time.time()
 
+    @cached_property
+    def error_short(self) -> str:
+        """Get the error truncated for progress displays."""
+        return self.error[:ERROR_SUMMARY_LENGTH]
+
 
 class TaskRunner:
     """Executes tasks using Claude Code SDK."""
@@ -203,21 +221,8 @@ class TaskRunner:
                     )
                 continue
 
-            # Wait for the check interval before verification
-            if self.config.check_interval > 0:
-                self.logger.debug(
-                    f"Waiting {self.config.check_interval}s before verification"
-                )
-                time.sleep(self.config.check_interval)
-
             # Verify the task was successful
-            self.logger.debug(f"Running verification command: {task.verify_command}")
-            verify_start_time = time.time()
-            verify_result = self._verify_task(task)
-            verify_duration = time.time() - verify_start_time
-            self.logger.debug(
-                f"Verification completed in {verify_duration:.2f}s, success={verify_result[0]}"
-            )
+            verify_result = self._verify_after_check_interval(task)
 
             if verify_result[0]:
                 self.logger.debug(
@@ -407,39 +412,50 @@ class TaskRunner:
         except Exception:
             raise
 
+    def _verify_after_check_interval(self, task: TaskConfig) -> tuple[bool, str]:
+        """Verify a task once check_interval has passed since Claude finished.
+
+        With ``poll_verification`` enabled the command runs straight away and is
+        re-run every VERIFICATION_POLL_INTERVAL seconds until it passes or the
+        interval is used up, so tasks that settle quickly skip the full wait.
+        """
+        check_interval = self.config.check_interval
+        deadline = time.monotonic() + check_interval
+        if check_interval > 0 and not self.config.poll_verification:
+            self.logger.debug(f"Waiting {check_interval}s before verification")
+            time.sleep(check_interval)
+
+        while True:
+            self.logger.debug(f"Running verification command: {task.verify_command}")
+            verify_start_time = time.time()
+            verify_result = self._verify_task(task)
+            verify_duration = time.time() - verify_start_time
+            self.logger.debug(
+                f"Verification completed in {verify_duration:.2f}s, success={verify_result[0]}"
+            )
+
+            remaining = deadline - time.monotonic()
+            if verify_result[0] or remaining <= 0 or not self.config.poll_verification:
+                return verify_result
+            self.logger.debug(
+                f"Verification not passing yet, re-checking ({remaining:.1f}s left)"
+            )
+            time.sleep(min(VERIFICATION_POLL_INTERVAL, remaining))
+
     def _verify_task(self, task: TaskConfig) -> tuple[bool, str]:
         """Verify that a task completed successfully."""
         try:
-            # Detect if command requires shell interpretation
-            shell_indicators = [
-                "|",
-                ">",
-                "<",
-                ">>",
-                "&&",
-                "||",
-                ";",
-                "$",
-                "`",
-                "*",
-                "?",
-                "[",
-                "]",
-            ]
-            needs_shell = any(
-                indicator in task.verify_command for indicator in shell_indicators
-            )
-
-            if needs_shell:
+            if task.verify_argv is None:
+                command = task.verify_command
+                if not isinstance(command, str):
+                    command = shlex.join(command)
                 self.logger.debug(
-                    f"Shell features detected in command: {task.verify_command[:100]}... "
-                    f"Using shell mode for execution."
+                    f"Running verification through the shell: {command[:100]}..."
                 )
 
-                # Use shell mode for commands with shell features
                 # Security note: Commands come from trusted config files, not user input
                 result = subprocess.run(
-                    task.verify_command,
+                    command,
                     shell=True,
                     check=False,
                     cwd=self.current_directory,
@@ -448,38 +464,23 @@ class TaskRunner:
                     timeout=DEFAULT_VERIFICATION_TIMEOUT,
                 )
             else:
-                # Parse the command for simple execution
-                try:
-                    cmd_args = shlex.split(task.verify_command)
-                except ValueError as e:
-                    # Handle cases where shlex.split fails (e.g., unmatched quotes)
-                    self.logger.warning(
-                        f"Failed to parse command with shlex: {e}. "
-                        f"Falling back to shell mode."
-                    )
-                    # Fall back to shell mode if parsing fails
-                    result = subprocess.run(
-                        task.verify_command,
-                        shell=True,
-                        check=False,
-                        cwd=self.current_directory,
-                        capture_output=True,
-                        text=True,
-                        timeout=DEFAULT_VERIFICATION_TIMEOUT,
-                    )
-                else:
-                    # Execute without shell for simple commands
-                    result = subprocess.run(
-                        cmd_args,
-                        check=False,
-                        cwd=self.current_directory,
-                        capture_output=True,
-                        text=True,
-                        timeout=DEFAULT_VERIFICATION_TIMEOUT,
-                    )
+                # Execute without shell for simple commands
+                result = subprocess.run(
+                    task.verify_argv,
+                    check=False,
+                    cwd=self.current_directory,
+                    capture_output=True,
+                    text=True,
+                    timeout=DEFAULT_VERIFICATION_TIMEOUT,
+                )
 
             success = result.returncode == task.verify_success_code
-            output = f"Exit code: {result.returncode}\\nStdout: {result.stdout}\\nStderr: {result.stderr}"
+            # Results and the state file hold on to this, so keep just the tail
+            stdout = _output_tail(result.stdout)
+            stderr = _output_tail(result.stderr)
+            output = (
+                f"Exit code: {result.returncode}\\nStdout: {stdout}\\nStderr: {stderr}"
+            )
 
             self.logger.debug(
                 f"Verification command completed: exit_code={result.returncode}, "
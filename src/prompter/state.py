@@ -1,18 +1,38 @@
 """State management for tracking task progress and persistence."""
 
 import json
+import os
 import threading
 import time
 import contextlib
+from collections import Counter
 from pathlib import Path
-from typing import Any
-
+from typing import IO, TYPE_CHECKING, Any, Self
+
+from .constants import (
+    HISTORY_TEXT_LIMIT,
+    RESULTS_HISTORY_LIMIT,
+    STATE_FLUSH_INTERVAL,
+    STATE_MAX_PENDING_SAVES,
+    STATE_STREAM_THRESHOLD,
+    STATE_WRITE_BUFFER_SIZE,
+)
 from .logging import get_logger
-from .runner import TaskResult
+
+if TYPE_CHECKING:
+    from .runner import TaskResult
+
+_LOG = get_logger("state")
 
 
 class TaskState:
-    """State information for a single task."""
+    """State information for a single task.
+
+    ``to_dict()`` caches its result until an attribute is next assigned, so
+    saving many unchanged tasks does not rebuild their dictionaries.
+    """
+
+    _cached_dict: dict[str, Any] | None = None
 
     def __init__(
         self,
@@ -32,17 +52,29 @@ class TaskState:
         self.error_message = error_message
         self.claude_session_id = claude_session_id
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_cached_dict", None)
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "name": self.name,
-            "status": self.status,
-            "attempts": self.attempts,
-            "last_attempt": self.last_attempt,
-            "last_success": self.last_success,
-            "error_message": self.error_message,
-            "claude_session_id": self.claude_session_id,
-        }
+        """Convert to dictionary for JSON serialization.
+
+        The returned dictionary is shared until the state changes and must
+        not be modified.
+        """
+        data = self._cached_dict
+        if data is None:
+            data = {
+                "name": self.name,
+                "status": self.status,
+                "attempts": self.attempts,
+                "last_attempt": self.last_attempt,
+                "last_success": self.last_success,
+                "error_message": self.error_message,
+                "claude_session_id": self.claude_session_id,
+            }
+            object.__setattr__(self, "_cached_dict", data)
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TaskState":
@@ -59,19 +91,53 @@ class TaskState:
 
 
 class StateManager:
-    """Manages persistent state for task execution with thread-safe operations."""
+    """Manages persistent state for task execution with thread-safe operations.
 
-    def __init__(self, state_file: Path | None = None) -> None:
+    Each update is written to the state file straight away. Inside a
+    ``with state_manager:`` block, updates that leave a task's status
+    unchanged are coalesced instead: the file is rewritten at most every
+    ``flush_interval`` seconds or ``max_pending`` updates, and once more when
+    the block exits. Status transitions are always written immediately, so
+    ``--status`` and resumed runs never see a running task as pending.
+
+    Saves replace the file atomically but are not fsynced; pass
+    ``durable=True`` (``--durable-state`` on the command line) to fsync each
+    save before it replaces the old file.
+
+    Only the latest ``history_limit`` results are kept in the state file so
+    saves stay a bounded size; older results are appended to a JSON-lines
+    history log next to it.
+    """
+
+    def __init__(
+        self,
+        state_file: Path | None = None,
+        *,
+        flush_interval: float = STATE_FLUSH_INTERVAL,
+        max_pending: int = STATE_MAX_PENDING_SAVES,
+        durable: bool = False,
+        history_limit: int = RESULTS_HISTORY_LIMIT,
+    ) -> None:
         self.state_file = state_file or Path(".prompter_state.json")
+        self.durable = durable
+        self.history_limit = history_limit
+        self.history_log_file = self.state_file.with_suffix(".log.jsonl")
         self.session_id = str(int(time.time()))
         self.start_time = time.time()
         self.task_states: dict[str, TaskState] = {}
         self.results_history: list[dict[str, Any]] = []
-        self.logger = get_logger("state")
+        self.logger = _LOG
 
         # Thread safety lock for concurrent access
         self._lock = threading.Lock()
 
+        # Write coalescing, active while inside a ``with`` block
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._batch_depth = 0
+        self._pending_saves = 0
+        self._last_save = time.monotonic()
+
         # Load existing state if available
         self._load_state()
 
@@ -80,8 +146,9 @@ class StateManager:
         if self.state_file.exists():
             self.logger.debug(f"Loading state from {self.state_file}")
             try:
-                with open(self.state_file) as f:
-                    data = json.load(f)
+                # Read the whole file at once and parse from memory
+                with open(self.state_file, "rb") as f:
+                    data = json.loads(f.read())
 
                 self.logger.debug(
                     f"State file loaded successfully, found {len(data.get('task_states', []))} task states"
@@ -97,11 +164,12 @@ class StateManager:
 
                 # Load results history
                 self.results_history = data.get("results_history", [])
+                self._trim_history()
                 self.logger.debug(
                     f"Loaded {len(self.results_history)} results from history"
                 )
 
-            except (json.JSONDecodeError, KeyError) as e:
+            except (OSError, json.JSONDecodeError, KeyError) as e:
                 self.logger.warning(f"Could not load state file: {e}")
         else:
             self.logger.debug(f"No existing state file found at {self.state_file}")
@@ -116,6 +184,8 @@ class StateManager:
                 "task_states": [state.to_dict() for state in self.task_states.values()],
                 "results_history": self.results_history,
             }
+            self._pending_saves = 0
+            self._last_save = time.monotonic()
 
             self.logger.debug(
                 f"Saving state to {self.state_file}: {len(self.task_states)} tasks, {len(self.results_history)} results"
@@ -124,8 +194,18 @@ class StateManager:
             try:
                 # Use atomic write to prevent corruption during concurrent access
                 temp_file = self.state_file.with_suffix(".tmp")
-                with open(temp_file, "w") as f:
-                    json.dump(data, f, indent=2)
+                # Large histories are encoded incrementally through a big
+                # buffer so the whole document never sits in memory; smaller
+                # ones are encoded up front and written in one call
+                if len(self.results_history) > STATE_STREAM_THRESHOLD:
+                    with open(temp_file, "w", buffering=STATE_WRITE_BUFFER_SIZE) as f:
+                        for chunk in json.JSONEncoder(indent=2).iterencode(data):
+                            f.write(chunk)
+                        self._sync(f)
+                else:
+                    with open(temp_file, "w") as f:
+                        f.write(json.dumps(data, indent=2))
+                        self._sync(f)
                 temp_file.replace(self.state_file)
                 self.logger.debug(f"State saved successfully to {self.state_file}")
             except OSError as e:
@@ -135,6 +215,12 @@ class StateManager:
                     with contextlib.suppress(Exception):
                         temp_file.unlink()
 
+    def _sync(self, f: IO[str]) -> None:
+        """Force written state to disk when durable writes are enabled."""
+        if self.durable:
+            f.flush()
+            os.fsync(f.fileno())
+
     def get_task_state(self, task_name: str) -> TaskState:
         """Get state for a task, creating if it doesn't exist (thread-safe)."""
         with self._lock:
@@ -143,8 +229,11 @@ class StateManager:
                 self.task_states[task_name] = TaskState(task_name)
             return self.task_states[task_name]
 
-    def update_task_state(self, result: TaskResult) -> None:
-        """Update task state based on execution result (thread-safe)."""
+    def update_task_state(self, result: "TaskResult", *, save: bool = True) -> None:
+        """Update task state based on execution result (thread-safe).
+
+        Pass ``save=False`` to batch several updates before one save_state().
+        """
         with self._lock:
             self.logger.debug(
                 f"Updating task state for {result.task_name}: success={result.success}, attempts={result.attempts}"
@@ -181,25 +270,25 @@ class StateManager:
                 )
 
             # Add to results history
-            self.results_history.append(
-                {
-                    "session_id": self.session_id,
-                    "claude_session_id": result.session_id,
-                    "task_name": result.task_name,
-                    "success": result.success,
-                    "attempts": result.attempts,
-                    "timestamp": result.timestamp,
-                    "output": result.output[:500]
-                    if result.output
-                    else "",  # Truncate for storage
-                    "error": result.error[:500] if result.error else "",
-                }
-            )
+            entry = {
+                "session_id": self.session_id,
+                "claude_session_id": result.session_id,
+                "task_name": result.task_name,
+                "success": result.success,
+                "attempts": result.attempts,
+                "timestamp": result.timestamp,
+                # Truncate for storage
+                "output": (result.output or "")[:HISTORY_TEXT_LIMIT],
+                "error": (result.error or "")[:HISTORY_TEXT_LIMIT],
+            }
+            self.results_history.append(entry)
+            self._trim_history()
 
         # Save state after releasing lock to minimize contention
-        self.save_state()
+        if save:
+            self._request_save(transition=state.status != old_status)
 
-    def mark_task_running(self, task_name: str) -> None:
+    def mark_task_running(self, task_name: str, *, save: bool = True) -> None:
         """Mark a task as currently running (thread-safe)."""
         with self._lock:
             # Get task state without lock since we already have it
@@ -214,32 +303,72 @@ class StateManager:
             )
 
         # Save state after releasing lock
-        self.save_state()
+        if save:
+            self._request_save(transition=old_status != "running")
+
+    def _trim_history(self) -> None:
+        """Move results beyond history_limit to the history log (caller holds the lock)."""
+        overflow = len(self.results_history) - self.history_limit
+        if overflow <= 0:
+            return
+        evicted = self.results_history[:overflow]
+        del self.results_history[:overflow]
+        self._append_history(evicted)
+
+    def _append_history(self, entries: list[dict[str, Any]]) -> None:
+        """Append results to the JSON-lines history log."""
+        try:
+            with open(self.history_log_file, "a") as f:
+                f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+        except OSError as e:
+            self.logger.warning(f"Could not append to history log: {e}")
+
+    def _request_save(self, *, transition: bool) -> None:
+        """Save now, or defer a save that changed no status while batching."""
+        with self._lock:
+            if self._batch_depth and not transition:
+                self._pending_saves += 1
+                due = (
+                    self._pending_saves >= self.max_pending
+                    or time.monotonic() - self._last_save >= self.flush_interval
+                )
+            else:
+                due = True
+        if due:
+            self.save_state()
+
+    def flush(self) -> None:
+        """Write any deferred updates to the state file."""
+        if self._pending_saves:
+            self.save_state()
+
+    def __enter__(self) -> Self:
+        """Start coalescing state file writes."""
+        with self._lock:
+            self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        """Stop coalescing and write anything still pending."""
+        with self._lock:
+            self._batch_depth -= 1
+            outermost = self._batch_depth == 0
+        if outermost:
+            self.flush()
 
     def get_summary(self) -> dict[str, Any]:
         """Get a summary of current state (thread-safe)."""
         with self._lock:
-            completed = sum(
-                1 for state in self.task_states.values() if state.status == "completed"
-            )
-            failed = sum(
-                1 for state in self.task_states.values() if state.status == "failed"
-            )
-            running = sum(
-                1 for state in self.task_states.values() if state.status == "running"
-            )
-            pending = sum(
-                1 for state in self.task_states.values() if state.status == "pending"
-            )
+            counts = Counter(state.status for state in self.task_states.values())
 
             return {
                 "session_id": self.session_id,
                 "start_time": self.start_time,
                 "total_tasks": len(self.task_states),
-                "completed": completed,
-                "failed": failed,
-                "running": running,
-                "pending": pending,
+                "completed": counts["completed"],
+                "failed": counts["failed"],
+                "running": counts["running"],
+                "pending": counts["pending"],
                 "total_results": len(self.results_history),
             }
 
@@ -254,6 +383,9 @@ class StateManager:
             if self.state_file.exists():
                 self.logger.debug(f"Deleting state file: {self.state_file}")
                 self.state_file.unlink()
+            if self.history_log_file.exists():
+                self.logger.debug(f"Deleting history log: {self.history_log_file}")
+                self.history_log_file.unlink()
             self.logger.debug("State cleared successfully")
 
     def get_failed_tasks(self) -> list[str]:
@@ -275,14 +407,19 @@ class StateManager:
             ]
 
     def get_previous_session_id(self, current_task_name: str) -> str | None:
-        """Get the Claude session ID from the most recent task execution before the current one."""
+        """Get the Claude session ID from the most recent task execution before the current one (thread-safe)."""
+        # Snapshot under the lock; the history is appended to and trimmed
+        # from other threads while tasks run
+        with self._lock:
+            history = list(self.results_history)
+
         # If no history, return None
-        if not self.results_history:
+        if not history:
             return None
 
         # Find the most recent entry with a claude_session_id
         # (regardless of success status since user might want to continue from a "failed" attempt)
-        for entry in reversed(self.results_history):
+        for entry in reversed(history):
             claude_session_id = entry.get("claude_session_id")
             if claude_session_id and entry.get("task_name") != current_task_name:
                 # This is a different task with a session ID, return it
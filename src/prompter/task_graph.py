@@ -4,6 +4,7 @@ This module implements a Directed Acyclic Graph (DAG) for managing task dependen
 and provides algorithms for validation, topological sorting, and parallel execution scheduling.
 """
 
+import operator
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from typing import Any
@@ -27,6 +28,8 @@ class GraphNode:
     task: Any  # Will be TaskConfig when integrated
     dependencies: set[str] = field(default_factory=set)
     dependents: set[str] = field(default_factory=set)
+    # Sorted copy of dependencies, refreshed by TaskGraph.validate()
+    dependencies_sorted: tuple[str, ...] = ()
     in_degree: int = 0
     out_degree: int = 0
 
@@ -46,6 +49,17 @@ class TaskGraph:
         self._reverse_adjacency_list: dict[str, set[str]] = defaultdict(set)
         self._is_validated = False
         self._topological_order: list[str] = []
+        # Views derived from the validated graph, dropped on any modification
+        self._levels_cache: list[list[str]] | None = None
+        self._critical_path_cache: list[str] | None = None
+        self._ascii_cache: str | None = None
+
+    def _invalidate(self) -> None:
+        """Forget validation and derived views after the graph changes."""
+        self._is_validated = False
+        self._levels_cache = None
+        self._critical_path_cache = None
+        self._ascii_cache = None
 
     def add_task(
         self, name: str, task: Any, dependencies: list[str] | None = None
@@ -58,19 +72,29 @@ class TaskGraph:
         node = GraphNode(name=name, task=task)
         self.nodes[name] = node
 
+        # Link tasks that named this one as a dependency before it existed
+        for dependent in self._adjacency_list.get(name, ()):
+            node.dependents.add(dependent)
+            node.out_degree += 1
+            self.nodes[dependent].in_degree += 1
+
         # Add dependencies
         if dependencies:
             for dep in dependencies:
                 self.add_dependency(name, dep)
 
-        self._is_validated = False
+        self._invalidate()
 
     def add_dependency(self, task_name: str, dependency_name: str) -> None:
         """Add a dependency relationship between tasks."""
         if task_name not in self.nodes:
             raise ValueError(f"Task '{task_name}' not found in graph")
 
-        # Allow forward references - dependency might be added later
+        if dependency_name in self.nodes[task_name].dependencies:
+            return
+
+        # Allow forward references - dependency might be added later, and
+        # add_task links it up then
         self.nodes[task_name].dependencies.add(dependency_name)
         self._adjacency_list[dependency_name].add(task_name)
         self._reverse_adjacency_list[task_name].add(dependency_name)
@@ -81,7 +105,7 @@ class TaskGraph:
             self.nodes[task_name].in_degree += 1
             self.nodes[dependency_name].out_degree += 1
 
-        self._is_validated = False
+        self._invalidate()
 
     def validate(self) -> None:
         """Validate the graph structure (check for cycles and missing dependencies)."""
@@ -105,6 +129,9 @@ class TaskGraph:
         # Compute topological order
         self._compute_topological_order()
 
+        for node in self.nodes.values():
+            node.dependencies_sorted = tuple(sorted(node.dependencies))
+
         self._is_validated = True
 
     def _detect_cycles(self) -> None:
@@ -112,25 +139,32 @@ class TaskGraph:
         # Colors: WHITE (0) = unvisited, GRAY (1) = visiting, BLACK (2) = visited
         colors = dict.fromkeys(self.nodes, 0)
 
-        def dfs(node: str, path: list[str]) -> None:
-            colors[node] = 1  # Mark as visiting (GRAY)
-            path.append(node)
-
-            for neighbor in self._adjacency_list[node]:
-                if colors[neighbor] == 1:  # Found a back edge (cycle)
-                    # Extract the cycle path
-                    cycle_start = path.index(neighbor)
-                    cycle = [*path[cycle_start:], neighbor]
-                    raise CycleDetectedError(cycle)
-                if colors[neighbor] == 0:  # Unvisited
-                    dfs(neighbor, path.copy())
-
-            colors[node] = 2  # Mark as visited (BLACK)
-
-        # Run DFS from all unvisited nodes
-        for node in self.nodes:
-            if colors[node] == 0:
-                dfs(node, [])
+        # Iterative DFS: each stack frame is a node and the iterator over its
+        # remaining neighbours, and ``path`` mirrors the stack so a back edge
+        # can be turned into the cycle without copying paths per edge
+        for root in self.nodes:
+            if colors[root] != 0:
+                continue
+            colors[root] = 1  # Mark as visiting (GRAY)
+            path = [root]
+            stack = [iter(self._adjacency_list[root])]
+
+            while stack:
+                for neighbor in stack[-1]:
+                    if colors[neighbor] == 1:  # Found a back edge (cycle)
+                        # Extract the cycle path
+                        cycle_start = path.index(neighbor)
+                        cycle = [*path[cycle_start:], neighbor]
+                        raise CycleDetectedError(cycle)
+                    if colors[neighbor] == 0:  # Unvisited
+                        colors[neighbor] = 1
+                        path.append(neighbor)
+                        stack.append(iter(self._adjacency_list[neighbor]))
+                        break
+                else:
+                    # All neighbours done
+                    colors[path.pop()] = 2  # Mark as visited (BLACK)
+                    stack.pop()
 
     def _compute_topological_order(self) -> None:
         """Compute a topological ordering of tasks using Kahn's algorithm."""
@@ -165,35 +199,51 @@ class TaskGraph:
         ready = []
 
         for name, node in self.nodes.items():
-            if name not in completed and all(
-                dep in completed for dep in node.dependencies
-            ):
+            if name not in completed and completed.issuperset(node.dependencies):
                 ready.append(name)
 
         return ready
 
+    def scheduler(self) -> "TaskScheduler":
+        """Create a scheduler that releases tasks as their dependencies complete."""
+        if not self._is_validated:
+            self.validate()
+        return TaskScheduler(self)
+
     def get_execution_levels(self) -> list[list[str]]:
         """Get tasks grouped by execution level (tasks in same level can run in parallel)."""
+        if self._levels_cache is not None:
+            return [list(level) for level in self._levels_cache]
+
         if not self._is_validated:
             self.validate()
 
+        # Leveled Kahn's algorithm: each level is the set of tasks whose last
+        # dependency was in the previous level. Tasks keep their insertion
+        # order within a level.
+        position = {name: i for i, name in enumerate(self.nodes)}
+        in_degree = {name: len(node.dependencies) for name, node in self.nodes.items()}
         levels = []
-        completed: set[str] = set()
+        frontier = [name for name, degree in in_degree.items() if degree == 0]
 
-        while len(completed) < len(self.nodes):
-            # Get all tasks that can run now
-            ready = self.get_ready_tasks(completed)
-            if not ready:
-                # This shouldn't happen if graph is valid
-                break
+        while frontier:
+            levels.append(frontier)
+            next_frontier = []
+            for task in frontier:
+                for dependent in self._adjacency_list[task]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_frontier.append(dependent)
+            frontier = sorted(next_frontier, key=position.__getitem__)
 
-            levels.append(ready)
-            completed.update(ready)
-
-        return levels
+        self._levels_cache = levels
+        return [list(level) for level in levels]
 
     def get_critical_path(self) -> list[str]:
         """Find the critical path (longest dependency chain) in the graph."""
+        if self._critical_path_cache is not None:
+            return list(self._critical_path_cache)
+
         if not self._is_validated:
             self.validate()
 
@@ -209,7 +259,7 @@ class TaskGraph:
                     parent[dependent] = task
 
         # Find the end of the longest path
-        end_task = max(longest_path_to, key=lambda x: longest_path_to[x])
+        end_task, _ = max(longest_path_to.items(), key=operator.itemgetter(1))
 
         # Reconstruct the path
         path = []
@@ -218,10 +268,18 @@ class TaskGraph:
             path.append(current)
             current = parent[current]
 
-        return list(reversed(path))
+        path.reverse()
+        self._critical_path_cache = path
+        return list(path)
 
     def visualize_ascii(self) -> str:
-        """Generate a simple ASCII visualization of the graph."""
+        """Generate a simple ASCII visualization of the graph.
+
+        The rendering is cached until the graph is modified.
+        """
+        if self._ascii_cache is not None:
+            return self._ascii_cache
+
         if not self._is_validated:
             self.validate()
 
@@ -232,7 +290,7 @@ class TaskGraph:
         for i, level in enumerate(levels):
             lines.append(f"\\nLevel {i} (can run in parallel):")
             for task in sorted(level):
-                deps = sorted(self.nodes[task].dependencies)
+                deps = self.nodes[task].dependencies_sorted
                 if deps:
                     lines.append(f"  {task} <- {', '.join(deps)}")
                 else:
@@ -243,4 +301,65 @@ class TaskGraph:
         if len(critical_path) > 1:
             lines.append(f"\\nCritical Path: {' -> '.join(critical_path)}")
 
-        return "\\n".join(lines)
+        self._ascii_cache = "\\n".join(lines)
+        return self._ascii_cache
+
+
+class TaskScheduler:
+    """Tracks remaining dependency counts to hand out ready tasks incrementally.
+
+    Unlike :meth:`TaskGraph.get_ready_tasks`, which rescans every task, each
+    completion only touches the dependents of the finished task. Newly ready
+    tasks are also queued, so a scheduler loop can alternate between
+    ``mark_completed()`` and ``pop_ready()``.
+    """
+
+    def __init__(self, graph: TaskGraph) -> None:
+        self._remaining = {
+            name: len(node.dependencies) for name, node in graph.nodes.items()
+        }
+        # Dependents listed in graph insertion order, so releases are
+        # deterministic rather than following set iteration order
+        self._dependents: dict[str, list[str]] = {name: [] for name in graph.nodes}
+        for name, node in graph.nodes.items():
+            for dependency in node.dependencies:
+                self._dependents[dependency].append(name)
+        self._completed: set[str] = set()
+        # Captured before any completion, since _remaining counts down later
+        self._initial_ready = tuple(
+            name for name, remaining in self._remaining.items() if not remaining
+        )
+        self._ready: deque[str] = deque(self._initial_ready)
+
+    def initial_ready(self) -> list[str]:
+        """Return the tasks that have no dependencies, in insertion order."""
+        return list(self._initial_ready)
+
+    def dependents(self, name: str) -> tuple[str, ...]:
+        """Return the tasks that depend directly on ``name``, in insertion order."""
+        return tuple(self._dependents[name])
+
+    def mark_completed(self, name: str) -> list[str]:
+        """Record a completed task and return the dependents it made ready.
+
+        Unknown tasks and tasks already marked completed raise ValueError.
+        """
+        if name not in self._remaining:
+            raise ValueError(f"Task '{name}' does not exist in the graph")
+        if name in self._completed:
+            raise ValueError(f"Task '{name}' was already marked completed")
+        self._completed.add(name)
+
+        ready = []
+        for dependent in self._dependents[name]:
+            self._remaining[dependent] -= 1
+            if not self._remaining[dependent]:
+                ready.append(dependent)
+        self._ready.extend(ready)
+        return ready
+
+    def pop_ready(self) -> list[str]:
+        """Return and clear the tasks queued as ready since the last call."""
+        ready = list(self._ready)
+        self._ready.clear()
+        return ready
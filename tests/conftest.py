@@ -5,6 +5,26 @@ from pathlib import Path
 from typing import Any
 
 import pytest
+from prompter.cli.init.analyzer import AnalysisResult
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_cache(tmp_path, monkeypatch):
+    """Keep the parsed-config cache out of the user's home directory."""
+    cache_dir = tmp_path / "prompter-cache"
+    monkeypatch.setenv("PROMPTER_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture(scope="module")
+def python_pytest_analysis() -> AnalysisResult:
+    """Python/pytest analysis result shared by the init tests.
+
+    Tests only read it; derive variants with ``dataclasses.replace()``.
+    """
+    return AnalysisResult(
+        language="Python", test_framework="pytest", test_command="pytest"
+    )
 
 
 @pytest.fixture()
@@ -1,5 +1,6 @@
 """Tests for the configuration module."""
 
+import tomllib
 from unittest.mock import mock_open, patch
 
 import pytest
@@ -86,6 +87,19 @@ class TestPrompterConfig:
         assert config.tasks[0].name == "test_task_1"
         assert config.tasks[1].name == "test_task_2"
 
+    def test_config_from_dict(self):
+        """Test building a configuration from already-parsed data."""
+        config = PrompterConfig.from_dict(
+            {
+                "settings": {"check_interval": 5},
+                "tasks": [{"name": "only_task", "prompt": "Do it"}],
+            }
+        )
+
+        assert config.check_interval == 5
+        assert [task.name for task in config.tasks] == ["only_task"]
+        assert config.get_task_by_name("only_task") is config.tasks[0]
+
     def test_config_loading_with_missing_file(self, temp_dir):
         """Test configuration loading with missing file."""
         missing_file = temp_dir / "missing.toml"
@@ -102,6 +116,19 @@ class TestPrompterConfig:
         with pytest.raises(Exception):  # TOML parsing error
             PrompterConfig(invalid_file)
 
+    def test_config_loading_invalid_toml_shows_context(self, temp_dir):
+        """Test that TOML errors include the offending line for context."""
+        invalid_file = temp_dir / "invalid.toml"
+        invalid_file.write_text('[settings]\ncheck_interval = 5\nbroken = "\\q"\n')
+
+        with pytest.raises(tomllib.TOMLDecodeError) as exc_info:
+            PrompterConfig(invalid_file)
+
+        message = str(exc_info.value)
+        assert "Context:\n       1 | [settings]" in message
+        assert '>>>    3 | broken = "\\q"' in message
+        assert "Hint: In TOML strings, backslashes must be escaped" in message
+
     def test_config_with_minimal_settings(self, temp_dir):
         """Test configuration with minimal settings."""
         minimal_config = """[[tasks]]
@@ -134,6 +161,98 @@ verify_command = "echo ok"
         task = config.get_task_by_name("nonexistent")
         assert task is None
 
+    def test_get_task_by_name_with_duplicate_names(self, temp_dir):
+        """Test that the first task wins when names are duplicated."""
+        config_file = temp_dir / "duplicates.toml"
+        config_file.write_text(
+            """[[tasks]]
+name = "dup"
+prompt = "first"
+verify_command = "true"
+
+[[tasks]]
+name = "dup"
+prompt = "second"
+verify_command = "true"
+"""
+        )
+
+        config = PrompterConfig(config_file)
+        assert config.get_task_by_name("dup") is config.tasks[0]
+
+    def test_config_cache_skips_toml_parsing(
+        self, sample_toml_config, isolated_config_cache
+    ):
+        """Test that an unchanged config is loaded from the cache."""
+        PrompterConfig(sample_toml_config)
+        assert list(isolated_config_cache.glob("*.pkl"))
+
+        with patch("prompter.config.tomllib.loads") as mock_loads:
+            config = PrompterConfig(sample_toml_config)
+
+        mock_loads.assert_not_called()
+        assert [task.name for task in config.tasks] == ["test_task_1", "test_task_2"]
+
+    def test_config_cache_invalidated_on_change(self, temp_dir, isolated_config_cache):
+        """Test that editing the config file replaces the stale cache entry."""
+        config_file = temp_dir / "changing.toml"
+        config_file.write_text(
+            '[[tasks]]\nname = "first"\nprompt = "p"\nverify_command = "true"\n'
+        )
+        assert PrompterConfig(config_file).tasks[0].name == "first"
+
+        config_file.write_text(
+            '[[tasks]]\nname = "second"\nprompt = "p"\nverify_command = "true"\n'
+        )
+        assert PrompterConfig(config_file).tasks[0].name == "second"
+
+        config_file.write_text(
+            '[[tasks]]\nname = "third"\nprompt = "p"\nverify_command = "true"\n'
+        )
+        assert PrompterConfig(config_file).tasks[0].name == "third"
+        assert len(list(isolated_config_cache.glob("*.pkl"))) == 1
+
+    def test_config_cache_corrupt_entry_falls_back_to_parsing(
+        self, sample_toml_config, isolated_config_cache
+    ):
+        """Test that an unreadable cache entry is ignored."""
+        PrompterConfig(sample_toml_config)
+        for cache_file in isolated_config_cache.glob("*.pkl"):
+            cache_file.write_bytes(b"not a pickle")
+
+        config = PrompterConfig(sample_toml_config)
+        assert len(config.tasks) == 2
+
+    def test_config_cache_writable_by_others_is_ignored(
+        self, sample_toml_config, isolated_config_cache
+    ):
+        """Test that a cache entry other users could modify is not unpickled."""
+        PrompterConfig(sample_toml_config)
+        assert (isolated_config_cache.stat().st_mode & 0o777) == 0o700
+        for cache_file in isolated_config_cache.glob("*.pkl"):
+            cache_file.chmod(0o666)
+
+        with patch("prompter.config.pickle.load") as mock_load:
+            config = PrompterConfig(sample_toml_config)
+
+        mock_load.assert_not_called()
+        assert len(config.tasks) == 2
+
+    def test_config_cache_dir_unavailable_falls_back_to_parsing(
+        self, sample_toml_config, monkeypatch
+    ):
+        """Test that failing to locate the cache directory does not break loading."""
+        monkeypatch.delenv("PROMPTER_CACHE_DIR", raising=False)
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+
+        with patch(
+            "prompter.config.Path.home",
+            side_effect=RuntimeError("Could not determine home directory."),
+        ):
+            config = PrompterConfig(sample_toml_config)
+
+        assert len(config.tasks) == 2
+
     def test_validate_valid_config(self, sample_toml_config):
         """Test validation of valid configuration."""
         config = PrompterConfig(sample_toml_config)
@@ -184,6 +303,21 @@ max_attempts = 0
         )
         assert any("max_attempts must be >= 1" in error for error in errors)
 
+    def test_validate_verify_command_wrong_type(self, temp_dir):
+        """Test that a non-string verify_command is a validation error, not a crash."""
+        config_file = temp_dir / "bad_verify.toml"
+        config_file.write_text(
+            '[[tasks]]\nname = "task"\nprompt = "p"\nverify_command = 5\n'
+        )
+
+        config = PrompterConfig(config_file)
+
+        assert config.tasks[0].verify_argv is None
+        assert any(
+            "verify_command must be a string or list" in error
+            for error in config.validate()
+        )
+
     def test_validate_config_with_missing_required_fields(self, invalid_toml_config):
         """Test validation of configuration with missing required fields."""
         config = PrompterConfig(invalid_toml_config)
@@ -194,6 +328,53 @@ max_attempts = 0
         assert any("prompt is required" in error for error in errors)
         assert any("verify_command is required" in error for error in errors)
 
+    def test_validate_unknown_dependency_reported_once(self, temp_dir):
+        """Test that an unknown dependency is not re-reported by the graph check."""
+        config_file = temp_dir / "unknown_dep.toml"
+        config_file.write_text(
+            """[[tasks]]
+name = "build"
+prompt = "Build"
+verify_command = "true"
+depends_on = ["missing"]
+"""
+        )
+
+        config = PrompterConfig(config_file)
+        errors = config.validate()
+
+        assert errors == ["Task 'build' depends on unknown task 'missing'"]
+        assert config.task_names == frozenset({"build"})
+
+    def test_validate_and_task_graph_are_cached(self, temp_dir):
+        """Test that validation and the task graph are computed only once."""
+        config_file = temp_dir / "deps.toml"
+        config_file.write_text(
+            """[[tasks]]
+name = "build"
+prompt = "Build"
+verify_command = "true"
+
+[[tasks]]
+name = "test"
+prompt = "Test"
+verify_command = "true"
+depends_on = ["build"]
+"""
+        )
+        config = PrompterConfig(config_file)
+
+        assert config.validate() == []
+        graph = config.build_task_graph()
+
+        with patch("prompter.config.TaskGraph") as mock_graph_class:
+            errors = config.validate()
+            errors.append("caller mutation")
+            assert config.validate() == []
+            assert config.build_task_graph() is graph
+
+        mock_graph_class.assert_not_called()
+
     def test_config_with_working_directory(self, temp_dir):
         """Test configuration with working directory specified."""
         config_content = f"""[settings]
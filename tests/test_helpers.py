@@ -138,6 +138,7 @@ def create_mock_config(tasks: list = None, **settings) -> Mock:
 
     # Default settings
     config.check_interval = settings.get("check_interval", 0)
+    config.poll_verification = settings.get("poll_verification", False)
     config.max_retries = settings.get("max_retries", 3)
     config.working_directory = settings.get("working_directory")
 
@@ -210,7 +210,7 @@ class TestProjectAnalyzer:
         async def mock_query(*args, **kwargs):
             yield mock_message
 
-        with patch("prompter.cli.init.analyzer.query", side_effect=mock_query):
+        with patch("claude_code_sdk.query", side_effect=mock_query):
             result = await analyzer.analyze()
 
         assert result.language == "Python"
@@ -1,5 +1,8 @@
 """Tests for the main configuration generator orchestration."""
 
+import dataclasses
+import tomllib
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import patch
 
@@ -8,6 +11,74 @@ from prompter.cli.init.analyzer import AnalysisResult
 from prompter.cli.init.generator import ConfigGenerator
 
 
+def apply_patches(
+    generator, *, analysis=None, analysis_error=None, inputs=None, customized=None
+):
+    """Patch the SDK check, AI analysis and user input of ``generator``.
+
+    ``inputs`` is a string returned for every prompt or a list of answers.
+    ``customized`` replaces the interactive customization result.
+    """
+    stack = ExitStack()
+    stack.enter_context(
+        patch.object(generator, "_check_claude_sdk_available", return_value=True)
+    )
+    if analysis_error is not None:
+        stack.enter_context(
+            patch.object(generator, "_perform_ai_analysis", side_effect=analysis_error)
+        )
+    else:
+        stack.enter_context(
+            patch.object(generator, "_perform_ai_analysis", return_value=analysis)
+        )
+    if isinstance(inputs, list):
+        stack.enter_context(
+            patch.object(generator.console, "get_input", side_effect=inputs)
+        )
+    elif inputs is not None:
+        stack.enter_context(
+            patch.object(generator.console, "get_input", return_value=inputs)
+        )
+    if customized is not None:
+        stack.enter_context(
+            patch(
+                "prompter.cli.init.generator.InteractiveConfigurator.customize",
+                return_value=customized,
+            )
+        )
+    return stack
+
+
+@pytest.fixture(scope="module")
+def generated_quick_config(tmp_path_factory, python_pytest_analysis):
+    """Run a quick-setup generate() once and return the file and parsed TOML."""
+    tmp_path = tmp_path_factory.mktemp("quick_setup")
+    config_file = tmp_path / "test.toml"
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(tmp_path)
+        generator = ConfigGenerator("test.toml")
+
+        mock_analysis = dataclasses.replace(
+            python_pytest_analysis,
+            linter="ruff",
+            lint_command="ruff check .",
+            suggestions=[
+                {
+                    "name": "fix_imports",
+                    "prompt": "Organize imports",
+                    "verify_command": "ruff check --select I .",
+                }
+            ],
+        )
+
+        with apply_patches(generator, analysis=mock_analysis, inputs=""):
+            generator.generate()
+
+    config = tomllib.loads(config_file.read_text())
+    return config_file, config
+
+
 class TestConfigGenerator:
     """Test the ConfigGenerator class."""
 
@@ -22,32 +93,25 @@ class TestConfigGenerator:
         generator = ConfigGenerator("custom.toml")
         assert generator.filename == "custom.toml"
 
-    def test_confirm_overwrite_yes(self, capsys):
-        """Test confirming file overwrite."""
-        generator = ConfigGenerator("test.toml")
-        with patch.object(generator.console, "get_input", return_value="y"):
-            with patch("pathlib.Path.exists", return_value=True):
-                result = generator._confirm_overwrite()
-                assert result is True
-
-    def test_confirm_overwrite_no(self, capsys):
-        """Test declining file overwrite."""
+    @pytest.mark.parametrize(("reply", "expected"), [("y", True), ("n", False)])
+    def test_confirm_overwrite(self, reply, expected):
+        """Test confirming and declining file overwrite."""
         generator = ConfigGenerator("test.toml")
-        with patch.object(generator.console, "get_input", return_value="n"):
-            with patch("pathlib.Path.exists", return_value=True):
-                result = generator._confirm_overwrite()
-                assert result is False
+        with patch.object(generator.console, "get_input", return_value=reply):
+            assert generator._confirm_overwrite() is expected
 
-    def test_missing_claude_sdk(self, capsys):
+    def test_missing_claude_sdk(self, capsys, monkeypatch):
         """Test error when Claude SDK not available."""
         generator = ConfigGenerator("test.toml")
 
-        # Mock the import to fail
-        with patch.dict("sys.modules", {"claude_code_sdk": None}):
-            with pytest.raises(SystemExit) as exc:
-                generator.generate()
+        # Make the SDK lookup fail
+        monkeypatch.setattr(
+            "prompter.cli.init.generator._claude_sdk_available", lambda: False
+        )
+        with pytest.raises(SystemExit) as exc:
+            generator.generate()
 
-            assert exc.value.code == 1
+        assert exc.value.code == 1
 
         captured = capsys.readouterr()
         # Check stderr since error messages go there
@@ -61,91 +125,61 @@ class TestConfigGenerator:
         """Test generate when existing file and user cancels."""
         generator = ConfigGenerator("test.toml")
 
-        with patch("pathlib.Path.exists", return_value=True):
+        with patch.object(generator, "_file_exists", return_value=True):
             with patch.object(generator, "_confirm_overwrite", return_value=False):
                 generator.generate()
 
         # Should exit early without error
 
-    def test_generate_success_quick_setup(self, tmp_path, monkeypatch):
+    def test_generate_success_quick_setup(self, generated_quick_config):
         """Test successful generation with quick setup (ENTER)."""
-        monkeypatch.chdir(tmp_path)
-        config_file = tmp_path / "test.toml"
-
-        generator = ConfigGenerator("test.toml")
-
-        # Mock the SDK check
-        with patch.object(generator, "_check_claude_sdk_available", return_value=True):
-            # Mock analysis
-            mock_analysis = AnalysisResult(
-                language="Python",
-                test_framework="pytest",
-                test_command="pytest",
-                linter="ruff",
-                lint_command="ruff check .",
-                suggestions=[
-                    {
-                        "name": "fix_imports",
-                        "prompt": "Organize imports",
-                        "verify_command": "ruff check --select I .",
-                    }
-                ],
-            )
-
-            with patch.object(
-                generator, "_perform_ai_analysis", return_value=mock_analysis
-            ):
-                with patch.object(generator.console, "get_input", return_value=""):
-                    generator.generate()
+        config_file, config = generated_quick_config
 
         # Check file was created
         assert config_file.exists()
 
         # Check content
-        import tomllib
-
-        with open(config_file, "rb") as f:
-            config = tomllib.load(f)
         assert "settings" in config
         assert "tasks" in config
         assert len(config["tasks"]) >= 2  # At least suggestions + standard tasks
 
-    def test_generate_success_with_customization(self, tmp_path, monkeypatch):
+    def test_generate_quick_setup_includes_suggestions(self, generated_quick_config):
+        """Test quick setup writes the analysis suggestions and tools."""
+        _, config = generated_quick_config
+
+        task_names = [t["name"] for t in config["tasks"]]
+        assert "fix_imports" in task_names
+        assert config["tools"]["lint_command"] == "ruff check ."
+
+    def test_generate_success_with_customization(
+        self, tmp_path, monkeypatch, python_pytest_analysis
+    ):
         """Test successful generation with customization."""
         monkeypatch.chdir(tmp_path)
         config_file = tmp_path / "test.toml"
 
         generator = ConfigGenerator("test.toml")
 
-        # Mock the SDK check
-        with patch.object(generator, "_check_claude_sdk_available", return_value=True):
-            # Mock analysis
-            mock_analysis = AnalysisResult(
-                language="Python", test_framework="pytest", test_command="pytest"
-            )
+        # Mock interactive customization
+        mock_config = {
+            "settings": {"working_directory": "."},
+            "tasks": [
+                {
+                    "name": "custom_task",
+                    "prompt": "Do something",
+                    "verify_command": "echo done",
+                    "timeout": 300,
+                }
+            ],
+        }
 
-            # Mock interactive customization
-            mock_config = {
-                "settings": {"working_directory": "."},
-                "tasks": [
-                    {
-                        "name": "custom_task",
-                        "prompt": "Do something",
-                        "verify_command": "echo done",
-                        "timeout": 300,
-                    }
-                ],
-            }
-
-            with patch.object(
-                generator, "_perform_ai_analysis", return_value=mock_analysis
-            ):
-                with patch.object(generator.console, "get_input", side_effect=["c"]):
-                    with patch(
-                        "prompter.cli.init.generator.InteractiveConfigurator.customize",
-                        return_value=mock_config,
-                    ):
-                        generator.generate()
+        with apply_patches(
+            generator,
+            analysis=python_pytest_analysis,
+            inputs=["c"],
+            customized=mock_config,
+        ):
+            generator.generate()
 
         # Check file was created
         assert config_file.exists()
@@ -154,15 +188,8 @@ class TestConfigGenerator:
         """Test generate when user chooses to quit."""
         generator = ConfigGenerator("test.toml")
 
-        # Mock the SDK check
-        with patch.object(generator, "_check_claude_sdk_available", return_value=True):
-            mock_analysis = AnalysisResult()
-
-            with patch.object(
-                generator, "_perform_ai_analysis", return_value=mock_analysis
-            ):
-                with patch.object(generator.console, "get_input", return_value="q"):
-                    generator.generate()
+        with apply_patches(generator, analysis=AnalysisResult(), inputs="q"):
+            generator.generate()
 
         # Should complete without creating file
 
@@ -170,28 +197,20 @@ class TestConfigGenerator:
         """Test handling of analysis timeout."""
         generator = ConfigGenerator("test.toml")
 
-        # Mock the SDK check
-        with patch.object(generator, "_check_claude_sdk_available", return_value=True):
-            with patch.object(
-                generator,
-                "_perform_ai_analysis",
-                side_effect=Exception(
-                    "Analysis timed out after 30 seconds. Please try again."
-                ),
-            ):
-                with pytest.raises(SystemExit) as exc:
-                    generator.generate()
-
-                assert exc.value.code == 1
-
-    def test_generate_config_from_analysis(self):
+        error = Exception("Analysis timed out after 30 seconds. Please try again.")
+        with apply_patches(generator, analysis_error=error):
+            with pytest.raises(SystemExit) as exc:
+                generator.generate()
+
+            assert exc.value.code == 1
+
+    def test_generate_config_from_analysis(self, python_pytest_analysis):
         """Test configuration generation from analysis results."""
         generator = ConfigGenerator()
 
-        analysis = AnalysisResult(
-            language="Python",
+        analysis = dataclasses.replace(
+            python_pytest_analysis,
             build_command="make build",
-            test_framework="pytest",
             test_command="pytest -xvs",
             linter="ruff",
             lint_command="ruff check .",
@@ -224,14 +243,13 @@ class TestConfigGenerator:
         assert "fix_linting_errors" in task_names
         assert "format_code" in task_names
 
-    def test_display_analysis_results(self, capsys):
+    def test_display_analysis_results(self, capsys, python_pytest_analysis):
         """Test display of analysis results."""
         generator = ConfigGenerator()
 
-        analysis = AnalysisResult(
-            language="Python",
+        analysis = dataclasses.replace(
+            python_pytest_analysis,
             build_system="make",
-            test_framework="pytest",
             linter="ruff",
             issues=["Issue 1", "Issue 2"],
         )
@@ -1,45 +1,59 @@
 """Tests for interactive configuration customization."""
 
+import dataclasses
 from unittest.mock import Mock
 
-from prompter.cli.init.analyzer import AnalysisResult
+import pytest
 from prompter.cli.init.interactive import InteractiveConfigurator, TaskConfig
 from prompter.utils.console import Console
 
 
+@pytest.fixture(scope="module")
+def console_factory():
+    """Return a factory for Console mocks that share one precomputed spec."""
+    # Listing the attribute names once skips re-introspecting Console per mock
+    spec = dir(Console)
+    return lambda: Mock(spec=spec)
+
+
 class TestTaskConfig:
     """Test the TaskConfig dataclass."""
 
-    def test_default_values(self):
-        """Test TaskConfig with default values."""
+    @pytest.mark.parametrize(
+        ("overrides", "timeout", "on_success", "on_failure", "max_attempts"),
+        [
+            ({}, 300, "next", "retry", 3),
+            (
+                {
+                    "timeout": 600,
+                    "on_success": "stop",
+                    "on_failure": "next",
+                    "max_attempts": 5,
+                },
+                600,
+                "stop",
+                "next",
+                5,
+            ),
+        ],
+        ids=["defaults", "custom"],
+    )
+    def test_values(self, overrides, timeout, on_success, on_failure, max_attempts):
+        """Test TaskConfig with default and custom values."""
         task = TaskConfig(
-            name="test_task", prompt="Do something", verify_command="echo done"
+            name="test_task",
+            prompt="Do something",
+            verify_command="echo done",
+            **overrides,
         )
 
         assert task.name == "test_task"
         assert task.prompt == "Do something"
         assert task.verify_command == "echo done"
-        assert task.timeout == 300
-        assert task.on_success == "next"
-        assert task.on_failure == "retry"
-        assert task.max_attempts == 3
-
-    def test_custom_values(self):
-        """Test TaskConfig with custom values."""
-        task = TaskConfig(
-            name="custom_task",
-            prompt="Custom prompt",
-            verify_command="test command",
-            timeout=600,
-            on_success="stop",
-            on_failure="next",
-            max_attempts=5,
-        )
-
-        assert task.timeout == 600
-        assert task.on_success == "stop"
-        assert task.on_failure == "next"
-        assert task.max_attempts == 5
+        assert task.timeout == timeout
+        assert task.on_success == on_success
+        assert task.on_failure == on_failure
+        assert task.max_attempts == max_attempts
 
     def test_to_dict(self):
         """Test conversion to dictionary."""
@@ -67,18 +81,17 @@ class TestInteractiveConfigurator:
         configurator = InteractiveConfigurator(console)
         assert configurator.console == console
 
-    def test_confirm_tools_accept_all(self):
+    def test_confirm_tools_accept_all(self, console_factory, python_pytest_analysis):
         """Test confirming all detected tools."""
-        console = Mock(spec=Console)
+        console = console_factory()
         console.get_input.return_value = ""  # Accept all
 
         configurator = InteractiveConfigurator(console)
 
-        analysis = AnalysisResult(
+        analysis = dataclasses.replace(
+            python_pytest_analysis,
             build_system="make",
             build_command="make build",
-            test_framework="pytest",
-            test_command="pytest",
             linter="ruff",
             lint_command="ruff check .",
         )
@@ -91,23 +104,25 @@ class TestInteractiveConfigurator:
         assert result["tools"]["test_command"] == "pytest"
         assert result["tools"]["lint_command"] == "ruff check ."
 
-    def test_confirm_tools_custom_command(self):
+    def test_confirm_tools_custom_command(
+        self, console_factory, python_pytest_analysis
+    ):
         """Test providing custom commands for tools."""
-        console = Mock(spec=Console)
+        console = console_factory()
         console.get_input.side_effect = ["n", "pytest -xvs"]  # Decline, then custom
 
         configurator = InteractiveConfigurator(console)
 
-        analysis = AnalysisResult(test_framework="pytest", test_command="pytest")
+        analysis = python_pytest_analysis
 
         config = {}
         result = configurator._confirm_tools(config, analysis)
 
         assert result["tools"]["test_command"] == "pytest -xvs"
 
-    def test_customize_tasks_keep_all(self):
+    def test_customize_tasks_keep_all(self, console_factory):
         """Test keeping all tasks without modification."""
-        console = Mock(spec=Console)
+        console = console_factory()
         console.get_input.return_value = "keep"
 
         configurator = InteractiveConfigurator(console)
@@ -124,9 +139,9 @@ class TestInteractiveConfigurator:
         assert result[0].name == "task1"
         assert result[1].name == "task2"
 
-    def test_customize_tasks_edit(self):
+    def test_customize_tasks_edit(self, console_factory):
         """Test editing a task."""
-        console = Mock(spec=Console)
+        console = console_factory()
         console.get_input.side_effect = [
             "edit",  # Action
             "edited_task",  # New name
@@ -159,9 +174,9 @@ class TestInteractiveConfigurator:
         assert result[0].on_failure == "stop"
         assert result[0].max_attempts == 1
 
-    def test_customize_tasks_delete(self):
+    def test_customize_tasks_delete(self, console_factory):
         """Test deleting tasks."""
-        console = Mock(spec=Console)
+        console = console_factory()
         console.get_input.side_effect = ["delete", "keep"]
 
         configurator = InteractiveConfigurator(console)
@@ -176,9 +191,9 @@ class TestInteractiveConfigurator:
         assert len(result) == 1
         assert result[0].name == "task2"
 
-    def test_add_custom_tasks(self):
+    def test_add_custom_tasks(self, console_factory):
         """Test adding custom tasks interactively."""
-        console = Mock(spec=Console)
+        console = console_factory()
         console.get_input.side_effect = [
             "y",  # Add a task
             "custom_task",  # Name
@@ -200,9 +215,9 @@ class TestInteractiveConfigurator:
         assert result[0].verify_command == "echo done"
         assert result[0].timeout == 300  # Default
 
-    def test_add_custom_tasks_validation(self):
+    def test_add_custom_tasks_validation(self, console_factory):
         """Test validation when adding custom tasks."""
-        console = Mock(spec=Console)
+        console = console_factory()
         console.get_input.side_effect = [
             "y",  # Add a task
             "",  # Empty name (invalid)
@@ -223,9 +238,9 @@ class TestInteractiveConfigurator:
         assert len(result) == 0
         assert console.print_warning.call_count >= 3
 
-    def test_customize_settings(self):
+    def test_customize_settings(self, console_factory):
         """Test customizing global settings."""
-        console = Mock(spec=Console)
+        console = console_factory()
         console.get_input.side_effect = [
             "/custom/path",  # Working directory
             "60",  # Check interval
@@ -241,9 +256,9 @@ class TestInteractiveConfigurator:
         assert result["check_interval"] == 60
         assert result["allow_infinite_loops"] is True
 
-    def test_customize_full_flow(self):
+    def test_customize_full_flow(self, console_factory, python_pytest_analysis):
         """Test full customization flow."""
-        console = Mock(spec=Console)
+        console = console_factory()
         # Mock all inputs for full flow
         console.get_input.side_effect = [
             # Tool confirmation
@@ -262,11 +277,8 @@ class TestInteractiveConfigurator:
 
         configurator = InteractiveConfigurator(console)
 
-        analysis = AnalysisResult(
-            build_system="make",
-            build_command="make",
-            test_framework="pytest",
-            test_command="pytest",
+        analysis = dataclasses.replace(
+            python_pytest_analysis, build_system="make", build_command="make"
         )
 
         config = {
@@ -3,7 +3,7 @@
 import logging
 from unittest.mock import mock_open, patch
 
-from prompter.logging import get_logger, setup_logging
+from prompter.logging import get_logger, setup_logging, setup_minimal_logging
 
 
 class TestSetupLogging:
@@ -62,6 +62,16 @@ class TestSetupLogging:
         assert logger1 is logger2  # Same logger instance
         assert len(logger2.handlers) == initial_handler_count
 
+    def test_setup_minimal_logging(self):
+        """Test that minimal logging only lets warnings through, without handlers."""
+        setup_logging()
+        logger = setup_minimal_logging()
+
+        assert logger.name == "prompter"
+        assert logger.level == logging.WARNING
+        assert logger.handlers == []
+        assert not get_logger("state").isEnabledFor(logging.INFO)
+
     def test_logging_output_format(self, capsys):
         """Test that logging output uses correct format."""
         logger = setup_logging(level="DEBUG")
@@ -1,12 +1,22 @@
 """Demonstration test for parallel execution feature."""
 
-import tempfile
-from pathlib import Path
+import os
+import tomllib
 
 import pytest
 
 from prompter.config import PrompterConfig
 
+# The demos narrate their plan when run directly or with PROMPTER_DEMO_VERBOSE
+# set; under a normal pytest run the narration is skipped instead of captured
+_VERBOSE = __name__ == "__main__" or bool(os.environ.get("PROMPTER_DEMO_VERBOSE"))
+
+
+def _say(*args: object) -> None:
+    """Print demo narration when verbose output is enabled."""
+    if _VERBOSE:
+        print(*args)
+
 
 @pytest.mark.integration
 class TestParallelExecutionDemo:
@@ -81,62 +91,54 @@ verify_command = "echo 'Deployed to staging'"
 depends_on = ["integration_tests"]
 """
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write(config_content)
-            config_file = Path(f.name)
-
-        try:
-            # Load and validate configuration
-            config = PrompterConfig(config_file)
-            errors = config.validate()
-            assert len(errors) == 0, f"Config validation failed: {errors}"
-
-            # Build and visualize the task graph
-            graph = config.build_task_graph()
-
-            # Print the execution plan
-            print("\n" + "=" * 60)
-            print("PARALLEL EXECUTION WORKFLOW DEMONSTRATION")
-            print("=" * 60)
-            print(graph.visualize_ascii())
-
-            # Show execution levels
-            levels = graph.get_execution_levels()
-            print("\nExecution Timeline:")
-            print("-" * 60)
-
-            total_time = 0
-            for i, level_tasks in enumerate(levels):
-                print(f"\nTime {total_time}: Stage {i + 1}")
-                print(f"  Running in parallel: {', '.join(level_tasks)}")
-                print(
-                    f"  Max concurrent tasks: {min(len(level_tasks), config.max_parallel_tasks)}"
-                )
-                total_time += 1
-
-            print(f"\nTotal execution time: ~{total_time} time units")
-            print(f"Sequential execution would take: {len(config.tasks)} time units")
-            print(f"Speedup factor: {len(config.tasks) / total_time:.1f}x")
-
-            # Demonstrate dependency checking
-            print("\nDependency Analysis:")
-            print("-" * 60)
-
-            # Check what tasks are ready at different stages
-            completed = set()
-            for stage in range(len(levels)):
-                ready = graph.get_ready_tasks(completed)
-                print(f"Stage {stage + 1}: Ready tasks = {ready}")
-                completed.update(levels[stage])
-
-            # Show critical path
-            critical_path = graph.get_critical_path()
-            print("\nCritical Path (longest dependency chain):")
-            print(" -> ".join(critical_path))
-            print(f"Minimum possible execution time: {len(critical_path)} time units")
-
-        finally:
-            config_file.unlink()
+        # Load and validate configuration
+        config = PrompterConfig.from_dict(tomllib.loads(config_content))
+        errors = config.validate()
+        assert len(errors) == 0, f"Config validation failed: {errors}"
+
+        # Build and visualize the task graph
+        graph = config.build_task_graph()
+
+        # Print the execution plan
+        _say("\n" + "=" * 60)
+        _say("PARALLEL EXECUTION WORKFLOW DEMONSTRATION")
+        _say("=" * 60)
+        _say(graph.visualize_ascii())
+
+        # Show execution levels
+        levels = graph.get_execution_levels()
+        _say("\nExecution Timeline:")
+        _say("-" * 60)
+
+        total_time = 0
+        for i, level_tasks in enumerate(levels):
+            _say(f"\nTime {total_time}: Stage {i + 1}")
+            _say(f"  Running in parallel: {', '.join(level_tasks)}")
+            _say(
+                f"  Max concurrent tasks: {min(len(level_tasks), config.max_parallel_tasks)}"
+            )
+            total_time += 1
+
+        _say(f"\nTotal execution time: ~{total_time} time units")
+        _say(f"Sequential execution would take: {len(config.tasks)} time units")
+        _say(f"Speedup factor: {len(config.tasks) / total_time:.1f}x")
+
+        # Demonstrate dependency checking
+        _say("\nDependency Analysis:")
+        _say("-" * 60)
+
+        # Check what tasks are ready at different stages
+        completed = set()
+        for stage in range(len(levels)):
+            ready = graph.get_ready_tasks(completed)
+            _say(f"Stage {stage + 1}: Ready tasks = {ready}")
+            completed.update(levels[stage])
+
+        # Show critical path
+        critical_path = graph.get_critical_path()
+        _say("\nCritical Path (longest dependency chain):")
+        _say(" -> ".join(critical_path))
+        _say(f"Minimum possible execution time: {len(critical_path)} time units")
 
     def test_parallel_vs_sequential_comparison(self):
         """Compare parallel vs sequential execution characteristics."""
@@ -150,14 +152,16 @@ enable_parallel = true
 # Analyze {num_modules} independent modules
 """
 
-        for i in range(1, num_modules + 1):
-            config_content += f"""
+        config_content += "".join(
+            f"""
 [[tasks]]
 name = "analyze_module_{i}"
 prompt = "Analyze module {i}"
 verify_command = "echo 'Module {i} analyzed'"
 depends_on = []
 """
+            for i in range(1, num_modules + 1)
+        )
 
         # Add aggregation task
         deps = [f'"analyze_module_{i}"' for i in range(1, num_modules + 1)]
@@ -169,46 +173,38 @@ verify_command = "echo 'Report created'"
 depends_on = [{", ".join(deps)}]
 """
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
-            f.write(config_content)
-            config_file = Path(f.name)
-
-        try:
-            config = PrompterConfig(config_file)
-            graph = config.build_task_graph()
-
-            print("\n" + "=" * 60)
-            print("PARALLEL VS SEQUENTIAL COMPARISON")
-            print("=" * 60)
-
-            # Calculate execution times
-            levels = graph.get_execution_levels()
-            parallel_time = len(levels)
-            sequential_time = len(config.tasks)
-
-            print(
-                f"\nWorkflow: {num_modules} independent analysis tasks + 1 aggregation task"
-            )
-            print(f"Max parallel tasks: {config.max_parallel_tasks}")
-            print(f"\nSequential execution: {sequential_time} time units")
-            print(f"Parallel execution: {parallel_time} time units")
-            print(
-                f"Time saved: {sequential_time - parallel_time} time units ({(1 - parallel_time / sequential_time) * 100:.0f}%)"
-            )
-            print(f"Speedup: {sequential_time / parallel_time:.1f}x faster")
-
-            # Show execution pattern
-            print("\nParallel Execution Pattern:")
-            for i, level_tasks in enumerate(levels):
-                batches = [
-                    level_tasks[j : j + config.max_parallel_tasks]
-                    for j in range(0, len(level_tasks), config.max_parallel_tasks)
-                ]
-                for batch_num, batch in enumerate(batches):
-                    print(f"  Time {i}.{batch_num}: {', '.join(batch)}")
-
-        finally:
-            config_file.unlink()
+        config = PrompterConfig.from_dict(tomllib.loads(config_content))
+        graph = config.build_task_graph()
+
+        _say("\n" + "=" * 60)
+        _say("PARALLEL VS SEQUENTIAL COMPARISON")
+        _say("=" * 60)
+
+        # Calculate execution times
+        levels = graph.get_execution_levels()
+        parallel_time = len(levels)
+        sequential_time = len(config.tasks)
+
+        _say(
+            f"\nWorkflow: {num_modules} independent analysis tasks + 1 aggregation task"
+        )
+        _say(f"Max parallel tasks: {config.max_parallel_tasks}")
+        _say(f"\nSequential execution: {sequential_time} time units")
+        _say(f"Parallel execution: {parallel_time} time units")
+        _say(
+            f"Time saved: {sequential_time - parallel_time} time units ({(1 - parallel_time / sequential_time) * 100:.0f}%)"
+        )
+        _say(f"Speedup: {sequential_time / parallel_time:.1f}x faster")
+
+        # Show execution pattern
+        _say("\nParallel Execution Pattern:")
+        for i, level_tasks in enumerate(levels):
+            batches = [
+                level_tasks[j : j + config.max_parallel_tasks]
+                for j in range(0, len(level_tasks), config.max_parallel_tasks)
+            ]
+            for batch_num, batch in enumerate(batches):
+                _say(f"  Time {i}.{batch_num}: {', '.join(batch)}")
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import anyio
 import pytest
 
 from prompter.config import PrompterConfig
@@ -41,6 +42,61 @@ class TestTaskGraph:
         assert graph.get_ready_tasks({"task1"}) == ["task2"]
         assert graph.get_ready_tasks({"task1", "task2"}) == ["task3"]
 
+        # The scheduler hands out the same tasks incrementally
+        scheduler = graph.scheduler()
+        assert scheduler.pop_ready() == ["task1"]
+        scheduler.mark_completed("task1")
+        assert scheduler.pop_ready() == ["task2"]
+        scheduler.mark_completed("task2")
+        assert scheduler.pop_ready() == ["task3"]
+
+    def test_validate_sorts_dependencies(self):
+        """Test validation stores a sorted tuple of each task's dependencies."""
+        graph = TaskGraph()
+        graph.add_task("b", create_task_config(name="b"), [])
+        graph.add_task("a", create_task_config(name="a"), [])
+        graph.add_task("c", create_task_config(name="c"), ["b", "a"])
+
+        graph.validate()
+
+        assert graph.nodes["c"].dependencies_sorted == ("a", "b")
+        assert "c <- a, b" in graph.visualize_ascii()
+
+    def test_scheduler_releases_dependents(self):
+        """Test the scheduler hands out tasks as their dependencies complete."""
+        graph = TaskGraph()
+        graph.add_task("A", create_task_config(name="A"), [])
+        graph.add_task("B", create_task_config(name="B"), ["A"])
+        graph.add_task("C", create_task_config(name="C"), ["A"])
+        graph.add_task("D", create_task_config(name="D"), ["B", "C"])
+
+        scheduler = graph.scheduler()
+
+        assert scheduler.initial_ready() == ["A"]
+        assert scheduler.mark_completed("A") == ["B", "C"]
+        assert scheduler.mark_completed("B") == []
+        assert scheduler.mark_completed("C") == ["D"]
+        assert scheduler.mark_completed("D") == []
+        # Released tasks are not reported as initially ready
+        assert scheduler.initial_ready() == ["A"]
+
+    def test_scheduler_rejects_repeat_and_unknown_tasks(self):
+        """Test that completing a task twice or an unknown task is an error."""
+        graph = TaskGraph()
+        graph.add_task("A", create_task_config(name="A"), [])
+        graph.add_task("B", create_task_config(name="B"), ["A"])
+
+        scheduler = graph.scheduler()
+        assert scheduler.pop_ready() == ["A"]
+        assert scheduler.mark_completed("A") == ["B"]
+
+        with pytest.raises(ValueError, match="already marked completed"):
+            scheduler.mark_completed("A")
+        with pytest.raises(ValueError, match="does not exist"):
+            scheduler.mark_completed("missing")
+        # A rejected repeat must not release dependents a second time
+        assert scheduler.pop_ready() == ["B"]
+
     def test_parallel_execution_levels(self):
         """Test identifying tasks that can run in parallel."""
         graph = TaskGraph()
@@ -64,6 +120,23 @@ class TestTaskGraph:
         assert set(levels[1]) == {"B", "C"}  # B and C can run in parallel
         assert levels[2] == ["D"]
 
+    def test_forward_references(self):
+        """Test dependencies declared before the task they name is added."""
+        graph = TaskGraph()
+        graph.add_task("C", create_task_config(name="C"), ["B"])
+        graph.add_task("B", create_task_config(name="B"), ["A"])
+        graph.add_task("A", create_task_config(name="A"), [])
+        graph.add_task("D", create_task_config(name="D"), ["A"])
+
+        assert graph.get_execution_levels() == [["A"], ["B", "D"], ["C"]]
+
+        graph.validate()
+        assert graph._topological_order.index("A") < graph._topological_order.index("B")
+        assert graph._topological_order.index("B") < graph._topological_order.index("C")
+        assert graph.get_critical_path() == ["A", "B", "C"]
+        assert graph.nodes["A"].dependents == {"B", "D"}
+        assert graph.nodes["C"].in_degree == 1
+
     def test_cycle_detection(self):
         """Test that cycles are properly detected."""
         graph = TaskGraph()
@@ -81,6 +154,24 @@ class TestTaskGraph:
         assert "B" in str(exc_info.value)
         assert "C" in str(exc_info.value)
 
+    def test_cycle_detection_deep_chain(self):
+        """Test cycle detection on chains deeper than the recursion limit."""
+        graph = TaskGraph()
+        depth = 3000
+
+        graph.add_task("T0", create_task_config(name="T0"), [])
+        for i in range(1, depth):
+            graph.add_task(f"T{i}", create_task_config(name=f"T{i}"), [f"T{i - 1}"])
+        graph.validate()  # A plain chain has no cycle
+
+        # Making T1 depend on the last task closes a cycle through the chain
+        graph.add_dependency("T1", f"T{depth - 1}")
+        with pytest.raises(CycleDetectedError) as exc_info:
+            graph.validate()
+
+        assert exc_info.value.cycle_path[0] == exc_info.value.cycle_path[-1]
+        assert len(exc_info.value.cycle_path) == depth
+
     def test_missing_dependency_detection(self):
         """Test that missing dependencies are detected."""
         graph = TaskGraph()
@@ -109,13 +200,47 @@ class TestTaskGraph:
         # The longer path Start -> A1 -> A2 -> End should be the critical path
         assert critical_path == ["Start", "A1", "A2", "End"]
 
+    def test_visualize_ascii_cached_until_modified(self):
+        """Test that the ASCII rendering is reused until the graph changes."""
+        graph = TaskGraph()
+        graph.add_task("A", create_task_config(name="A"), [])
+        graph.add_task("B", create_task_config(name="B"), ["A"])
+
+        first = graph.visualize_ascii()
+        assert graph.visualize_ascii() is first
+
+        graph.add_task("C", create_task_config(name="C"), ["B"])
+        updated = graph.visualize_ascii()
+        assert updated is not first
+        assert "C <- B" in updated
+
+    def test_derived_views_cached_until_modified(self):
+        """Test that levels and critical path are computed once per graph shape."""
+        graph = TaskGraph()
+        graph.add_task("A", create_task_config(name="A"), [])
+        graph.add_task("B", create_task_config(name="B"), ["A"])
+
+        levels = graph.get_execution_levels()
+        levels[0].append("mutated")
+        assert graph.get_execution_levels() == [["A"], ["B"]]
+        assert graph._levels_cache is not None
+
+        path = graph.get_critical_path()
+        path.clear()
+        assert graph.get_critical_path() == ["A", "B"]
+
+        graph.add_task("C", create_task_config(name="C"), ["B"])
+        assert graph._levels_cache is None
+        assert graph.get_execution_levels() == [["A"], ["B"], ["C"]]
+        assert graph.get_critical_path() == ["A", "B", "C"]
+
 
 class TestParallelCoordinator:
     """Test the ParallelTaskCoordinator class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def temp_config_file(self):
-        """Create a temporary config file for testing."""
+        """Create a temporary config file shared by the tests in this class."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
             f.write("""
 [settings]
@@ -256,6 +381,214 @@ depends_on = ["task2", "task3"]
         assert "task4" not in results  # Skipped tasks don't get results
         assert coordinator.task_states["task4"].status == TaskStatus.SKIPPED
 
+    @pytest.mark.asyncio
+    async def test_scheduler_wakes_on_completion(
+        self, tmp_path, temp_state_file, monkeypatch
+    ):
+        """Test that a dependency chain is scheduled without polling delays."""
+        chain_length = 10
+        tasks = []
+        for i in range(chain_length):
+            depends_on = f'["step{i - 1}"]' if i else "[]"
+            tasks.append(
+                f'[[tasks]]\nname = "step{i}"\nprompt = "p"\n'
+                f'verify_command = "true"\ndepends_on = {depends_on}\n'
+            )
+        config_file = tmp_path / "chain.toml"
+        config_file.write_text("\n".join(tasks))
+        config = PrompterConfig(config_file)
+
+        mock_runner = MagicMock(spec=TaskRunner)
+        mock_runner.run_task.side_effect = lambda task, _state_mgr: TaskResult(
+            task_name=task.name, success=True, output="done"
+        )
+
+        sleeps = []
+        real_sleep = anyio.sleep
+
+        async def recording_sleep(delay, *args, **kwargs):
+            sleeps.append(delay)
+            await real_sleep(delay, *args, **kwargs)
+
+        monkeypatch.setattr(anyio, "sleep", recording_sleep)
+
+        coordinator = ParallelTaskCoordinator(
+            config=config,
+            runner=mock_runner,
+            state_manager=StateManager(temp_state_file),
+        )
+        results = await coordinator.execute_all()
+
+        assert len(results) == chain_length
+        # Each link is released by its dependency finishing, not by polling
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_dependents_resume_dependency_session(
+        self, tmp_path, temp_state_file
+    ):
+        """Test that a task's result is recorded before its dependents start."""
+        chain_length = 6
+        tasks = []
+        for i in range(chain_length):
+            depends_on = f'["step{i - 1}"]' if i else "[]"
+            tasks.append(
+                f'[[tasks]]\nname = "step{i}"\nprompt = "p"\n'
+                f'verify_command = "true"\ndepends_on = {depends_on}\n'
+                "resume_previous_session = true\n"
+            )
+        config_file = tmp_path / "resume_chain.toml"
+        config_file.write_text("\n".join(tasks))
+        config = PrompterConfig(config_file)
+
+        resumed = {}
+
+        def run_task(task, state_mgr):
+            resumed[task.name] = state_mgr.get_previous_session_id(task.name)
+            return TaskResult(
+                task_name=task.name, success=True, session_id=f"session-{task.name}"
+            )
+
+        mock_runner = MagicMock(spec=TaskRunner)
+        mock_runner.run_task.side_effect = run_task
+
+        coordinator = ParallelTaskCoordinator(
+            config=config,
+            runner=mock_runner,
+            state_manager=StateManager(temp_state_file),
+        )
+        await coordinator.execute_all()
+
+        assert resumed == {
+            f"step{i}": f"session-step{i - 1}" if i else None
+            for i in range(chain_length)
+        }
+
+    @pytest.mark.asyncio
+    async def test_state_save_error_does_not_abort_run(self, tmp_path, temp_state_file):
+        """Test that a failing state save is logged instead of cancelling tasks."""
+        config_file = tmp_path / "save_error.toml"
+        config_file.write_text(
+            '[[tasks]]\nname = "first"\nprompt = "p"\nverify_command = "true"\n\n'
+            '[[tasks]]\nname = "second"\nprompt = "p"\nverify_command = "true"\n'
+            'depends_on = ["first"]\n'
+        )
+        config = PrompterConfig(config_file)
+
+        mock_runner = MagicMock(spec=TaskRunner)
+        mock_runner.run_task.side_effect = lambda task, _state_mgr: TaskResult(
+            task_name=task.name, success=True
+        )
+        state_manager = StateManager(temp_state_file)
+        state_manager.save_state = MagicMock(side_effect=OSError("disk full"))
+
+        coordinator = ParallelTaskCoordinator(
+            config=config,
+            runner=mock_runner,
+            state_manager=state_manager,
+        )
+        results = await coordinator.execute_all()
+
+        assert results["first"].success
+        assert results["second"].success
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_transitive_dependents(self, tmp_path, temp_state_file):
+        """Test that tasks depending on a skipped task are skipped too."""
+        config_file = tmp_path / "transitive.toml"
+        config_file.write_text(
+            """
+[[tasks]]
+name = "build"
+prompt = "p"
+verify_command = "true"
+
+[[tasks]]
+name = "test"
+prompt = "p"
+verify_command = "true"
+depends_on = ["build"]
+
+[[tasks]]
+name = "deploy"
+prompt = "p"
+verify_command = "true"
+depends_on = ["test"]
+
+[[tasks]]
+name = "lint"
+prompt = "p"
+verify_command = "true"
+"""
+        )
+        config = PrompterConfig(config_file)
+
+        mock_runner = MagicMock(spec=TaskRunner)
+        mock_runner.run_task.side_effect = lambda task, _state_mgr: TaskResult(
+            task_name=task.name, success=task.name != "build", error="boom"
+        )
+
+        coordinator = ParallelTaskCoordinator(
+            config=config,
+            runner=mock_runner,
+            state_manager=StateManager(temp_state_file),
+        )
+
+        with anyio.fail_after(5):
+            results = await coordinator.execute_all()
+
+        assert set(results) == {"build", "lint"}
+        assert coordinator.task_states["test"].status == TaskStatus.SKIPPED
+        assert coordinator.task_states["deploy"].status == TaskStatus.SKIPPED
+        assert coordinator._unfinished_count == 0
+
+    @pytest.mark.asyncio
+    async def test_thread_limiter_matches_parallelism(
+        self, temp_config_file, temp_state_file
+    ):
+        """Test that runner threads are limited to max_parallel_tasks."""
+        config = PrompterConfig(temp_config_file)
+        coordinator = ParallelTaskCoordinator(
+            config=config,
+            runner=MagicMock(spec=TaskRunner),
+            state_manager=StateManager(temp_state_file),
+        )
+
+        assert coordinator._thread_limiter.total_tokens == config.max_parallel_tasks
+
+    def test_coordinators_share_config_graph(self, temp_config_file, temp_state_file):
+        """Test that coordinators built from one config reuse its task graph."""
+        config = PrompterConfig(temp_config_file)
+        coordinators = [
+            ParallelTaskCoordinator(
+                config=config,
+                runner=MagicMock(spec=TaskRunner),
+                state_manager=StateManager(temp_state_file),
+            )
+            for _ in range(2)
+        ]
+
+        assert coordinators[0].graph is coordinators[1].graph
+
+    def test_repeated_progress_updates_suppressed(
+        self, temp_config_file, temp_state_file
+    ):
+        """Test that identical consecutive progress updates reach the display once."""
+        display = MagicMock()
+        coordinator = ParallelTaskCoordinator(
+            config=PrompterConfig(temp_config_file),
+            runner=MagicMock(spec=TaskRunner),
+            state_manager=StateManager(temp_state_file),
+            progress_display=display,
+        )
+
+        coordinator._notify("task1", TaskStatus.RUNNING, progress=0.5, message="x")
+        coordinator._notify("task1", TaskStatus.RUNNING, progress=0.5, message="x")
+        coordinator._notify("task2", TaskStatus.RUNNING, progress=0.5, message="x")
+        coordinator._notify("task1", TaskStatus.COMPLETED, progress=1.0)
+
+        assert display.update_task.call_count == 3
+
     def test_resource_pool_constraints(self):
         """Test that resource pool enforces parallel task limits."""
         from prompter.parallel_coordinator import ResourcePool
@@ -274,14 +607,32 @@ depends_on = ["task2", "task3"]
         pool.allocate(task2)
 
         # Cannot schedule third task (limit reached)
+        assert pool.running_count == 2
         assert not pool.can_schedule(task3)
 
         # Release one task
         pool.release(task1, success=True)
+        assert pool.running_count == 1
 
         # Now can schedule task3
         assert pool.can_schedule(task3)
 
+    def test_resource_pool_saturation(self):
+        """Test that a full pool or a running exclusive task blocks scheduling."""
+        from prompter.parallel_coordinator import ResourcePool
+
+        pool = ResourcePool(max_parallel_tasks=2)
+        assert not pool.is_saturated()
+
+        pool.allocate(create_task_config(name="task1"))
+        assert not pool.is_saturated()
+        pool.allocate(create_task_config(name="task2"))
+        assert pool.is_saturated()
+
+        pool = ResourcePool(max_parallel_tasks=2)
+        pool.allocate(create_task_config(name="exclusive", exclusive=True))
+        assert pool.is_saturated()
+
     def test_exclusive_task_handling(self):
         """Test that exclusive tasks run alone."""
         from prompter.parallel_coordinator import ResourcePool
@@ -16,8 +16,8 @@ from prompter.state import StateManager
 class TestParallelIntegration:
     """Integration tests for parallel execution with real-world scenarios."""
 
-    @pytest.fixture
-    def complex_diamond_config(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def complex_diamond_config(self, tmp_path_factory):
         """Create a complex diamond dependency pattern configuration."""
         config_content = """
 [settings]
@@ -78,12 +78,12 @@ prompt = "Deploy to production"
 verify_command = "echo 'deployed'"
 depends_on = ["integration_tests"]
 """
-        config_file = tmp_path / "diamond.toml"
+        config_file = tmp_path_factory.mktemp("configs") / "diamond.toml"
         config_file.write_text(config_content)
         return config_file
 
-    @pytest.fixture
-    def wide_parallel_config(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def wide_parallel_config(self, tmp_path_factory):
         """Create a configuration with many parallel tasks."""
         config_content = """
 [settings]
@@ -128,12 +128,12 @@ prompt = "Create analysis report"
 verify_command = "echo 'report created'"
 depends_on = ["analyze_module_1", "analyze_module_2", "analyze_module_3", "analyze_module_4", "analyze_module_5"]
 """
-        config_file = tmp_path / "wide.toml"
+        config_file = tmp_path_factory.mktemp("configs") / "wide.toml"
         config_file.write_text(config_content)
         return config_file
 
-    @pytest.fixture
-    def failure_recovery_config(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def failure_recovery_config(self, tmp_path_factory):
         """Create a configuration to test failure handling in parallel execution."""
         config_content = """
 [settings]
@@ -175,12 +175,12 @@ prompt = "Complete path B"
 verify_command = "echo 'path B completed'"
 depends_on = ["path_b_process"]
 """
-        config_file = tmp_path / "failure.toml"
+        config_file = tmp_path_factory.mktemp("configs") / "failure.toml"
         config_file.write_text(config_content)
         return config_file
 
-    @pytest.fixture
-    def circular_dependency_config(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def circular_dependency_config(self, tmp_path_factory):
         """Create a configuration with circular dependencies (should fail validation)."""
         config_content = """
 [settings]
@@ -204,10 +204,17 @@ prompt = "Task C"
 verify_command = "echo 'C'"
 depends_on = ["task_b"]
 """
-        config_file = tmp_path / "circular.toml"
+        config_file = tmp_path_factory.mktemp("configs") / "circular.toml"
         config_file.write_text(config_content)
         return config_file
 
+    @pytest.fixture(scope="class")
+    def wide_parallel_loaded(self, wide_parallel_config):
+        """Load and validate the wide parallel configuration once per class."""
+        config = PrompterConfig(wide_parallel_config)
+        assert config.validate() == []
+        return config
+
     @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_complex_diamond_execution_order(
@@ -260,12 +267,12 @@ depends_on = ["task_b"]
 
     @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_parallel_execution_performance(self, wide_parallel_config, tmp_path):
+    async def test_parallel_execution_performance(self, wide_parallel_loaded, tmp_path):
         """Test that parallel execution is faster than sequential."""
         state_file = tmp_path / "state.json"
 
         # Create config and state manager
-        config = PrompterConfig(wide_parallel_config)
+        config = wide_parallel_loaded
         state_manager = StateManager(state_file)
 
         # Mock runner that simulates work
@@ -376,13 +383,13 @@ depends_on = ["task_b"]
     @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_state_persistence_across_parallel_runs(
-        self, wide_parallel_config, tmp_path
+        self, wide_parallel_loaded, tmp_path
     ):
         """Test that state is correctly persisted during parallel execution."""
         state_file = tmp_path / "state.json"
 
         # First run - execute first 3 tasks then stop
-        config = PrompterConfig(wide_parallel_config)
+        config = wide_parallel_loaded
         state_manager = StateManager(state_file)
 
         executed_count = 0
@@ -1,15 +1,19 @@
 """Tests for progress display functionality."""
 
+import io
 import os
+import sys
 import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+from rich.console import Console
 
 from prompter.parallel_coordinator import TaskStatus
 from prompter.progress_display import (
     ProgressDisplay,
     ProgressDisplayMode,
+    SynchronizedLive,
     TaskProgress,
 )
 
@@ -50,6 +54,20 @@ class TestTaskProgress:
         task.end_time = task.start_time + 3665  # 1 hour 1 minute 5 seconds
         assert task.duration_str == "61:05"
 
+    def test_duration_str_reused_within_second(self):
+        """Test that the duration string is only re-formatted when a second ticks."""
+        task = TaskProgress(name="test_task", status=TaskStatus.RUNNING)
+        task.start_time = 100
+
+        task.end_time = 165.2
+        first = task.duration_str
+        task.end_time = 165.8
+        assert task.duration_str is first
+
+        task.end_time = 166.1
+        assert task.duration_str == "01:06"
+        assert not hasattr(task, "__dict__")
+
 
 class TestProgressDisplay:
     """Test ProgressDisplay class."""
@@ -101,6 +119,40 @@ class TestProgressDisplay:
 
         assert display.mode == ProgressDisplayMode.SIMPLE
 
+    @patch.dict(os.environ, {"PROMPTER_PROGRESS_REFRESH_HZ": "2"})
+    def test_refresh_rate_from_environment(self):
+        """Test overriding the rich refresh rate via environment variable."""
+        display = ProgressDisplay(
+            total_tasks=5, max_parallel=2, mode=ProgressDisplayMode.NONE
+        )
+
+        assert display.refresh_per_second == 2.0
+
+    @pytest.mark.parametrize(
+        ("requested", "expected"), [(0.1, 1.0), (4, 4.0), (1000, 30.0)]
+    )
+    def test_refresh_rate_bounds(self, requested, expected):
+        """Test that the rich refresh rate is clamped to a sane range."""
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("PROMPTER_PROGRESS_REFRESH_HZ", None)
+            display = ProgressDisplay(
+                total_tasks=5,
+                max_parallel=2,
+                mode=ProgressDisplayMode.NONE,
+                refresh_per_second=requested,
+            )
+
+        assert display.refresh_per_second == expected
+
+    @patch.dict(os.environ, {"PROMPTER_PROGRESS_REFRESH_HZ": "fast"})
+    def test_invalid_refresh_rate_ignored(self):
+        """Test that an unparsable refresh rate falls back to the requested one."""
+        display = ProgressDisplay(
+            total_tasks=5, max_parallel=2, mode=ProgressDisplayMode.NONE
+        )
+
+        assert display.refresh_per_second == 4.0
+
     @patch.dict(os.environ, {"TERM": "dumb"})
     def test_dumb_terminal_detection(self):
         """Test that dumb terminals get simple mode."""
@@ -144,6 +196,117 @@ class TestProgressDisplay:
         assert task.progress == 1.0
         assert task.end_time is not None
 
+    def test_status_bookkeeping(self):
+        """Test that status counts and render lists follow task transitions."""
+        display = ProgressDisplay(
+            total_tasks=8, max_parallel=8, mode=ProgressDisplayMode.NONE
+        )
+
+        for i in range(8):
+            display.update_task(f"task{i}", TaskStatus.RUNNING, progress=0.5)
+        assert display._status_counts[TaskStatus.RUNNING] == 8
+        assert list(display._running_tasks) == [f"task{i}" for i in range(8)]
+
+        for i in range(7):
+            display.update_task(f"task{i}", TaskStatus.COMPLETED, progress=1.0)
+        display.update_task("task6", TaskStatus.COMPLETED, progress=1.0)
+
+        assert display._status_counts[TaskStatus.RUNNING] == 1
+        assert display._status_counts[TaskStatus.COMPLETED] == 7
+        assert list(display._running_tasks) == ["task7"]
+        assert [t.name for t in display._recent_done] == [
+            f"task{i}" for i in range(2, 7)
+        ]
+
+        assert display._failed_tasks == {}
+        display.update_task("task7", TaskStatus.FAILED, error="boom")
+        assert list(display._failed_tasks) == ["task7"]
+
+    def test_render_snapshot(self):
+        """Test that frames render from a snapshot rebuilt only after updates."""
+        display = ProgressDisplay(
+            total_tasks=3, max_parallel=2, mode=ProgressDisplayMode.NONE
+        )
+        display.update_task("task1", TaskStatus.RUNNING, progress=0.5)
+        display.update_task("task2", TaskStatus.PENDING, dependencies=["task1"])
+        display.update_task("task3", TaskStatus.FAILED, error="boom")
+
+        snapshot = display._snapshot()
+        assert display._snapshot() is snapshot
+        assert [t.name for t in snapshot.running] == ["task1"]
+        assert [t.name for t in snapshot.waiting] == ["task2"]
+        assert [t.name for t in snapshot.recent_done] == ["task3"]
+        assert snapshot.counts[TaskStatus.FAILED] == 1
+
+        # The snapshot holds copies, so later updates do not leak into it
+        display.update_task("task1", TaskStatus.RUNNING, progress=0.75)
+        assert snapshot.running[0].status is TaskStatus.RUNNING
+        assert snapshot.running[0].progress_bar.endswith("50%")
+
+        display.update_task("task1", TaskStatus.COMPLETED, progress=1.0)
+        assert snapshot.running[0].progress_bar.endswith("50%")
+        updated = display._snapshot()
+        assert updated is not snapshot
+        assert updated.running == ()
+        assert [t.name for t in updated.recent_done] == ["task1", "task3"]
+
+        # The layout renders from the snapshot without error
+        console = Console(file=io.StringIO(), width=120)
+        layout = display._create_layout()
+        console.print(layout)
+        assert "task2" in console.file.getvalue()
+
+        # Later frames refill the same layout tree
+        assert display._create_layout() is layout
+
+    def test_waiting_panel_reused_until_waiting_set_changes(self):
+        """Test that the waiting panel is rebuilt only when the waiting set changes."""
+        display = ProgressDisplay(
+            total_tasks=3, max_parallel=1, mode=ProgressDisplayMode.NONE
+        )
+        display.update_task("task1", TaskStatus.RUNNING)
+        display.update_task("task2", TaskStatus.PENDING, dependencies=["task1"])
+
+        panel = display._create_waiting_tasks(display._snapshot())
+
+        # Progress on a running task leaves the waiting set alone
+        display.update_task("task1", TaskStatus.RUNNING, progress=0.5)
+        assert display._create_waiting_tasks(display._snapshot()) is panel
+
+        # PENDING -> READY stays within the waiting set
+        display.update_task("task2", TaskStatus.READY)
+        assert display._create_waiting_tasks(display._snapshot()) is panel
+
+        display.update_task("task2", TaskStatus.RUNNING)
+        assert display._create_waiting_tasks(display._snapshot()) is not panel
+
+    def test_progress_bar_cached_until_progress_changes(self):
+        """Test that a task's progress bar is only re-rendered when it changes."""
+        display = ProgressDisplay(
+            total_tasks=1, max_parallel=1, mode=ProgressDisplayMode.NONE
+        )
+
+        display.update_task("task1", TaskStatus.RUNNING, progress=0.5)
+        task = display.task_progress["task1"]
+        bar = task.progress_bar
+        assert bar.endswith("50%")
+
+        display.update_task("task1", TaskStatus.RUNNING, progress=0.5)
+        assert task.progress_bar is bar
+
+        display.update_task("task1", TaskStatus.RUNNING, progress=0.75)
+        assert task.progress_bar.endswith("75%")
+
+    def test_progress_bar_glyphs_clamped(self):
+        """Test that bar glyphs stay fixed width for out-of-range progress."""
+        task = TaskProgress(name="task1", status=TaskStatus.RUNNING)
+
+        task.set_progress(0.5, None)
+        assert task.progress_bar == f"[{'█' * 10}{'░' * 10}] 50%"
+
+        task.set_progress(1.5, None)
+        assert task.progress_bar == f"[{'█' * 20}] 150%"
+
     def test_task_update_with_error(self):
         """Test updating task with error."""
         display = ProgressDisplay(
@@ -193,7 +356,7 @@ class TestProgressDisplay:
                     mock_start.assert_called_once()
                 mock_stop.assert_called_once()
 
-    @patch("builtins.print")
+    @patch.object(ProgressDisplay, "_write_simple")
     def test_simple_mode_output(self, mock_print):
         """Test simple mode output formatting."""
         display = ProgressDisplay(
@@ -242,7 +405,7 @@ class TestProgressDisplay:
         assert "Failed" in call_args
         assert "Test error message" in call_args
 
-    @patch("builtins.print")
+    @patch.object(ProgressDisplay, "_write_simple")
     def test_simple_mode_summary(self, mock_print):
         """Test simple mode final summary."""
         display = ProgressDisplay(
@@ -273,6 +436,128 @@ class TestProgressDisplay:
         assert "Failed tasks:" in printed_output
         assert "task3: Connection failed" in printed_output
 
+    def test_simple_mode_batches_writes(self, capsys):
+        """Test that simple-mode lines are queued and written together."""
+        display = ProgressDisplay(
+            total_tasks=2,
+            max_parallel=2,
+            mode=ProgressDisplayMode.SIMPLE,
+            refresh_per_second=1,
+        )
+
+        with patch("sys.stdout.write", wraps=sys.stdout.write) as mock_write:
+            display.update_task("task1", TaskStatus.READY)
+            display.update_task("task2", TaskStatus.READY)
+            assert mock_write.call_count == 0
+
+            display.flush()
+            assert mock_write.call_count == 1
+
+        output = capsys.readouterr().out
+        assert "task1: Ready" in output
+        assert "task2: Ready" in output
+
+    def test_simple_mode_flushes_finished_tasks_immediately(self, capsys):
+        """Test that completed and failed lines are not left in the buffer."""
+        display = ProgressDisplay(
+            total_tasks=2,
+            max_parallel=2,
+            mode=ProgressDisplayMode.SIMPLE,
+            refresh_per_second=0.1,
+        )
+
+        display.update_task("task1", TaskStatus.RUNNING)
+        display.update_task("task1", TaskStatus.COMPLETED)
+        display.update_task("task2", TaskStatus.FAILED, error="boom")
+
+        assert not display._pending_output
+        output = capsys.readouterr().out
+        assert output.index("task1: Starting...") < output.index("task1: Completed")
+        assert "task2: Failed" in output
+        display.stop()
+
+    def test_simple_mode_stop_always_stops_flusher(self):
+        """Test that the flusher thread is stopped even if the summary fails."""
+        display = ProgressDisplay(
+            total_tasks=1, max_parallel=1, mode=ProgressDisplayMode.SIMPLE
+        )
+        display.update_task("task1", TaskStatus.READY)
+        flusher = display._flusher
+
+        with (
+            patch.object(
+                display, "_print_simple_summary", side_effect=RuntimeError("boom")
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            display.stop()
+
+        assert not flusher.is_alive()
+        assert not display._pending_output
+
+    def test_simple_mode_timestamp(self):
+        """Test that simple-mode lines carry the UTC wall-clock time."""
+        display = ProgressDisplay(
+            total_tasks=1, max_parallel=1, mode=ProgressDisplayMode.SIMPLE
+        )
+
+        with (
+            patch("prompter.progress_display.time.time", return_value=3723.9),
+            patch.object(display, "_write_simple") as mock_write,
+        ):
+            display.update_task("task1", TaskStatus.READY)
+
+        assert mock_write.call_args.args[0].startswith("01:02:03 [~]")
+
+    def test_simple_mode_flushes_after_interval(self, capsys):
+        """Test that queued simple-mode output is written without an explicit flush."""
+        display = ProgressDisplay(
+            total_tasks=1,
+            max_parallel=1,
+            mode=ProgressDisplayMode.SIMPLE,
+            refresh_per_second=30,
+        )
+
+        display.update_task("task1", TaskStatus.READY)
+        flusher = display._flusher
+        deadline = time.monotonic() + 2
+        while display._pending_output and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "task1: Ready" in capsys.readouterr().out
+
+        # Later flush windows reuse the same thread
+        display.update_task("task1", TaskStatus.RUNNING)
+        deadline = time.monotonic() + 2
+        while display._pending_output and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "task1: Starting..." in capsys.readouterr().out
+        assert display._flusher is flusher
+
+        display.stop()
+        assert not flusher.is_alive()
+
+    def test_simple_mode_writes_terminal_fd_directly(self):
+        """Test that terminal output is encoded once and written to the descriptor."""
+        display = ProgressDisplay(
+            total_tasks=1, max_parallel=1, mode=ProgressDisplayMode.SIMPLE
+        )
+        read_fd, write_fd = os.pipe()
+        terminal = MagicMock(encoding="utf-8")
+        terminal.isatty.return_value = True
+        terminal.fileno.return_value = write_fd
+
+        try:
+            with patch("sys.stdout", terminal):
+                display.update_task("task1", TaskStatus.READY)
+                display.flush()
+            written = os.read(read_fd, 4096).decode()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        assert "task1: Ready" in written
+        terminal.write.assert_not_called()
+
     @pytest.mark.slow
     def test_thread_safety(self):
         """Test thread-safe task updates."""
@@ -325,7 +610,7 @@ class TestProgressDisplay:
                 )
                 assert display.mode == ProgressDisplayMode.SIMPLE
 
-    @patch("prompter.progress_display.Live")
+    @patch("prompter.progress_display.SynchronizedLive")
     @patch("sys.stdout.isatty", return_value=True)
     @patch.dict(os.environ, {"TERM": "xterm-256color"}, clear=True)
     def test_rich_mode_lifecycle(self, mock_isatty, mock_live_class):
@@ -337,12 +622,66 @@ class TestProgressDisplay:
             total_tasks=5, max_parallel=2, mode=ProgressDisplayMode.RICH
         )
 
-        # Start should create and start Live
+        # Start should create and start Live on the alternate screen
         display.start()
         mock_live_class.assert_called_once()
+        assert mock_live_class.call_args.kwargs["screen"] is True
         mock_live.start.assert_called_once()
 
-        # Stop should stop Live
-        display.stop()
+        # Stop should stop Live and leave the final frame in scrollback
+        with patch.object(display.console, "print") as mock_print:
+            display.stop()
         mock_live.stop.assert_called_once()
         assert display.live is None
+        mock_print.assert_called_once()
+        assert mock_print.call_args.kwargs["height"] == 23
+
+    def test_synchronized_live_wraps_frames(self):
+        """Test that each rich frame is bracketed by synchronized-update markers."""
+        output = io.StringIO()
+        console = Console(file=output, force_terminal=True, width=80)
+        live = SynchronizedLive(
+            "frame", console=console, auto_refresh=False, transient=False
+        )
+
+        live.start()
+        live.refresh()
+        live.stop()
+
+        text = output.getvalue()
+        assert text.count("\x1b[?2026h") == text.count("\x1b[?2026l") >= 1
+        assert text.index("\x1b[?2026h") < text.index("frame")
+
+    def test_synchronized_live_plain_file(self):
+        """Test that no escape sequences are written when not on a terminal."""
+        output = io.StringIO()
+        console = Console(file=output, force_terminal=False)
+        live = SynchronizedLive("frame", console=console, auto_refresh=False)
+
+        live.start()
+        live.stop()
+
+        assert "2026" not in output.getvalue()
+
+    @patch("prompter.progress_display.SynchronizedLive")
+    @patch("sys.stdout.isatty", return_value=True)
+    @patch.dict(os.environ, {"TERM": "xterm-256color"}, clear=True)
+    def test_rich_mode_renders_on_refresh(self, mock_isatty, mock_live_class):
+        """Test that rich mode renders on Live's schedule, not per update."""
+        mock_live = MagicMock()
+        mock_live_class.return_value = mock_live
+
+        display = ProgressDisplay(
+            total_tasks=5,
+            max_parallel=2,
+            mode=ProgressDisplayMode.RICH,
+            refresh_per_second=2,
+        )
+        display.start()
+
+        kwargs = mock_live_class.call_args.kwargs
+        assert kwargs["get_renderable"] == display._create_layout
+        assert kwargs["refresh_per_second"] == 2
+
+        display.update_task("task1", TaskStatus.RUNNING, progress=0.5)
+        mock_live.update.assert_not_called()
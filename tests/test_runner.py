@@ -58,6 +58,14 @@ class TestTaskResult:
         assert result.session_id == session_id
         assert result.timestamp > 0
 
+    def test_task_result_error_short(self):
+        """Test that the display summary of an error is truncated once."""
+        result = TaskResult(task_name="test_task", success=False, error="x" * 80)
+
+        assert result.error_short == "x" * 50
+        assert result.error_short is result.error_short
+        assert TaskResult(task_name="ok", success=True).error_short == ""
+
 
 class TestTaskRunner:
     """Tests for TaskRunner class."""
@@ -84,6 +92,7 @@ class TestTaskRunner:
         """Create a mock configuration."""
         config = Mock(spec=PrompterConfig)
         config.check_interval = 0  # No delay for tests
+        config.poll_verification = False
         config.working_directory = None
         return config
 
@@ -244,6 +253,54 @@ class TestTaskRunner:
         assert result.success is False
         assert result.attempts == 1  # Should stop after first failure
 
+    @patch("prompter.runner.subprocess.run")
+    def test_verification_output_keeps_tail(
+        self, mock_subprocess, mock_config, sample_task
+    ):
+        """Test that oversized verification output is truncated to its tail."""
+        mock_subprocess.return_value = Mock(
+            returncode=1, stdout="x" * 20_000 + "FAILED test_foo", stderr=""
+        )
+
+        runner = TaskRunner(mock_config)
+        success, output = runner._verify_task(sample_task)
+
+        assert success is False
+        assert "FAILED test_foo" in output
+        assert "earlier characters truncated" in output
+        assert len(output) < 11_000
+
+    @patch("prompter.runner.time.sleep")
+    def test_check_interval_waits_before_verification(
+        self, mock_sleep, mock_config, sample_task
+    ):
+        """Test that check_interval is a single pause before verifying."""
+        mock_config.check_interval = 10
+        runner = TaskRunner(mock_config)
+
+        with patch.object(runner, "_verify_task", return_value=(False, "no")) as verify:
+            assert runner._verify_after_check_interval(sample_task) == (False, "no")
+
+        mock_sleep.assert_called_once_with(10)
+        verify.assert_called_once_with(sample_task)
+
+    @patch("prompter.runner.time.sleep")
+    def test_poll_verification_returns_on_first_success(
+        self, mock_sleep, mock_config, sample_task
+    ):
+        """Test that poll_verification re-checks instead of waiting up front."""
+        mock_config.check_interval = 10
+        mock_config.poll_verification = True
+        runner = TaskRunner(mock_config)
+
+        with patch.object(
+            runner, "_verify_task", side_effect=[(False, "no"), (True, "ok")]
+        ) as verify:
+            assert runner._verify_after_check_interval(sample_task) == (True, "ok")
+
+        assert verify.call_count == 2
+        mock_sleep.assert_called_once_with(1)
+
     @patch("prompter.runner.query")
     def test_sdk_timeout_legacy(self, mock_query, mock_config):
         """Test task execution with timeout (legacy TimeoutError)."""
@@ -316,3 +316,48 @@ verify_command = "false | echo 'should fail'"
         # The command should fail because 'false' returns 1
         # Note: the pipe might mask the error depending on shell settings
         assert "Exit code:" in output
+
+    def test_list_command_without_shell(self, temp_dir):
+        """Test that a verify_command list is passed through as argv."""
+        config_content = """[[tasks]]
+name = "argv"
+prompt = "Test task"
+verify_command = ["grep", "-q", "a|b", "out.txt"]
+"""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(config_content)
+
+        config = PrompterConfig(config_file)
+        runner = TaskRunner(config)
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+            task = config.tasks[0]
+            runner._verify_task(task)
+
+            assert not mock_run.call_args.kwargs.get("shell")
+            assert mock_run.call_args.args[0] == ["grep", "-q", "a|b", "out.txt"]
+
+    def test_verify_shell_forces_shell(self, temp_dir):
+        """Test that verify_shell runs even simple commands through the shell."""
+        config_content = """[[tasks]]
+name = "forced"
+prompt = "Test task"
+verify_command = "echo hello"
+verify_shell = true
+"""
+        config_file = temp_dir / "config.toml"
+        config_file.write_text(config_content)
+
+        config = PrompterConfig(config_file)
+        runner = TaskRunner(config)
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="hello", stderr="")
+
+            task = config.tasks[0]
+            runner._verify_task(task)
+
+            assert mock_run.call_args.kwargs.get("shell") is True
+            assert mock_run.call_args.args[0] == "echo hello"
@@ -92,6 +92,18 @@ class TestTaskState:
 
         assert state.to_dict() == expected
 
+    def test_task_state_to_dict_cached_until_changed(self):
+        """Test to_dict reuses its result until an attribute changes."""
+        state = TaskState(name="test_task")
+
+        first = state.to_dict()
+        assert state.to_dict() is first
+
+        state.status = "completed"
+        updated = state.to_dict()
+        assert updated is not first
+        assert updated["status"] == "completed"
+
     def test_task_state_from_dict(self):
         """Test TaskState deserialization from dictionary."""
         now = time.time()
@@ -218,6 +230,15 @@ class TestStateManager:
         assert manager.task_states == {}
         assert manager.results_history == []
 
+    @patch("builtins.open", side_effect=OSError("Permission denied"))
+    @patch("prompter.state.Path.exists", return_value=True)
+    def test_load_state_with_io_error(self, mock_exists, mock_file, temp_dir):
+        """Test that an unreadable state file starts with empty state."""
+        manager = StateManager(temp_dir / "unreadable_state.json")
+
+        assert manager.task_states == {}
+        assert manager.results_history == []
+
     @patch("pathlib.Path.replace")
     @patch("builtins.open", new_callable=mock_open)
     def test_save_state(self, mock_file, mock_replace, temp_dir):
@@ -239,6 +260,7 @@ class TestStateManager:
 
         # Get the written data from the write call
         write_calls = mock_file.return_value.__enter__.return_value.write.call_args_list
+        assert len(write_calls) == 1
         written_data = "".join(call[0][0] for call in write_calls)
         data = json.loads(written_data)
 
@@ -247,6 +269,20 @@ class TestStateManager:
         assert len(data["task_states"]) == 1
         assert data["task_states"][0]["name"] == "test_task"
 
+    def test_save_state_durable(self, temp_dir):
+        """Test that durable saves fsync the temp file before replacing."""
+        state_file = temp_dir / "durable_state.json"
+
+        with patch("prompter.state.os.fsync") as mock_fsync:
+            StateManager(state_file).save_state()
+            mock_fsync.assert_not_called()
+
+            StateManager(state_file, durable=True).save_state()
+            mock_fsync.assert_called_once()
+
+        assert json.loads(state_file.read_text())["task_states"] == []
+        assert not state_file.with_suffix(".tmp").exists()
+
     @patch("builtins.open", side_effect=OSError("Permission denied"))
     def test_save_state_with_io_error(self, mock_file, temp_dir):
         """Test saving state when IO error occurs."""
@@ -345,6 +381,66 @@ class TestStateManager:
         assert state.status == "running"
         mock_save.assert_called_once()
 
+    @patch.object(StateManager, "save_state")
+    def test_updates_without_save(self, mock_save, temp_dir):
+        """Test that save=False records updates without writing the state file."""
+        manager = StateManager(temp_dir / "batched_state.json")
+
+        manager.mark_task_running("batched_task", save=False)
+        manager.update_task_state(
+            TaskResult(task_name="batched_task", success=True, attempts=1),
+            save=False,
+        )
+
+        assert manager.task_states["batched_task"].status == "completed"
+        mock_save.assert_not_called()
+
+    def test_batch_coalesces_writes(self, temp_dir):
+        """Test that updates inside a batch are written together on exit."""
+        manager = StateManager(
+            temp_dir / "coalesced_state.json", flush_interval=60, max_pending=16
+        )
+        manager.mark_task_running("task")
+
+        with (
+            patch.object(manager, "save_state", wraps=manager.save_state) as save,
+            manager,
+        ):
+            for attempt in range(1, 6):
+                manager.update_task_state(
+                    TaskResult(task_name="task", success=False, attempts=attempt)
+                )
+            # Only the running -> failed transition was written straight away
+            save.assert_called_once()
+
+        assert save.call_count == 2
+        data = json.loads(manager.state_file.read_text())
+        assert len(data["results_history"]) == 5
+
+    def test_batch_writes_status_transitions_immediately(self, temp_dir):
+        """Test that a batch never defers writing a status change."""
+        manager = StateManager(
+            temp_dir / "transition_state.json", flush_interval=60, max_pending=16
+        )
+
+        with manager:
+            manager.mark_task_running("long_task")
+            data = json.loads(manager.state_file.read_text())
+            assert data["task_states"][0]["status"] == "running"
+
+    @patch.object(StateManager, "save_state")
+    def test_batch_writes_when_too_many_pending(self, mock_save, temp_dir):
+        """Test that a batch still writes once max_pending saves pile up."""
+        manager = StateManager(
+            temp_dir / "pending_state.json", flush_interval=60, max_pending=3
+        )
+
+        with manager:
+            for _ in range(4):
+                manager.mark_task_running("task")
+            # The first call is a transition; the third repeat hits max_pending
+            assert mock_save.call_count == 2
+
     @patch.object(StateManager, "save_state")
     def test_update_task_state_with_claude_session_id(self, mock_save, temp_dir):
         """Test updating task state with Claude session_id."""
@@ -419,6 +515,33 @@ class TestStateManager:
         assert manager.results_history == []
         assert not state_file.exists()  # File should be deleted
 
+    def test_results_history_bounded(self, temp_dir):
+        """Test that results beyond history_limit move to the history log."""
+        state_file = temp_dir / "bounded_state.json"
+        manager = StateManager(state_file, history_limit=3)
+
+        for i in range(5):
+            manager.update_task_state(
+                TaskResult(task_name=f"task{i}", success=True, attempts=1)
+            )
+
+        assert [r["task_name"] for r in manager.results_history] == [
+            "task2",
+            "task3",
+            "task4",
+        ]
+        data = json.loads(state_file.read_text())
+        assert len(data["results_history"]) == 3
+
+        log_lines = manager.history_log_file.read_text().splitlines()
+        assert [json.loads(line)["task_name"] for line in log_lines] == [
+            "task0",
+            "task1",
+        ]
+
+        manager.clear_state()
+        assert not manager.history_log_file.exists()
+
     def test_get_failed_tasks(self, temp_dir):
         """Test getting list of failed tasks."""
         state_file = temp_dir / "failed_tasks_state.json"
@@ -455,6 +578,26 @@ class TestStateManager:
         assert "completed_task1" in completed_tasks
         assert "completed_task2" in completed_tasks
 
+    @patch("prompter.state.STATE_STREAM_THRESHOLD", 2)
+    def test_save_state_streams_large_history(self, temp_dir):
+        """Test that large histories are written incrementally and stay valid JSON."""
+        state_file = temp_dir / "streamed_state.json"
+        manager = StateManager(state_file)
+
+        with manager:
+            for i in range(4):
+                manager.update_task_state(
+                    TaskResult(task_name=f"task{i}", success=True, attempts=1)
+                )
+
+        data = json.loads(state_file.read_text())
+        assert [r["task_name"] for r in data["results_history"]] == [
+            "task0",
+            "task1",
+            "task2",
+            "task3",
+        ]
+
     def test_results_history_truncation(self, temp_dir):
         """Test that output and error in results history are truncated."""
         state_file = temp_dir / "truncation_state.json"